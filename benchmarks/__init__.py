@@ -0,0 +1,6 @@
+"""
+Benchmarks replaying the recorded cassettes of the integration tests offline through the full stack
+(``Moco`` -> requestor -> objector).
+
+Run them with ``python -m benchmarks`` (or ``make bench``), see ``python -m benchmarks --help`` for the options.
+"""
@@ -0,0 +1,38 @@
+"""
+Replays one recorded interaction per endpoint through the full stack (session, requestor, objector)
+"""
+from moco_wrapper.util.endpoint import EndpointManager
+
+from .harness import Case
+from .replay import CassetteAdapter, replay_moco
+
+
+def _call(moco, endpoint, ep_params, interaction):
+    def function():
+        return moco.request_e(endpoint, ep_params=ep_params, params=interaction.query or None, data=interaction.data)
+
+    return function
+
+
+def cases(interactions, options):
+    """
+    Yields a benchmark for every endpoint that has a recorded interaction
+
+    :param interactions: Recorded interactions (see :func:`benchmarks.replay.load_cassettes`)
+    :param options: Command line options
+    """
+    endpoint_manager = EndpointManager()
+    seen = set()
+
+    for interaction in interactions:
+        endpoint, ep_params = endpoint_manager.resolve(interaction.method, interaction.path)
+        if endpoint is None or endpoint.slug in seen:
+            continue
+
+        seen.add(endpoint.slug)
+
+        moco = replay_moco(CassetteAdapter([interaction]))
+        body = interaction.json
+        items = len(body) if isinstance(body, list) and body else 1
+
+        yield Case("endpoint:{}".format(endpoint.slug), _call(moco, endpoint, ep_params, interaction), items=items)
@@ -0,0 +1,85 @@
+"""
+Replays recorded list responses scaled to larger pages, once for every way of consuming them
+"""
+import json
+
+from moco_wrapper.util.endpoint import EndpointManager
+from moco_wrapper.util.objector import ColumnarObjector
+
+from .harness import Case
+from .replay import CassetteAdapter, replay_moco, scale_list
+
+
+LIST_SLUGS = ("activity_getlist", "project_assigned", "company_getlist", "contact_getlist", "deal_getlist",
+              "user_getlist")
+"""
+List endpoints that are benchmarked by default (the high volume listings)
+"""
+
+MODES = ("objects", "columnar", "raw", "stream")
+"""
+Ways the list is consumed: objector models, columns (:class:`moco_wrapper.util.objector.ColumnarObjector`), the
+undecoded body (``raw=True``) and items decoded while they are read (``stream=True``)
+"""
+
+
+def _call(moco, endpoint, ep_params, mode):
+    if mode == "raw":
+        def function():
+            return moco.request_e(endpoint, ep_params=ep_params, raw=True).data
+    elif mode == "stream":
+        def function():
+            return list(moco.request_e(endpoint, ep_params=ep_params, stream=True))
+    else:
+        def function():
+            return moco.request_e(endpoint, ep_params=ep_params).data
+
+    return function
+
+
+def cases(interactions, options):
+    """
+    Yields a benchmark for every listed endpoint, page size and mode
+
+    :param interactions: Recorded interactions (see :func:`benchmarks.replay.load_cassettes`)
+    :param options: Command line options (``sizes`` and ``list_slugs`` are used)
+    """
+    endpoint_manager = EndpointManager()
+    slugs = options.list_slugs if options.list_slugs else LIST_SLUGS
+    recorded = {}
+
+    for interaction in interactions:
+        endpoint, ep_params = endpoint_manager.resolve(interaction.method, interaction.path)
+        if endpoint is None or endpoint.slug not in slugs or endpoint.slug in recorded:
+            continue
+
+        body = interaction.json
+        if isinstance(body, list) and body:
+            recorded[endpoint.slug] = (endpoint, ep_params, interaction, body)
+
+    for slug in slugs:
+        if slug not in recorded:
+            continue
+
+        endpoint, ep_params, interaction, body = recorded[slug]
+        for size in options.sizes:
+            adapter = CassetteAdapter()
+            adapter.add(
+                interaction.method,
+                interaction.path,
+                interaction.status_code,
+                dict(interaction.headers, **{"Content-Type": "application/json; charset=utf-8"}),
+                json.dumps(scale_list(body, size)).encode("utf-8")
+            )
+
+            for mode in MODES:
+                if mode == "columnar":
+                    moco = replay_moco(adapter, objector=ColumnarObjector())
+                else:
+                    moco = replay_moco(adapter)
+
+                yield Case(
+                    "list:{}:{}:{}".format(slug, size, mode),
+                    _call(moco, endpoint, ep_params, mode),
+                    items=size
+                )
@@ -0,0 +1,219 @@
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+
+class Case(object):
+    """
+    Single benchmark
+
+    :param name: Unique name of the benchmark (e.g. ``endpoint:project_get``)
+    :param function: Function running one operation
+    :param items: Number of items one operation handles, used for the item throughput (default ``1``)
+    """
+
+    def __init__(self, name: str, function, items: int = 1):
+        self.name = name
+        self.function = function
+        self.items = items
+
+
+class Result(object):
+    """
+    Measurements of a benchmark
+    """
+
+    def __init__(self, name, items, number, best, mean, peak_bytes, retained_blocks):
+        self.name = name
+        self.items = items
+
+        self.number = number
+        """
+        Number of operations per timed round
+        """
+
+        self.best = best
+        """
+        Fastest time of a single operation (seconds)
+        """
+
+        self.mean = mean
+        """
+        Mean time of a single operation over all rounds (seconds)
+        """
+
+        self.peak_bytes = peak_bytes
+        """
+        Peak of the memory allocated during a single operation (bytes, traced with :mod:`tracemalloc`)
+        """
+
+        self.retained_blocks = retained_blocks
+        """
+        Memory blocks that are still allocated after an operation (:func:`sys.getallocatedblocks`), growing numbers
+        point to a leak
+        """
+
+    @property
+    def ops_per_second(self) -> float:
+        return 1.0 / self.best if self.best > 0 else float("inf")
+
+    @property
+    def items_per_second(self) -> float:
+        return self.items * self.ops_per_second
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "items": self.items,
+            "number": self.number,
+            "best": self.best,
+            "mean": self.mean,
+            "ops_per_second": self.ops_per_second,
+            "items_per_second": self.items_per_second,
+            "peak_bytes": self.peak_bytes,
+            "retained_blocks": self.retained_blocks,
+        }
+
+
+def _autorange(function, min_time):
+    """
+    Returns the number of calls that take at least ``min_time`` seconds (like :meth:`timeit.Timer.autorange`)
+    """
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            function()
+
+        if time.perf_counter() - started >= min_time:
+            return number
+
+        number *= 2
+
+
+def measure(case: Case, repeat: int = 5, min_time: float = 0.05) -> Result:
+    """
+    Runs a benchmark
+
+    :param case: Benchmark
+    :param repeat: Number of timed rounds (default ``5``)
+    :param min_time: Minimum duration of a round in seconds, the number of operations per round is chosen to
+        reach it (default ``0.05``)
+
+    :rtype: :class:`Result`
+    """
+    function = case.function
+    function()  # warm up, e.g. lazily built routes
+
+    number = _autorange(function, min_time)
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(number):
+                function()
+
+            timings.append((time.perf_counter() - started) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    function()
+    gc.collect()
+    retained_blocks = sys.getallocatedblocks() - blocks
+
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        function()
+        peak_bytes = tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=case.name,
+        items=case.items,
+        number=number,
+        best=min(timings),
+        mean=sum(timings) / len(timings),
+        peak_bytes=peak_bytes,
+        retained_blocks=retained_blocks
+    )
+
+
+def format_table(results) -> str:
+    """
+    Formats results as text table
+
+    :param results: List of :class:`Result`
+
+    :rtype: str
+    """
+    header = ("benchmark", "best (us)", "mean (us)", "ops/s", "items/s", "peak (KiB)", "retained")
+    rows = [
+        (
+            x.name,
+            "{:.1f}".format(x.best * 1e6),
+            "{:.1f}".format(x.mean * 1e6),
+            "{:.0f}".format(x.ops_per_second),
+            "{:.0f}".format(x.items_per_second),
+            "{:.1f}".format(x.peak_bytes / 1024.0),
+            str(x.retained_blocks),
+        )
+        for x in results
+    ]
+
+    widths = [max(len(row[i]) for row in [header] + rows) for i in range(len(header))]
+    lines = []
+    for row in [header] + rows:
+        lines.append("  ".join(
+            value.ljust(width) if index == 0 else value.rjust(width)
+            for index, (value, width) in enumerate(zip(row, widths))
+        ))
+
+    lines.insert(1, "-" * len(lines[0]))
+
+    return "\n".join(lines)
+
+
+def save(results, path: str):
+    """
+    Writes results as json (see :func:`compare`)
+    """
+    with open(path, "w") as result_file:
+        json.dump({"python": sys.version.split()[0], "results": [x.to_dict() for x in results]}, result_file,
+                  indent=2)
+
+
+def compare(results, path: str, threshold: float = 0.2) -> list:
+    """
+    Compares results with the results saved in a file
+
+    :param results: List of :class:`Result`
+    :param path: Path of saved results (see :func:`save`)
+    :param threshold: Relative slowdown of the fastest operation that counts as regression (default ``0.2``)
+
+    :returns: List of ``(name, saved best, best, relative change)`` tuples of the regressed benchmarks
+    :rtype: list
+    """
+    with open(path, "r") as result_file:
+        saved = {x["name"]: x for x in json.load(result_file)["results"]}
+
+    regressions = []
+    for result in results:
+        baseline = saved.get(result.name, None)
+        if baseline is None or baseline["best"] <= 0:
+            continue
+
+        change = result.best / baseline["best"] - 1
+        if change > threshold:
+            regressions.append((result.name, baseline["best"], result.best, change))
+
+    return regressions
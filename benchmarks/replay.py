@@ -0,0 +1,209 @@
+import base64
+import glob
+import gzip
+import io
+import json
+import os
+from urllib.parse import urlsplit, parse_qsl
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from moco_wrapper import Moco
+from moco_wrapper.util.requestor import NoRetryRequestor
+
+
+CASSETTE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "integration",
+                            "cassettes")
+"""
+Directory of the recorded betamax cassettes
+"""
+
+API_PREFIX = "/api/v1"
+
+
+class Interaction(object):
+    """
+    Recorded request and response of a cassette
+    """
+
+    def __init__(self, cassette, method, path, query, data, status_code, headers, content):
+        self.cassette = cassette
+        self.method = method
+        self.path = path
+        self.query = query
+        self.data = data
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def json(self):
+        """
+        Decoded json body of the response (``None`` if the body is not json)
+        """
+        try:
+            return json.loads(self.content.decode("utf-8"))
+        except ValueError:
+            return None
+
+    def __repr__(self):
+        return "<Interaction, {} {}, Status Code: {}>".format(self.method, self.path, self.status_code)
+
+
+def _response_content(response):
+    body = response["body"]
+
+    if body.get("base64_string"):
+        content = base64.b64decode(body["base64_string"])
+    else:
+        content = body.get("string", "").encode(body.get("encoding") or "utf-8")
+
+    encoding = response["headers"].get("Content-Encoding", [""])[0]
+    if encoding == "gzip" and content:
+        content = gzip.decompress(content)
+
+    return content
+
+
+def _request_data(request):
+    body = request["body"].get("string", "")
+    if not body:
+        return None
+
+    try:
+        return json.loads(body)
+    except ValueError:
+        return None
+
+
+def load_cassettes(directory: str = CASSETTE_DIR) -> list:
+    """
+    Loads the interactions of all cassettes of a directory
+
+    :param directory: Cassette directory (default :data:`CASSETTE_DIR`)
+
+    :returns: List of :class:`Interaction`
+    :rtype: list
+    """
+    interactions = []
+
+    for filename in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        with open(filename, "r") as cassette_file:
+            cassette = json.load(cassette_file)
+
+        name = os.path.splitext(os.path.basename(filename))[0]
+        for recorded in cassette["http_interactions"]:
+            request, response = recorded["request"], recorded["response"]
+            url = urlsplit(request["uri"])
+
+            headers = {key: values[0] for key, values in response["headers"].items()}
+            # the body is stored decoded
+            headers.pop("Content-Encoding", None)
+            headers.pop("Transfer-Encoding", None)
+
+            interactions.append(Interaction(
+                cassette=name,
+                method=request["method"],
+                path=url.path[len(API_PREFIX):] if url.path.startswith(API_PREFIX) else url.path,
+                query=dict(parse_qsl(url.query)),
+                data=_request_data(request),
+                status_code=response["status"]["code"],
+                headers=headers,
+                content=_response_content(response)
+            ))
+
+    return interactions
+
+
+class CassetteAdapter(BaseAdapter):
+    """
+    Transport adapter for ``requests`` answering requests with recorded responses, matched by method and path
+    (like the integration tests do)
+    """
+
+    def __init__(self, interactions=()):
+        super(CassetteAdapter, self).__init__()
+
+        self.responses = {}
+        for interaction in interactions:
+            self.add(interaction.method, interaction.path, interaction.status_code, interaction.headers,
+                     interaction.content)
+
+    def add(self, method: str, path: str, status_code: int, headers: dict, content: bytes):
+        """
+        Adds (or replaces) the response of a method and path
+
+        :param method: Http method
+        :param path: Path of the request below the api prefix (e.g. ``/projects``)
+        :param status_code: Status code of the response
+        :param headers: Headers of the response
+        :param content: Body of the response
+        """
+        self.responses[(method, path)] = (status_code, headers, content)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        path = urlsplit(request.url).path
+        if path.startswith(API_PREFIX):
+            path = path[len(API_PREFIX):]
+
+        status_code, headers, content = self.responses.get(
+            (request.method, path),
+            (404, {"Content-Type": "application/json"}, b'{"message": "Not recorded"}')
+        )
+
+        response = requests.Response()
+        response.status_code = status_code
+        response.headers = CaseInsensitiveDict(headers)
+        response.raw = io.BytesIO(content)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+
+        return response
+
+    def close(self):
+        pass
+
+
+def replay_moco(adapter: CassetteAdapter, **moco_kwargs) -> Moco:
+    """
+    Creates a moco instance whose requests are answered by the adapter, the requests pass through a real session,
+    requestor and objector
+
+    :param adapter: Adapter with the recorded responses
+    :param moco_kwargs: Additional arguments of the moco instance (e.g. ``objector``)
+
+    :rtype: :class:`moco_wrapper.Moco`
+    """
+    session = requests.Session()
+    session.mount("https://", adapter)
+
+    moco_kwargs.setdefault("requestor", NoRetryRequestor(session=session))
+
+    return Moco(auth={"api_key": "benchmark", "domain": "benchmark"}, **moco_kwargs)
+
+
+def scale_list(items: list, size: int) -> list:
+    """
+    Repeats the items of a recorded list until it has the given size, the ids of the copies are made unique
+
+    :param items: Recorded items (json)
+    :param size: Number of items
+
+    :returns: List of items
+    :rtype: list
+    """
+    if not items:
+        raise ValueError("Can not scale an empty list")
+
+    result = []
+    for index in range(size):
+        item = dict(items[index % len(items)])
+        if "id" in item:
+            item["id"] = index + 1
+
+        result.append(item)
+
+    return result
@@ -0,0 +1,81 @@
+import argparse
+import re
+import sys
+
+from . import bench_endpoints, bench_lists
+from .harness import measure, format_table, save, compare
+from .replay import load_cassettes, CASSETTE_DIR
+
+
+SUITES = {
+    "endpoints": bench_endpoints,
+    "lists": bench_lists,
+}
+
+
+def _sizes(value):
+    return [int(x) for x in value.split(",") if x]
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Replays the recorded cassettes offline through Moco, requestor and objector"
+    )
+    parser.add_argument("-k", "--filter", default=None,
+                        help="only run benchmarks whose name matches this regular expression")
+    parser.add_argument("--suite", choices=sorted(SUITES), action="append",
+                        help="suite to run (default: all suites)")
+    parser.add_argument("--sizes", type=_sizes, default=[100, 1000, 10000],
+                        help="comma separated page sizes of the list benchmarks (default: 100,1000,10000)")
+    parser.add_argument("--list-slugs", type=lambda x: x.split(","), default=None,
+                        help="comma separated list endpoints of the list benchmarks")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed rounds (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="minimum seconds per timed round (default: 0.05)")
+    parser.add_argument("--quick", action="store_true",
+                        help="small pages and short rounds, for checking that the benchmarks run")
+    parser.add_argument("--cassettes", default=CASSETTE_DIR, help="cassette directory")
+    parser.add_argument("--save", metavar="PATH", help="write the results as json")
+    parser.add_argument("--compare", metavar="PATH",
+                        help="compare with saved results, exits with 1 if a benchmark got slower than --threshold")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown that counts as regression (default: 0.2)")
+
+    options = parser.parse_args(args)
+    if options.quick:
+        options.sizes = [100]
+        options.repeat = 1
+        options.min_time = 0.001
+
+    return options
+
+
+def main(args=None):
+    options = parse_args(args)
+    interactions = load_cassettes(options.cassettes)
+    pattern = re.compile(options.filter) if options.filter else None
+
+    results = []
+    for name in (options.suite or sorted(SUITES)):
+        for case in SUITES[name].cases(interactions, options):
+            if pattern is not None and not pattern.search(case.name):
+                continue
+
+            results.append(measure(case, repeat=options.repeat, min_time=options.min_time))
+            print(case.name, file=sys.stderr)
+
+    print(format_table(results))
+
+    if options.save:
+        save(results, options.save)
+
+    if options.compare:
+        regressions = compare(results, options.compare, options.threshold)
+        for name, saved_best, best, change in regressions:
+            print("REGRESSION {}: {:.1f}us -> {:.1f}us (+{:.0%})".format(name, saved_best * 1e6, best * 1e6, change))
+
+        if regressions:
+            sys.exit(1)
+
+    return results
@@ -6,8 +6,25 @@ __author__ = """Sommalia"""
 __email__ = 'sommalia@protonmail.com'
 __version__ = '0.11.2'
 
+import sys
+
 from . import models
 from . import util
 from . import exceptions
 
 from .moco import Moco
+
+
+def __getattr__(name):
+    # asyncio is only imported by clients that use it
+    if name == "AsyncMoco":
+        from .async_moco import AsyncMoco
+        return AsyncMoco
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # module level __getattr__ needs python 3.7, older versions import everything up front
+    if sys.version_info >= (3, 6):
+        AsyncMoco = __getattr__("AsyncMoco")
@@ -0,0 +1,407 @@
+import asyncio
+import collections
+
+from moco_wrapper import util, exceptions
+from moco_wrapper.moco import Moco
+from moco_wrapper.util import response, endpoint
+
+
+class AsyncMoco(Moco):
+    """
+    Moco class for using the moco api from an asyncio event loop.
+
+    It uses the same models and endpoints as :class:`moco_wrapper.Moco`, but every request method returns a
+    coroutine, so all calls (including the ones of the models) have to be awaited.
+
+    :param auth: Dictionary containing authentication information, see :ref:`authentication`
+    :param objector: objector object (see :ref:`objector`, default: :class:`moco_wrapper.util.objector.DefaultObjector`)
+    :param requestor: asynchronous requestor object (default: :class:`moco_wrapper.util.requestor.AsyncRequestor`)
+    :param impersonate_user_id: user id the client should impersonate (default: None, see https://github.com/hundertzehn/mocoapp-api-docs#impersonation)
+    :param timeout: timeout in seconds for every request (default: None, the timeout of the requestor is used)
+    :param deadline: seconds every request may take in total, including retries (default: None)
+    :param cache: cache for the responses of read endpoints (see :class:`moco_wrapper.util.cache.ResponseCache`, default: None)
+    :param identity_map: identity map shared by the nested entities of all responses (see :class:`moco_wrapper.util.objector.IdentityMap`, default: None)
+    :param hooks: hooks called at the stages of every request (see :class:`moco_wrapper.util.instrumentation.Hooks`, default: None, a new instance is created)
+    :param tracer: tracer recording spans of every request (see :ref:`tracing`, default: None, nothing is recorded)
+    :param base_url: url of the api used instead of the one derived from the domain (default: None)
+
+    :type auth: dict
+    :type impersonate_user_id: int
+    :type timeout: float
+    :type deadline: float
+    :type cache: :class:`moco_wrapper.util.cache.ResponseCache`
+    :type identity_map: :class:`moco_wrapper.util.objector.IdentityMap`
+    :type hooks: :class:`moco_wrapper.util.instrumentation.Hooks`
+    :type tracer: :class:`moco_wrapper.util.tracing.OpenTelemetryTracer`
+    :type base_url: str
+
+    .. code-block:: python
+
+        import asyncio
+        import moco_wrapper
+
+        async def main():
+            async with moco_wrapper.AsyncMoco(auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"}) as m:
+                projects = await asyncio.gather(
+                    m.Project.get(1),
+                    m.Project.get(2)
+                )
+
+        asyncio.run(main())
+
+    .. note::
+
+        The default requestor needs the ``httpx`` package (``pip install moco-wrapper[async]``)
+    """
+
+    def __init__(
+        self,
+        auth={},
+        objector=None,
+        requestor=None,
+        impersonate_user_id: int = None,
+        timeout=None,
+        deadline: float = None,
+        cache=None,
+        identity_map=None,
+        hooks=None,
+        tracer=None,
+        base_url: str = None,
+        **kwargs
+    ):
+        if objector is None:
+            objector = util.objector.DefaultObjector()
+
+        if requestor is None:
+            requestor = util.requestor.AsyncRequestor()
+
+        super(AsyncMoco, self).__init__(
+            auth=auth,
+            objector=objector,
+            requestor=requestor,
+            impersonate_user_id=impersonate_user_id,
+            timeout=timeout,
+            deadline=deadline,
+            cache=cache,
+            identity_map=identity_map,
+            hooks=hooks,
+            tracer=tracer,
+            base_url=base_url,
+            **kwargs
+        )
+
+        self._authenticate_lock = None
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict = None,
+        data: dict = None,
+        bypass_auth: bool = False,
+        **kwargs
+    ):
+        """
+        Requests the given resource with the assigned requestor
+
+        :param method: HTTP Method (eg. POST, GET, PUT, DELETE)
+        :param path: path of the resource (e.g. ``/projects``)
+        :param params: url parameters (e.g. ``page=1``, query parameters)
+        :param data: dictionary with data (http body)
+        :param bypass_auth: If authentication checks should be skipped (default False)
+
+        .. seealso::
+
+            :meth:`moco_wrapper.Moco.request`
+        """
+        with self.tracer.span("moco.request", {"http.method": method, "moco.path": path}):
+            return await self._request(method, path, params, data, bypass_auth, **kwargs)
+
+    async def _request(self, method, path, params, data, bypass_auth, **kwargs):
+        full_path = self.full_domain + path
+        identity_map = self._identity_map_for(kwargs.pop("identity_map", None))
+
+        if not bypass_auth:
+            await self.authenticate()
+
+        event = self.hooks.start(None, method, full_path)
+        requestor_response = await self._send(method, full_path, params, data, event=event, **kwargs)
+
+        if isinstance(requestor_response, response.RawResponse):
+            return requestor_response  # passed through without conversion
+
+        # push the response to the current objector
+        objector_result = self._objectify(event, self._objector.convert, requestor_response)
+        self._attach_identity_map(objector_result, identity_map)
+
+        return self._raise_on_error(objector_result)
+
+    async def request_e(
+        self,
+        ep: endpoint.Endpoint,
+        ep_params=None,
+        params=None,
+        data=None,
+        bypass_auth: bool = False,
+        **kwargs
+    ):
+        with self.tracer.span(ep.slug, {"http.method": ep.method, "moco.endpoint": ep.slug}):
+            return await self._request_e(ep, ep_params, params, data, bypass_auth, **kwargs)
+
+    async def _request_e(self, ep, ep_params, params, data, bypass_auth, **kwargs):
+        full_path = self.full_domain + ep.url_format(ep_params)
+        identity_map = self._identity_map_for(kwargs.pop("identity_map", None))
+
+        if not bypass_auth:
+            await self.authenticate()
+
+        # raw and streamed responses are never cached
+        cache_key = None
+        if not kwargs.get("raw", False) and not kwargs.get("stream", False):
+            cache_key = self._cache_key(ep, ep_params, params)
+        send_kwargs = kwargs
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # revalidate an expired response instead of downloading it again
+            conditional_headers = self.cache.conditional_headers(cache_key)
+            if conditional_headers is not None:
+                send_kwargs = dict(kwargs)
+                send_kwargs["headers"] = dict(kwargs.get("headers", {}), **conditional_headers)
+
+        event = self.hooks.start(ep.slug, ep.method, full_path)
+        requestor_response = await self._send(ep.method, full_path, params, data, event=event, **send_kwargs)
+
+        if isinstance(requestor_response, response.NotModifiedResponse) and cache_key is not None:
+            cached = self.cache.refresh(cache_key, ep)
+            if cached is not None:
+                return cached
+
+            # the cached response was dropped in the meantime
+            event = self.hooks.start(ep.slug, ep.method, full_path)
+            requestor_response = await self._send(ep.method, full_path, params, data, event=event, **kwargs)
+
+        if isinstance(requestor_response, response.RawResponse):
+            self._cache_update(ep, None, requestor_response)
+            return requestor_response  # passed through without conversion
+
+        # push the response to the current objector
+        objector_result = self._objectify(event, self._objector.convert_e, requestor_response, ep)
+        self._attach_identity_map(objector_result, identity_map)
+        self._cache_update(ep, cache_key, objector_result)
+
+        return self._raise_on_error(objector_result)
+
+    async def _send(self, method, full_path, params, data, event=None, **kwargs):
+        """
+        Passes the request to the assigned requestor and awaits its response
+
+        .. seealso::
+
+            :meth:`moco_wrapper.Moco._send`
+        """
+        if event is None:
+            return await self._requestor_send(method, full_path, params, data, **kwargs)
+
+        if self.hooks.has_listeners("on_retry"):
+            kwargs.setdefault("on_retry", event.retried)
+
+        try:
+            requestor_response = await self._requestor_send(method, full_path, params, data, **kwargs)
+        except (Exception, exceptions.MocoException) as ex:
+            event.finished(exception=ex)
+            raise
+
+        event.finished(requestor_response)
+
+        return requestor_response
+
+    async def paginate(
+        self,
+        path,
+        ep_params=None,
+        params=None,
+        data=None,
+        max_workers: int = None,
+        identity_map=None,
+        **kwargs
+    ):
+        """
+        Iterates over every item of a paginated listing, requesting the next page only when the current one is used up
+
+        :param path: Endpoint slug (e.g. ``activity_getlist``) or path of the resource
+        :param ep_params: Url parameters of the endpoint (default ``None``)
+        :param params: Query string parameters, ``page`` is used as the first page (default ``None``)
+        :param data: Dictionary with data (http body) (default ``None``)
+        :param max_workers: Number of pages to request concurrently once the first page is known
+            (default ``None``, pages are requested one after another)
+        :param identity_map: Identity map the nested entities of all pages are shared through, ``True`` creates one
+            for this iteration (default ``None``, the identity map of the instance is used, see
+            :class:`moco_wrapper.util.objector.IdentityMap`)
+
+        :type max_workers: int
+
+        :returns: Asynchronous generator yielding the (converted) items of every page
+
+        .. code-block:: python
+
+            async for activity in m.paginate("activity_getlist", params={"from": "2020-01-01", "to": "2020-12-31"}):
+                print(activity.hours)
+
+        .. seealso::
+
+            :meth:`pages`, :meth:`moco_wrapper.Moco.paginate`
+        """
+        if kwargs.get("raw", False):
+            raise ValueError("Raw responses have no items, use pages to iterate over them")
+
+        pages = self.pages(path, ep_params, params, data, max_workers, identity_map, **kwargs)
+        try:
+            async for page in pages:
+                # iterating the page (instead of its items) yields rows for the columns of the ColumnarObjector
+                for item in page:
+                    yield item
+        finally:
+            # cancels the pages that are still requested
+            await pages.aclose()
+
+    async def pages(
+        self,
+        path,
+        ep_params=None,
+        params=None,
+        data=None,
+        max_workers: int = None,
+        identity_map=None,
+        **kwargs
+    ):
+        """
+        Iterates over the pages of a paginated listing, takes the same arguments as :meth:`paginate`
+
+        :returns: Asynchronous generator yielding the (converted) list response of every page
+
+        .. seealso::
+
+            :meth:`moco_wrapper.Moco.pages`
+        """
+        page_params = dict(params) if params is not None else {}
+        page_number = page_params.pop("page", 1)
+
+        if identity_map is True:
+            identity_map = util.objector.IdentityMap()  # shared by all pages
+
+        if identity_map is not None:
+            kwargs["identity_map"] = identity_map
+
+        while True:
+            page = await self._get_page(path, ep_params, page_params, data, page_number, **kwargs)
+
+            yield page
+
+            paged = isinstance(page, (response.PagedListResponse, response.RawResponse, response.StreamedListResponse))
+            if not paged or page.is_last:
+                return
+
+            if max_workers is not None and max_workers > 1:
+                break
+
+            page_number = page.next_page
+            page = None  # release the finished page before requesting the next one
+
+        next_page, last_page = page.next_page, page.last_page
+        page = None
+
+        pending = collections.deque()
+        try:
+            while next_page <= last_page or len(pending) > 0:
+                while next_page <= last_page and len(pending) < max_workers:
+                    pending.append(
+                        asyncio.ensure_future(self._get_page(path, ep_params, page_params, data, next_page, **kwargs))
+                    )
+                    next_page += 1
+
+                yield await pending.popleft()
+        finally:
+            # iteration stopped early, do not request pages nobody is going to read
+            for future in pending:
+                future.cancel()
+
+    async def _get_page(self, path, ep_params, params, data, page_number, **kwargs):
+        """
+        Requests a single page of a listing for :meth:`paginate`
+        """
+        page_params = dict(params)
+        page_params["page"] = page_number
+
+        page = await self.get(path, ep_params=ep_params, params=page_params, data=data, **kwargs)
+        if not isinstance(page, (response.ListResponse, response.RawResponse, response.StreamedListResponse)):
+            raise ValueError("Pagination requires a list response, got {}".format(page))
+
+        return page
+
+    async def bulk(self, operations, max_workers: int = 4, batch_size: int = 100, use_bulk_endpoints: bool = True):
+        """
+        Runs many write operations concurrently, takes the same arguments as :meth:`moco_wrapper.Moco.bulk`
+
+        :returns: Results of all operations
+        :rtype: :class:`moco_wrapper.util.bulk.BulkReport`
+        """
+        executor = util.bulk.BulkExecutor(
+            self,
+            max_workers=max_workers,
+            batch_size=batch_size,
+            use_bulk_endpoints=use_bulk_endpoints
+        )
+
+        return await executor.run_async(operations)
+
+    async def authenticate(self):
+        """
+        Performs any action necessary to be authenticated against the moco api.
+
+        This method gets invoked automatically, on the very first request you send against the api.
+        """
+        if self.api_key is not None and self.domain is not None:
+            return  # already authenticated
+
+        if self._authenticate_lock is None:
+            # created on first use, so it belongs to the running event loop
+            self._authenticate_lock = asyncio.Lock()
+
+        # concurrent first requests log in only once
+        async with self._authenticate_lock:
+            if self.api_key is not None and self.domain is not None:
+                return  # authenticated by another request in the meantime
+
+            if all(x in self.auth.keys() for x in ['api_key', 'domain']):
+                # authentication with api key
+                self.api_key = self.auth["api_key"]
+                self.domain = self.auth["domain"]
+                del self.auth
+            elif all(x in self.auth.keys() for x in ['domain', 'email', 'password']):
+                # authentication with username/password
+                self.domain = self.auth["domain"]
+
+                email, password = self.auth["email"], self.auth["password"]
+                session = (await self.Session.authenticate(email, password)).data
+
+                self.api_key = session.api_key
+                del self.auth
+            else:
+                # raise error authentication information is very likely invalid
+                raise ValueError("Invalid authentication information given")
+
+    async def close(self):
+        """
+        Closes the requestor and all of its connections
+        """
+        if hasattr(self._requestor, "close"):
+            await self._requestor.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
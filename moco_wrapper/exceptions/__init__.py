@@ -5,3 +5,4 @@ from .unauthorized import UnauthorizedException
 from .unprocessable import UnprocessableException
 from .rate_limit import RateLimitException
 from .server_error import ServerErrorException
+from .deadline_exceeded import DeadlineExceededException
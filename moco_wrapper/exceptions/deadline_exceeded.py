@@ -0,0 +1,10 @@
+from .base import MocoException
+
+
+class DeadlineExceededException(MocoException):
+    """
+    Raised when a request (including all of its retries) did not finish before its deadline
+    """
+
+    def __str__(self):
+        return "<DeadlineExceededException, Data: {}>".format(self.data)
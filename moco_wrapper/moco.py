@@ -1,9 +1,32 @@
+import collections
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from moco_wrapper import models, util, exceptions
 from moco_wrapper.util import requestor, objector, response, endpoint
 
 from requests import get, post, put, delete
 
 
+class _Model(object):
+    """
+    Model attribute of :class:`Moco`, the model is created on first access (most clients only use a few of them)
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        model = getattr(models, self.name)(instance)
+        # stored on the instance, further accesses do not go through the descriptor
+        instance.__dict__[self.name] = model
+
+        return model
+
+
 class Moco(object):
     """
     Main Moco class for handling authentication, object conversion, requesting ressources with the moco api
@@ -12,9 +35,25 @@ class Moco(object):
     :param objector: objector object (see :ref:`objector`, default: :class:`moco_wrapper.util.objector.DefaultObjector`)
     :param requestor: requestor object (see :ref:`requestor`, default: :class:`moco_wrapper.util.requestor.DefaultRequestor`)
     :param impersonate_user_id: user id the client should impersonate (default: None, see https://github.com/hundertzehn/mocoapp-api-docs#impersonation)
+    :param timeout: timeout in seconds for every request, either a single value or a ``(connect, read)`` tuple
+        (default: None, the timeout of the requestor is used)
+    :param deadline: seconds every request may take in total, including retries (default: None)
+    :param cache: cache for the responses of read endpoints (see :class:`moco_wrapper.util.cache.ResponseCache`, default: None)
+    :param identity_map: identity map shared by the nested entities of all responses (see :class:`moco_wrapper.util.objector.IdentityMap`, default: None)
+    :param hooks: hooks called at the stages of every request (see :class:`moco_wrapper.util.instrumentation.Hooks`, default: None, a new instance is created)
+    :param tracer: tracer recording spans of every request (see :ref:`tracing`, default: None, nothing is recorded)
+    :param base_url: url of the api used instead of the one derived from the domain, e.g. of a
+        :class:`moco_wrapper.util.fake_server.FakeMocoServer` (default: None)
 
     :type auth: dict
     :type impersonate_user_id: int
+    :type timeout: float, tuple
+    :type deadline: float
+    :type cache: :class:`moco_wrapper.util.cache.ResponseCache`
+    :type identity_map: :class:`moco_wrapper.util.objector.IdentityMap`
+    :type hooks: :class:`moco_wrapper.util.instrumentation.Hooks`
+    :type tracer: :class:`moco_wrapper.util.tracing.OpenTelemetryTracer`
+    :type base_url: str
 
     .. code-block:: python
 
@@ -27,12 +66,51 @@ class Moco(object):
         )
     """
 
+    Activity = _Model("Activity")
+    AccountFixedCost = _Model("AccountFixedCost")
+    AccountHourlyRate = _Model("AccountHourlyRate")
+    AccountInternalHourlyRate = _Model("AccountInternalHourlyRate")
+    Contact = _Model("Contact")
+    Company = _Model("Company")
+    Comment = _Model("Comment")
+    Unit = _Model("Unit")
+    User = _Model("User")
+    UserPresence = _Model("UserPresence")
+    UserHoliday = _Model("UserHoliday")
+    UserEmployment = _Model("UserEmployment")
+    Schedule = _Model("Schedule")  # old way for handling planning + absenses
+    PlanningEntry = _Model("PlanningEntry")  # new way for handling planning
+    Project = _Model("Project")
+    ProjectContract = _Model("ProjectContract")
+    ProjectExpense = _Model("ProjectExpense")
+    ProjectTask = _Model("ProjectTask")
+    ProjectRecurringExpense = _Model("ProjectRecurringExpense")
+    ProjectPaymentSchedule = _Model("ProjectPaymentSchedule")
+    Deal = _Model("Deal")
+    DealCategory = _Model("DealCategory")
+    Invoice = _Model("Invoice")
+    InvoicePayment = _Model("InvoicePayment")
+    Offer = _Model("Offer")
+    Session = _Model("Session")
+    PurchaseDraft = _Model("PurchaseDraft")
+    PurchaseCategory = _Model("PurchaseCategory")
+    Purchase = _Model("Purchase")
+    Tagging = _Model("Tagging")
+    Report = _Model("Report")
+
     def __init__(
         self,
         auth={},
         objector=objector.DefaultObjector(),
         requestor=requestor.DefaultRequestor(),
         impersonate_user_id: int = None,
+        timeout=None,
+        deadline: float = None,
+        cache=None,
+        identity_map=None,
+        hooks=None,
+        tracer=None,
+        base_url: str = None,
         **kwargs):
 
         self.auth = auth
@@ -60,39 +138,7 @@ class Moco(object):
             )
 
         """
-        self.endpoint_manager = endpoint.EndpointManager()
-
-        self.Activity = models.Activity(self)
-        self.AccountFixedCost = models.AccountFixedCost(self)
-        self.AccountHourlyRate = models.AccountHourlyRate(self)
-        self.AccountInternalHourlyRate = models.AccountInternalHourlyRate(self)
-        self.Contact = models.Contact(self)
-        self.Company = models.Company(self)
-        self.Comment = models.Comment(self)
-        self.Unit = models.Unit(self)
-        self.User = models.User(self)
-        self.UserPresence = models.UserPresence(self)
-        self.UserHoliday = models.UserHoliday(self)
-        self.UserEmployment = models.UserEmployment(self)
-        self.Schedule = models.Schedule(self)  # old way for handling planning + absenses
-        self.PlanningEntry = models.PlanningEntry(self)  # new way for handling planning
-        self.Project = models.Project(self)
-        self.ProjectContract = models.ProjectContract(self)
-        self.ProjectExpense = models.ProjectExpense(self)
-        self.ProjectTask = models.ProjectTask(self)
-        self.ProjectRecurringExpense = models.ProjectRecurringExpense(self)
-        self.ProjectPaymentSchedule = models.ProjectPaymentSchedule(self)
-        self.Deal = models.Deal(self)
-        self.DealCategory = models.DealCategory(self)
-        self.Invoice = models.Invoice(self)
-        self.InvoicePayment = models.InvoicePayment(self)
-        self.Offer = models.Offer(self)
-        self.Session = models.Session(self)
-        self.PurchaseDraft = models.PurchaseDraft(self)
-        self.PurchaseCategory = models.PurchaseCategory(self)
-        self.Purchase = models.Purchase(self)
-        self.Tagging = models.Tagging(self)
-        self.Report = models.Report(self)
+        self._endpoint_manager = None
 
         self._requestor = requestor
         self._objector = objector
@@ -106,6 +152,84 @@ class Moco(object):
 
         self._impersonation_user_id = impersonate_user_id
 
+        self.timeout = timeout
+        """
+        Timeout passed to the requestor for every request (``None`` uses the timeout of the requestor)
+
+        A single call can overwrite it:
+
+        .. code-block:: python
+
+            m.get("project_get", ep_params={"id": 1}, timeout=(3.05, 10))
+        """
+
+        self.deadline = deadline
+        """
+        Seconds every request may take in total, including retries and the time waited in between
+        (``None`` for no deadline)
+
+        A single call can overwrite it:
+
+        .. code-block:: python
+
+            m.get("activity_getlist", params={"from": "2020-01-01", "to": "2020-01-31"}, deadline=30)
+        """
+
+        self.cache = cache
+        """
+        Cache for the responses of read endpoints (``None`` disables caching)
+
+        .. seealso::
+
+            :class:`moco_wrapper.util.cache.ResponseCache`
+        """
+
+        self.identity_map = identity_map
+        """
+        Identity map the nested entities of all responses are shared through (``None`` disables sharing)
+
+        A single call can use its own identity map (``True`` creates a new one for the call):
+
+        .. code-block:: python
+
+            m.get("activity_getlist", params={"from": "2020-01-01", "to": "2020-01-31"}, identity_map=True)
+
+        .. seealso::
+
+            :class:`moco_wrapper.util.objector.IdentityMap`
+        """
+
+        self.hooks = hooks if hooks is not None else util.instrumentation.Hooks()
+        """
+        Hooks called at the stages of every request, e.g. for collecting metrics
+
+        .. code-block:: python
+
+            from moco_wrapper.util.instrumentation import MetricsCollector
+
+            metrics = MetricsCollector().install(m.hooks)
+
+        .. seealso::
+
+            :class:`moco_wrapper.util.instrumentation.Hooks`
+        """
+
+        self.tracer = tracer if tracer is not None else util.tracing.NOOP_TRACER
+        """
+        Tracer recording a span for every call (named after the endpoint slug) with child spans for every attempt
+        (``moco.send``), every wait before a retry (``moco.retry_wait``), the decoding of the response
+        (``moco.decode``) and its conversion by the objector (``moco.objectify``)
+
+        .. seealso::
+
+            :ref:`tracing`
+        """
+
+        self.base_url = base_url.rstrip("/") if base_url is not None else None
+        """
+        Url of the api that is used instead of the one derived from the domain (``None`` uses the moco api)
+        """
+
         # these will be (re)set on the first request
         self.api_key = None
         self.domain = None
@@ -138,44 +262,33 @@ class Moco(object):
         The response will then be given to the currently assigned objector (see :ref:`objector`)
 
         The *possibly* modified response will then be returned
+
+        .. note::
+
+            With ``raw=True`` the body of a successful response is returned undecoded as
+            :class:`moco_wrapper.util.response.RawResponse`, the objector is skipped (see :meth:`pages`)
         """
+        with self.tracer.span("moco.request", {"http.method": method, "moco.path": path}):
+            return self._request(method, path, params, data, bypass_auth, **kwargs)
 
+    def _request(self, method, path, params, data, bypass_auth, **kwargs):
         full_path = self.full_domain + path
-        requestor_response = None
+        identity_map = self._identity_map_for(kwargs.pop("identity_map", None))
 
         if not bypass_auth:
             self.authenticate()
 
-        # merge headers if set in model
-        headers = self.headers
-        if "headers" in kwargs.keys():
-            for key, value in kwargs["headers"].items():
-                headers[key] = value
+        event = self.hooks.start(None, method, full_path)
+        requestor_response = self._send(method, full_path, params, data, event=event, **kwargs)
 
-            del kwargs["headers"]
-
-        # pass request making to the requestor object
-        if method == "GET":
-            requestor_response = self._requestor.get(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif method == "PUT":
-            requestor_response = self._requestor.put(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif method == "POST":
-            requestor_response = self._requestor.post(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif method == "DELETE":
-            requestor_response = self._requestor.delete(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif method == "PATCH":
-            requestor_response = self._requestor.patch(full_path, params=params, data=data, headers=headers, **kwargs)
+        if isinstance(requestor_response, response.RawResponse):
+            return requestor_response  # passed through without conversion
 
         # push the response to the current objector
-        objector_result = self._objector.convert(requestor_response)
+        objector_result = self._objectify(event, self._objector.convert, requestor_response)
+        self._attach_identity_map(objector_result, identity_map)
 
-        # if the result is an exception we raise it, otherwise return it
-        if isinstance(objector_result, response.ErrorResponse) and isinstance(objector_result.data,
-                                                                              exceptions.MocoException):
-            raise objector_result.data
-
-        # return the objector result by default
-        return objector_result
+        return self._raise_on_error(objector_result)
 
     def request_e(
         self,
@@ -186,12 +299,146 @@ class Moco(object):
         bypass_auth: bool = False,
         **kwargs
     ):
+        with self.tracer.span(ep.slug, {"http.method": ep.method, "moco.endpoint": ep.slug}):
+            return self._request_e(ep, ep_params, params, data, bypass_auth, **kwargs)
+
+    def _request_e(self, ep, ep_params, params, data, bypass_auth, **kwargs):
         full_path = self.full_domain + ep.url_format(ep_params)
-        requestor_response = None
+        identity_map = self._identity_map_for(kwargs.pop("identity_map", None))
 
         if not bypass_auth:
             self.authenticate()
 
+        # raw and streamed responses are never cached
+        cache_key = None
+        if not kwargs.get("raw", False) and not kwargs.get("stream", False):
+            cache_key = self._cache_key(ep, ep_params, params)
+        send_kwargs = kwargs
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            # revalidate an expired response instead of downloading it again
+            conditional_headers = self.cache.conditional_headers(cache_key)
+            if conditional_headers is not None:
+                send_kwargs = dict(kwargs)
+                send_kwargs["headers"] = dict(kwargs.get("headers", {}), **conditional_headers)
+
+        event = self.hooks.start(ep.slug, ep.method, full_path)
+        requestor_response = self._send(ep.method, full_path, params, data, event=event, **send_kwargs)
+
+        if isinstance(requestor_response, response.NotModifiedResponse) and cache_key is not None:
+            cached = self.cache.refresh(cache_key, ep)
+            if cached is not None:
+                return cached
+
+            # the cached response was dropped in the meantime
+            event = self.hooks.start(ep.slug, ep.method, full_path)
+            requestor_response = self._send(ep.method, full_path, params, data, event=event, **kwargs)
+
+        if isinstance(requestor_response, response.RawResponse):
+            self._cache_update(ep, None, requestor_response)
+            return requestor_response  # passed through without conversion
+
+        # push the response to the current objector
+        objector_result = self._objectify(event, self._objector.convert_e, requestor_response, ep)
+        self._attach_identity_map(objector_result, identity_map)
+        self._cache_update(ep, cache_key, objector_result)
+
+        return self._raise_on_error(objector_result)
+
+    def _identity_map_for(self, identity_map):
+        """
+        Returns the identity map of a call (``True`` creates a new one, ``None`` uses the one of the instance)
+        """
+        if identity_map is None:
+            return self.identity_map
+
+        if identity_map is True:
+            return util.objector.IdentityMap()
+
+        if identity_map is False:
+            return None
+
+        return identity_map
+
+    def _attach_identity_map(self, objector_result, identity_map):
+        """
+        Makes the nested entities of the converted response use the identity map
+        """
+        if identity_map is None:
+            return
+
+        # entities found again in this response are updated with its data
+        identity_map = identity_map.scope()
+
+        if isinstance(objector_result, response.ListResponse):
+            for item in objector_result.items:
+                identity_map.attach(item)
+        elif isinstance(objector_result, response.ObjectResponse):
+            identity_map.attach(objector_result.data)
+        elif isinstance(objector_result, response.StreamedListResponse):
+            def attach(item):
+                identity_map.attach(item)
+                return item
+
+            objector_result.map(attach)
+
+    def _cache_key(self, ep, ep_params, params):
+        """
+        Returns the cache key of a request, ``None`` if responses of the endpoint are not cached
+        """
+        if self.cache is None or not self.cache.cacheable(ep):
+            return None
+
+        return self.cache.key(
+            ep,
+            ep_params=ep_params,
+            params=params,
+            scope=(self.domain, self.api_key, self._impersonation_user_id)
+        )
+
+    def _cache_update(self, ep, cache_key, objector_result):
+        """
+        Stores the response of a read endpoint in the cache or drops the cached responses a mutating endpoint changed
+        """
+        if self.cache is None:
+            return
+
+        if ep.method != "GET":
+            self.cache.invalidate(ep)
+        elif cache_key is not None and not isinstance(objector_result, response.ErrorResponse):
+            self.cache.set(cache_key, ep, objector_result)
+
+    def _send(self, method, full_path, params, data, event=None, **kwargs):
+        """
+        Passes the request to the assigned requestor and returns its response, recording it in the event of the
+        request (see :class:`moco_wrapper.util.instrumentation.RequestEvent`)
+        """
+        if event is None:
+            return self._requestor_send(method, full_path, params, data, **kwargs)
+
+        if self.hooks.has_listeners("on_retry"):
+            kwargs.setdefault("on_retry", event.retried)
+
+        try:
+            requestor_response = self._requestor_send(method, full_path, params, data, **kwargs)
+        except (Exception, exceptions.MocoException) as ex:
+            event.finished(exception=ex)
+            raise
+
+        event.finished(requestor_response)
+
+        return requestor_response
+
+    def _requestor_send(self, method, full_path, params, data, **kwargs):
+        """
+        Passes the request to the assigned requestor
+        """
+        if self.tracer.enabled:
+            kwargs.setdefault("tracer", self.tracer)
+
         # merge headers if set in model
         headers = self.headers
         if "headers" in kwargs.keys():
@@ -200,21 +447,46 @@ class Moco(object):
 
             del kwargs["headers"]
 
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+
+        if self.deadline is not None:
+            kwargs.setdefault("deadline", self.deadline)
+
         # pass request making to the requestor object
-        if ep.method == "GET":
-            requestor_response = self._requestor.get(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif ep.method == "PUT":
-            requestor_response = self._requestor.put(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif ep.method == "POST":
-            requestor_response = self._requestor.post(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif ep.method == "DELETE":
-            requestor_response = self._requestor.delete(full_path, params=params, data=data, headers=headers, **kwargs)
-        elif ep.method == "PATCH":
-            requestor_response = self._requestor.patch(full_path, params=params, data=data, headers=headers, **kwargs)
+        if method == "GET":
+            return self._requestor.get(full_path, params=params, data=data, headers=headers, **kwargs)
+        elif method == "PUT":
+            return self._requestor.put(full_path, params=params, data=data, headers=headers, **kwargs)
+        elif method == "POST":
+            return self._requestor.post(full_path, params=params, data=data, headers=headers, **kwargs)
+        elif method == "DELETE":
+            return self._requestor.delete(full_path, params=params, data=data, headers=headers, **kwargs)
+        elif method == "PATCH":
+            return self._requestor.patch(full_path, params=params, data=data, headers=headers, **kwargs)
 
-        # push the response to the current objector
-        objector_result = self._objector.convert_e(requestor_response, ep)
+        return None
+
+    def _objectify(self, event, convert, *args):
+        """
+        Converts a response with the given objector method, recording the time it took in the event of the request
+        and in a tracing span
+        """
+        with self.tracer.span("moco.objectify", {"moco.objector": type(self._objector).__name__}):
+            if event is None:
+                return convert(*args)
+
+            started_at = time.perf_counter()
+            objector_result = convert(*args)
+
+        event.objectified(time.perf_counter() - started_at)
 
+        return objector_result
+
+    def _raise_on_error(self, objector_result):
+        """
+        Raises the exception the objector created for an error response, otherwise returns the objector result
+        """
         # if the result is an exception we raise it, otherwise return it
         if isinstance(objector_result, response.ErrorResponse) and isinstance(objector_result.data,
                                                                               exceptions.MocoException):
@@ -302,6 +574,188 @@ class Moco(object):
 
         return self.request("PATCH", path, params=params, data=data, **kwargs)
 
+    def paginate(
+        self,
+        path,
+        ep_params=None,
+        params=None,
+        data=None,
+        max_workers: int = None,
+        identity_map=None,
+        **kwargs
+    ):
+        """
+        Iterates over every item of a paginated listing, requesting the next page only when the current one is used up
+
+        :param path: Endpoint slug (e.g. ``activity_getlist``) or path of the resource
+        :param ep_params: Url parameters of the endpoint (default ``None``)
+        :param params: Query string parameters, ``page`` is used as the first page (default ``None``)
+        :param data: Dictionary with data (http body) (default ``None``)
+        :param max_workers: Number of pages to prefetch concurrently once the first page is known
+            (default ``None``, pages are requested one after another)
+        :param identity_map: Identity map the nested entities of all pages are shared through, ``True`` creates one
+            for this iteration (default ``None``, the identity map of the instance is used, see
+            :class:`moco_wrapper.util.objector.IdentityMap`)
+
+        :type max_workers: int
+
+        :returns: Generator yielding the (converted) items of every page (dictionaries of the rows with the
+            :class:`moco_wrapper.util.objector.ColumnarObjector`)
+
+        Only the page that is currently iterated over is kept in memory. If ``max_workers`` is set, the remaining
+        pages are requested on a thread pool sharing the requestor (and its session) of this instance, at most
+        ``max_workers`` pages are in flight or waiting to be iterated at the same time. Items are always yielded in
+        page order.
+
+        .. code-block:: python
+
+            m = Moco()
+
+            for activity in m.paginate("activity_getlist", params={"from": "2020-01-01", "to": "2020-12-31"}):
+                print(activity.hours)
+
+        .. seealso::
+
+            :meth:`pages`, :class:`moco_wrapper.util.response.PagedListResponse`
+        """
+        if kwargs.get("raw", False):
+            raise ValueError("Raw responses have no items, use pages to iterate over them")
+
+        for page in self.pages(path, ep_params, params, data, max_workers, identity_map, **kwargs):
+            # iterating the page (instead of its items) yields rows for the columns of the ColumnarObjector
+            for item in page:
+                yield item
+
+    def pages(
+        self,
+        path,
+        ep_params=None,
+        params=None,
+        data=None,
+        max_workers: int = None,
+        identity_map=None,
+        **kwargs
+    ):
+        """
+        Iterates over the pages of a paginated listing, takes the same arguments as :meth:`paginate`
+
+        :returns: Generator yielding the (converted) list response of every page
+
+        .. code-block:: python
+
+            from moco_wrapper import Moco
+            from moco_wrapper.util.columnar import Columns
+            from moco_wrapper.util.objector import ColumnarObjector
+
+            m = Moco(objector=ColumnarObjector())
+
+            activities = Columns.concat(
+                page.data for page in m.pages("activity_getlist", params={"from": "2020-01-01", "to": "2020-12-31"})
+            )
+
+        With ``raw=True`` every page is a :class:`moco_wrapper.util.response.RawResponse` holding the undecoded body:
+
+        .. code-block:: python
+
+            for page in m.pages("activity_getlist", params={..}, raw=True):
+                sink.write(page.view)
+        """
+        page_params = dict(params) if params is not None else {}
+        page_number = page_params.pop("page", 1)
+
+        if identity_map is True:
+            identity_map = util.objector.IdentityMap()  # shared by all pages
+
+        if identity_map is not None:
+            kwargs["identity_map"] = identity_map
+
+        while True:
+            page = self._get_page(path, ep_params, page_params, data, page_number, **kwargs)
+
+            yield page
+
+            paged = isinstance(page, (response.PagedListResponse, response.RawResponse, response.StreamedListResponse))
+            if not paged or page.is_last:
+                return
+
+            if max_workers is not None and max_workers > 1:
+                break
+
+            page_number = page.next_page
+            page = None  # release the finished page before requesting the next one
+
+        next_page, last_page = page.next_page, page.last_page
+        page = None
+
+        pending = collections.deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                while next_page <= last_page or len(pending) > 0:
+                    while next_page <= last_page and len(pending) < max_workers:
+                        pending.append(
+                            executor.submit(self._get_page, path, ep_params, page_params, data, next_page, **kwargs)
+                        )
+                        next_page += 1
+
+                    yield pending.popleft().result()
+            finally:
+                # iteration stopped early, do not request pages nobody is going to read
+                for future in pending:
+                    future.cancel()
+
+    def _get_page(self, path, ep_params, params, data, page_number, **kwargs):
+        """
+        Requests a single page of a listing for :meth:`paginate`
+        """
+        page_params = dict(params)
+        page_params["page"] = page_number
+
+        page = self.get(path, ep_params=ep_params, params=page_params, data=data, **kwargs)
+        if not isinstance(page, (response.ListResponse, response.RawResponse, response.StreamedListResponse)):
+            raise ValueError("Pagination requires a list response, got {}".format(page))
+
+        return page
+
+    def bulk(self, operations, max_workers: int = 4, batch_size: int = 100, use_bulk_endpoints: bool = True):
+        """
+        Runs many write operations concurrently, collecting the result (or exception) of every operation instead of
+        stopping at the first error
+
+        :param operations: Iterable of :class:`moco_wrapper.util.bulk.BulkOperation` objects or callables
+        :param max_workers: Number of requests that are sent concurrently (default ``4``)
+        :param batch_size: Maximum number of operations merged into one request of a bulk endpoint (default ``100``)
+        :param use_bulk_endpoints: If operations should be merged into requests of bulk endpoints where the api
+            has one (e.g. ``project_expense_create_bulk``, default ``True``)
+
+        :type max_workers: int
+        :type batch_size: int
+        :type use_bulk_endpoints: bool
+
+        :returns: Results of all operations
+        :rtype: :class:`moco_wrapper.util.bulk.BulkReport`
+
+        .. code-block:: python
+
+            from moco_wrapper.util.bulk import BulkOperation
+
+            m = Moco()
+
+            report = m.bulk(BulkOperation("activity_create", data=row) for row in rows)
+            print(len(report.failed))
+
+        .. seealso::
+
+            :class:`moco_wrapper.util.bulk.BulkExecutor`
+        """
+        executor = util.bulk.BulkExecutor(
+            self,
+            max_workers=max_workers,
+            batch_size=batch_size,
+            use_bulk_endpoints=use_bulk_endpoints
+        )
+
+        return executor.run(operations)
+
     def impersonate(
         self,
         user_id: int
@@ -344,6 +798,24 @@ class Moco(object):
 
         return headers
 
+    @property
+    def endpoint_manager(self):
+        """
+        Endpoint manager the endpoint slugs are looked up in, shared by all instances unless one is assigned
+
+        .. seealso::
+
+            :func:`moco_wrapper.util.endpoint.default_manager`
+        """
+        if self._endpoint_manager is None:
+            return endpoint.default_manager()
+
+        return self._endpoint_manager
+
+    @endpoint_manager.setter
+    def endpoint_manager(self, value):
+        self._endpoint_manager = value
+
     @property
     def full_domain(self) -> str:
         """
@@ -355,7 +827,11 @@ class Moco(object):
             >> print(m.full_domain)
             https://testabcd.mocoapp.com/api/v1
 
+        If a :attr:`base_url` is set, it is returned instead.
         """
+        if self.base_url is not None:
+            return self.base_url
+
         return "https://{}.mocoapp.com/api/v1".format(self.domain)
 
     @property
@@ -6,50 +6,69 @@ __author__ = """Sommalia"""
 __email__ = 'sommalia@protonmail.com'
 __version__ = '0.10.0'
 
-from .activity import Activity
-
-from .account_fixed_cost import AccountFixedCost
-from .account_hourly_rate import AccountHourlyRate
-from .account_internal_hourly_rate import AccountInternalHourlyRate
-
-from .contact import Contact
-from .company import Company
-from .comment import Comment
-from .unit import Unit
-
-from .schedule import Schedule
-from .planning_entry import PlanningEntry
-
-from .deal import Deal
-from .deal_category import DealCategory
-
-from .invoice import Invoice
-from .invoice_payment import InvoicePayment
-
-from .offer import Offer
-
-from .user import User
-from .user_presence import UserPresence
-from .user_holiday import UserHoliday
-from .user_employment import UserEmployment
-
-from .project import Project
-from .project_contract import ProjectContract
-from .project_expense import ProjectExpense
-from .project_task import ProjectTask
-from .project_recurring_expense import ProjectRecurringExpense
-from .project_payment_schedule import ProjectPaymentSchedule
-
-from .purchase_category import PurchaseCategory
-from .purchase_draft import PurchaseDraft
-from .purchase import Purchase
-
-from .session import Session
-
-from .tagging import Tagging
-
-from .report import Report
-
-from . import objector_models
-
-
+import sys
+from importlib import import_module
+
+
+_MODELS = {
+    "Activity": "activity",
+    "AccountFixedCost": "account_fixed_cost",
+    "AccountHourlyRate": "account_hourly_rate",
+    "AccountInternalHourlyRate": "account_internal_hourly_rate",
+    "Contact": "contact",
+    "Company": "company",
+    "Comment": "comment",
+    "Unit": "unit",
+    "Schedule": "schedule",
+    "PlanningEntry": "planning_entry",
+    "Deal": "deal",
+    "DealCategory": "deal_category",
+    "Invoice": "invoice",
+    "InvoicePayment": "invoice_payment",
+    "Offer": "offer",
+    "User": "user",
+    "UserPresence": "user_presence",
+    "UserHoliday": "user_holiday",
+    "UserEmployment": "user_employment",
+    "Project": "project",
+    "ProjectContract": "project_contract",
+    "ProjectExpense": "project_expense",
+    "ProjectTask": "project_task",
+    "ProjectRecurringExpense": "project_recurring_expense",
+    "ProjectPaymentSchedule": "project_payment_schedule",
+    "PurchaseCategory": "purchase_category",
+    "PurchaseDraft": "purchase_draft",
+    "Purchase": "purchase",
+    "Session": "session",
+    "Tagging": "tagging",
+    "Report": "report",
+}
+"""
+Models by the module they are defined in, the modules are imported on first access of their model. This is the
+registry of all models, the endpoint manager collects the endpoints of these models
+"""
+
+_SUBMODULES = frozenset(_MODELS.values()).union(["base", "objector_models"])
+"""
+Modules of the package, they are imported on first access as well
+"""
+
+__all__ = list(_MODELS) + ["objector_models"]
+
+
+def __getattr__(name):
+    if name in _MODELS:
+        model = getattr(import_module("." + _MODELS[name], __name__), name)
+        globals()[name] = model
+        return model
+
+    if name in _SUBMODULES:
+        return import_module("." + name, __name__)
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # module level __getattr__ needs python 3.7, older versions import everything up front
+    for _name in __all__:
+        globals()[_name] = __getattr__(_name)
@@ -1,4 +1,9 @@
+from .base import BaseObjectorModel
+
+
 class FixedCostItem(object):
+    __slots__ = ("year", "month", "amount")
+
     def __init__(
         self,
         year: int,
@@ -17,19 +22,16 @@ class FixedCostItem(object):
         )
 
 
-class AccountFixedCost(object):
+class AccountFixedCost(BaseObjectorModel):
+    FIELDS = (
+        "title", "description", "costs"
+    )
 
     def __init__(
         self,
         **kwargs
     ):
-        nk = kwargs
-
-        cost_items = []
-        for cost in kwargs["costs"]:
-            item = FixedCostItem(cost["year"], cost["month"], cost["amount"])
-            cost_items.append(item)
-
-        nk["costs"] = cost_items
+        if "costs" in kwargs.keys() and kwargs["costs"] is not None:
+            kwargs["costs"] = [FixedCostItem(x["year"], x["month"], x["amount"]) for x in kwargs["costs"]]
 
-        self.__dict__.update(nk)
+        super(AccountFixedCost, self).__init__(**kwargs)
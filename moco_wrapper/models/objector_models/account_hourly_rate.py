@@ -1,4 +1,9 @@
+from .base import BaseObjectorModel
+
+
 class SingleRate(object):
+    __slots__ = ("currency", "hourly_rate")
+
     def __init__(self, currency, hourly_rate):
         self.currency = currency
         self.hourly_rate = hourly_rate
@@ -8,6 +13,8 @@ class SingleRate(object):
 
 
 class TaskRate(object):
+    __slots__ = ("id", "name", "rates")
+
     def __init__(self, id, name, raw_rates):
         self.id = id
         self.name = name
@@ -26,6 +33,8 @@ class TaskRate(object):
 
 
 class UserRate(object):
+    __slots__ = ("id", "full_name", "rates")
+
     def __init__(self, id, full_name, raw_rates):
         self.id = id
         self.full_name = full_name
@@ -43,7 +52,11 @@ class UserRate(object):
         )
 
 
-class AccountHourlyRate(object):
+class AccountHourlyRate(BaseObjectorModel):
+    FIELDS = (
+        "defaults_rates", "tasks", "users"
+    )
+
     def __init__(self, **kwargs):
         nk = kwargs
 
@@ -67,7 +80,7 @@ class AccountHourlyRate(object):
                 obj = UserRate(
                     id=user_rate["id"],
                     full_name=user_rate["full_name"],
-                    raw_rates=task_rate["rates"]
+                    raw_rates=user_rate["rates"]
                 )
                 user_rates.append(obj)
 
@@ -82,4 +95,4 @@ class AccountHourlyRate(object):
 
             nk["defaults_rates"] = default_rates
 
-        self.__dict__.update(nk)
+        super(AccountHourlyRate, self).__init__(**nk)
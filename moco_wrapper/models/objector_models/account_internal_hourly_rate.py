@@ -1,5 +1,9 @@
+from .base import BaseObjectorModel
+
 
 class SingleInternalRate(object):
+    __slots__ = ("year", "rate")
+
     def __init__(
         self,
         year,
@@ -9,17 +13,19 @@ class SingleInternalRate(object):
         self.rate = rate
 
 
-class AccountInternalHourlyRate(object):
+class AccountInternalHourlyRate(BaseObjectorModel):
+    FIELDS = (
+        "id", "full_name", "rates"
+    )
+
     def __init__(
         self,
         id: int,
         full_name: str,
         rates: list
     ):
-        self.id = id
-        self.full_name = full_name
-        self.rates = []
-
-        for rate_raw in rates:
-            item = SingleInternalRate(**rate_raw)
-            self.rates.append(item)
+        super(AccountInternalHourlyRate, self).__init__(
+            id=id,
+            full_name=full_name,
+            rates=[SingleInternalRate(**x) for x in rates]
+        )
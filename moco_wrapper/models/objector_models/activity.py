@@ -1,27 +1,26 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
 
-class Activity(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
+class Activity(BaseObjectorModel):
+    FIELDS = (
+        "id", "date", "hours", "seconds", "description", "billed", "billable", "tag", "remote_service",
+        "remote_id", "remote_url", "project", "task", "customer", "user", "hourly_rate", "timer_started_at",
+        "created_at", "updated_at"
+    )
 
-        if "project" in kwargs.keys() and kwargs["project"] is not None:
-            p = obj.Project(**kwargs["project"])
-            nk["project"] = p
+    NESTED = {
+        "project": "Project",
+        "task": "ProjectTask",
+        "customer": "Company",
+        "user": "User"
+    }
 
-        if "task" in kwargs.keys() and kwargs["task"] is not None:
-            t = obj.ProjectTask(**kwargs["task"])
-            nk["task"] = t
-
-        if "customer" in kwargs.keys() and kwargs["customer"] is not None:
-            c = obj.Company(**kwargs["customer"])
-            nk["customer"] = c
-
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            u = obj.User(**kwargs["user"])
-            nk["user"] = u
-
-        self.__dict__.update(nk)
+    DTYPES = {
+        "id": "int",
+        "date": "date",
+        "hours": "float",
+        "seconds": "int",
+        "billed": "bool",
+        "billable": "bool",
+        "hourly_rate": "decimal"
+    }
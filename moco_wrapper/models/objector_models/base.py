@@ -0,0 +1,316 @@
+class NestedField(object):
+    """
+    Descriptor for fields that contain other entities.
+
+    The raw json data (a dictionary or a list of dictionaries) is kept in the slot of the field and only converted
+    into model objects on the first access of the field, the converted value then replaces the raw data.
+    """
+
+    __slots__ = ("name", "slot", "model")
+
+    def __init__(self, name, slot, model):
+        """
+        Class constructor
+
+        :param name: Field name
+        :param slot: Slot descriptor the value is stored in
+        :param model: Model class or name of the model class in :mod:`moco_wrapper.models.objector_models`
+        """
+        self.name = name
+        self.slot = slot
+        self.model = model
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = self.slot.__get__(instance, owner)
+
+        if isinstance(value, dict):
+            value = self.build(instance, value)
+            self.slot.__set__(instance, value)
+        elif isinstance(value, list) and any(isinstance(x, dict) for x in value):
+            value = [self.build(instance, x) if isinstance(x, dict) else x for x in value]
+            self.slot.__set__(instance, value)
+
+        return value
+
+    def build(self, instance, data: dict):
+        """
+        Converts the json data of a nested entity into its model, shared through the identity map of the
+        instance (if it has one)
+        """
+        identity_map = instance._identity_map
+        if identity_map is not None:
+            return identity_map.get_or_create(self.resolve_model(), data)
+
+        return self.resolve_model()(**data)
+
+    def __set__(self, instance, value):
+        self.slot.__set__(instance, value)
+
+    def __delete__(self, instance):
+        self.slot.__delete__(instance)
+
+    def resolve_model(self):
+        """
+        Returns the model class of the field
+        """
+        if isinstance(self.model, str):
+            from moco_wrapper.models import objector_models
+            self.model = getattr(objector_models, self.model)
+
+        return self.model
+
+    def is_materialized(self, instance) -> bool:
+        """
+        Returns if the value of the field was already converted (or does not need to be)
+        """
+        try:
+            value = self.slot.__get__(instance, type(instance))
+        except AttributeError:
+            return True
+
+        if isinstance(value, list):
+            return not any(isinstance(x, dict) for x in value)
+
+        return not isinstance(value, dict)
+
+
+class ObjectorModelMeta(type):
+    """
+    Metaclass of the objector models, creates the ``__slots__`` of a model from its declared ``FIELDS``, wraps
+    the slots of its ``NESTED`` fields into :class:`NestedField` descriptors and merges its ``DTYPES`` with the ones
+    of its base classes
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        inherited = set()
+        for base in bases:
+            inherited.update(getattr(base, "_field_names", ()))
+
+        fields = tuple(x for x in namespace.get("FIELDS", ()) if x not in inherited)
+
+        if "__slots__" not in namespace:
+            namespace["__slots__"] = fields
+
+        cls = super(ObjectorModelMeta, mcs).__new__(mcs, name, bases, namespace)
+        cls._field_names = frozenset(inherited.union(fields))
+
+        dtypes = {}
+        for base in reversed(bases):
+            dtypes.update(getattr(base, "DTYPES", {}))
+        dtypes.update(namespace.get("DTYPES", {}))
+        cls.DTYPES = dtypes
+
+        for field, model in namespace.get("NESTED", {}).items():
+            slot = getattr(cls, field, None)
+            if isinstance(slot, NestedField):
+                slot = slot.slot
+
+            if slot is None:
+                raise TypeError("Nested field {} of {} is not declared in FIELDS".format(field, name))
+
+            setattr(cls, field, NestedField(field, slot, model))
+
+        return cls
+
+
+class BaseObjectorModel(object, metaclass=ObjectorModelMeta):
+    """
+    Base class of the objector models (the objects api responses are converted into).
+
+    Every model declares the fields the api returns for its entity in ``FIELDS``, these are stored in ``__slots__``
+    instead of a per instance dictionary. Keys the api returns in addition to the declared fields are kept in a
+    separate mapping, so no data is lost when the api adds new fields. Both are accessed as attributes.
+
+    ``NESTED`` maps fields that contain other entities (or lists of them) to the model they are converted into,
+    either the model class or its name in :mod:`moco_wrapper.models.objector_models`. Nested entities are converted
+    on the first access of their field, reading only scalar fields never builds them. ``RENAMED`` maps keys of
+    the api to a different field name (e.g. ``from``, which is a python keyword).
+
+    .. code-block:: python
+
+        class Comment(BaseObjectorModel):
+            FIELDS = ("id", "commentable_id", "commentable_type", "text", "manual", "user", "created_at", "updated_at")
+            NESTED = {
+                "user": "User"
+            }
+    """
+
+    __slots__ = ("_extra", "_identity_map")
+
+    FIELDS = ()
+    """
+    Names of the fields of the entity
+    """
+
+    NESTED = {}
+    """
+    Fields that are converted into other models (field name => model class or model name)
+    """
+
+    RENAMED = {}
+    """
+    Keys of the api that are stored under another field name (key => field name)
+    """
+
+    DTYPES = {
+        "created_at": "datetime",
+        "updated_at": "datetime"
+    }
+    """
+    Types of the fields (field name => ``int``, ``float``, ``decimal``, ``bool``, ``date``, ``datetime`` or the
+    dotted path of an enum class), merged with the ones of the base classes. Used for the typed columns of the
+    :class:`moco_wrapper.util.objector.ColumnarObjector` and by the :class:`moco_wrapper.util.coercion.Coercer`
+    """
+
+    def __init__(self, **kwargs):
+        set_attribute = object.__setattr__
+        field_names = self._field_names
+        renamed = self.RENAMED
+        extra = None
+
+        for key, value in kwargs.items():
+            if renamed:
+                key = renamed.get(key, key)
+
+            if key in field_names:
+                set_attribute(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+
+        # most entities have no unknown fields, do not allocate a dictionary for them
+        set_attribute(self, "_extra", extra)
+        set_attribute(self, "_identity_map", None)
+
+    def merge(self, data: dict, newer: bool = False):
+        """
+        Sets the fields of the json data that are not set on the object yet. If the data is newer than the object the
+        fields that are set are overwritten as well, if both have an ``updated_at`` the later one is newer
+
+        :param data: Json data of the entity
+        :param newer: If the data is newer than the object, if there are no ``updated_at`` values to compare (e.g. it
+            is from a later response) (default ``False``)
+
+        :type data: dict
+        :type newer: bool
+        """
+        renamed = self.RENAMED
+
+        updated_at = data.get("updated_at", None)
+        if updated_at is not None and self._is_set("updated_at") and self.updated_at is not None:
+            overwrite = self._is_newer(updated_at)
+        else:
+            overwrite = newer
+
+        for key, value in data.items():
+            if renamed:
+                key = renamed.get(key, key)
+
+            if overwrite or not self._is_set(key):
+                setattr(self, key, value)
+
+    def _is_newer(self, updated_at) -> bool:
+        """
+        Returns if a timestamp is later than the ``updated_at`` of the object (``False`` if one of them is missing)
+        """
+        if updated_at is None or not self._is_set("updated_at") or self.updated_at is None:
+            return False
+
+        from moco_wrapper.util.coercion.parsers import parse_datetime
+
+        try:
+            if isinstance(updated_at, str):
+                updated_at = parse_datetime(updated_at)
+
+            current = self.updated_at
+            if isinstance(current, str):
+                current = parse_datetime(current)
+
+            return updated_at > current
+        except (TypeError, ValueError):
+            return False
+
+    def _is_set(self, name) -> bool:
+        """
+        Returns if a field is set, without converting a nested entity
+        """
+        if name in self._field_names:
+            descriptor = getattr(type(self), name)
+            if isinstance(descriptor, NestedField):
+                descriptor = descriptor.slot
+
+            try:
+                descriptor.__get__(self, type(self))
+            except AttributeError:
+                return False
+
+            return True
+
+        return self._extra is not None and name in self._extra
+
+    def __getattr__(self, name):
+        # only called if there is no (set) slot with that name
+        if name in ("_extra", "_identity_map"):
+            raise AttributeError(name)
+
+        extra = self._extra
+        if extra is not None and name in extra:
+            return extra[name]
+
+        raise AttributeError("'{}' object has no attribute '{}'".format(type(self).__name__, name))
+
+    def __setattr__(self, name, value):
+        if name in self._field_names or name in ("_extra", "_identity_map"):
+            object.__setattr__(self, name, value)
+            return
+
+        if self._extra is None:
+            object.__setattr__(self, "_extra", {})
+
+        self._extra[name] = value
+
+    def __delattr__(self, name):
+        if name in self._field_names:
+            object.__delattr__(self, name)
+        elif self._extra is not None and name in self._extra:
+            del self._extra[name]
+        else:
+            raise AttributeError(name)
+
+    def to_dict(self) -> dict:
+        """
+        Returns all fields of the object (declared and additional ones)
+
+        :returns: Dictionary of field name => value
+        :rtype: dict
+        """
+        result = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name not in ("_extra", "_identity_map") and hasattr(self, name):
+                    result[name] = getattr(self, name)
+
+        if self._extra is not None:
+            result.update(self._extra)
+
+        return result
+
+    @property
+    def __dict__(self):
+        """
+        Dictionary of all fields (a copy, see :meth:`to_dict`), kept for compatibility with code using ``vars()``
+        """
+        return self.to_dict()
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "_extra", None)
+        object.__setattr__(self, "_identity_map", None)
+        for key, value in state.items():
+            setattr(self, key, value)
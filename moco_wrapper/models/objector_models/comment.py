@@ -1,15 +1,11 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class Comment(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
 
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            u = obj.User(**kwargs["user"])
-            nk["user"] = u
+class Comment(BaseObjectorModel):
+    FIELDS = (
+        "id", "commentable_id", "commentable_type", "text", "manual", "user", "created_at", "updated_at"
+    )
 
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    NESTED = {
+        "user": "User"
+    }
@@ -1,14 +1,21 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
 
-class Company(object):
-    def __init__(self, **kwargs):
+class Company(BaseObjectorModel):
+    FIELDS = (
+        "id", "type", "name", "identifier", "website", "email", "billing_email_cc", "phone", "fax", "address",
+        "country_code", "vat_identifier", "customer_vat", "intern", "billing_tax", "billing_vat",
+        "billing_notes", "currency", "custom_rates", "include_time_report", "default_invoice_due_days",
+        "default_discount", "default_cash_discount", "default_cash_discount_days", "iban",
+        "english_correspondence_language", "tags", "labels", "user", "projects", "info", "footer",
+        "custom_properties", "created_at", "updated_at"
+    )
 
-        nk = kwargs
+    NESTED = {
+        "user": "User"
+    }
 
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            u =  obj.User(**kwargs["user"])
-            nk["user"] = u
-
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    DTYPES = {
+        "id": "int",
+        "type": "moco_wrapper.models.company.CompanyType"
+    }
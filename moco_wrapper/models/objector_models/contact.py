@@ -1,15 +1,13 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class Contact(object):
-    def __init__(self, **kwargs):
 
-        nk = kwargs
+class Contact(BaseObjectorModel):
+    FIELDS = (
+        "id", "gender", "firstname", "lastname", "title", "job_position", "mobile_phone", "work_fax",
+        "work_phone", "work_email", "work_address", "home_email", "home_address", "birthday", "salutation",
+        "info", "avatar_url", "tags", "custom_properties", "company", "user", "created_at", "updated_at"
+    )
 
-        if "company" in kwargs.keys() and kwargs["company"] is not None:
-            c = obj.Company(**kwargs["company"])
-            nk["company"] = c
-
-
-
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    NESTED = {
+        "company": "Company"
+    }
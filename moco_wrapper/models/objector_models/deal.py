@@ -1,22 +1,22 @@
-from moco_wrapper.models import objector_models as obj
-
-
-class Deal(object):
-    def __init__(self, **kwargs):
-
-        nk = kwargs
-
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            u = obj.User(**kwargs["user"])
-            nk["user"] = u
-
-        if "category" in kwargs.keys() and kwargs["category"] is not None:
-            cat = obj.DealCategory(**kwargs["category"])
-            nk["category"] = cat
-
-        if "company" in kwargs.keys() and kwargs["company"] is not None:
-            com = obj.Company(**kwargs["company"])
-            nk["company"] = com
-
-
-        self.__dict__.update(nk)
+from .base import BaseObjectorModel
+
+
+class Deal(BaseObjectorModel):
+    FIELDS = (
+        "id", "name", "status", "reminder_date", "closed_on", "money", "currency", "info", "tags",
+        "custom_properties", "user", "person", "customer", "company", "category", "created_at", "updated_at"
+    )
+
+    NESTED = {
+        "user": "User",
+        "category": "DealCategory",
+        "company": "Company"
+    }
+
+    DTYPES = {
+        "id": "int",
+        "reminder_date": "date",
+        "closed_on": "date",
+        "money": "decimal",
+        "status": "moco_wrapper.models.deal.DealStatus"
+    }
@@ -1,4 +1,7 @@
-class DealCategory(object):
-    def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
-        
\ No newline at end of file
+from .base import BaseObjectorModel
+
+
+class DealCategory(BaseObjectorModel):
+    FIELDS = (
+        "id", "name", "probability", "created_at", "updated_at"
+    )
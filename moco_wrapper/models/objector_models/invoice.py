@@ -1,9 +1,37 @@
-class Invoice(object):
-    def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
+from .base import BaseObjectorModel
+
+
+class Invoice(BaseObjectorModel):
+    FIELDS = (
+        "id", "customer_id", "project_id", "identifier", "date", "due_date", "service_period",
+        "service_period_from", "service_period_to", "status", "reversed", "reversal_invoice_id", "reversal",
+        "reversed_invoice_id", "title", "recipient_address", "currency", "net_total", "tax", "vat", "gross_total",
+        "discount", "cash_discount", "cash_discount_days", "debit_number", "credit_number", "locked", "salutation",
+        "footer", "items", "payments", "reminders", "internal_contact", "custom_properties", "tags", "created_at",
+        "updated_at", "created_on", "updated_on"
+    )
+
+    DTYPES = {
+        "id": "int",
+        "customer_id": "int",
+        "project_id": "int",
+        "date": "date",
+        "due_date": "date",
+        "service_period_from": "date",
+        "service_period_to": "date",
+        "net_total": "decimal",
+        "tax": "float",
+        "vat": "float",
+        "gross_total": "decimal",
+        "discount": "float",
+        "cash_discount": "float",
+        "status": "moco_wrapper.models.invoice.InvoiceStatus"
+    }
 
 
 class InvoiceEmail(object):
+    __slots__ = ("subject", "text", "emails_to", "emails_cc", "emails_bcc")
+
     def __init__(self, subject, text, emails_to, emails_cc, emails_bcc):
         self.subject = subject
         self.text = text
@@ -1,16 +1,19 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
 
-class InvoicePayment(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
+class InvoicePayment(BaseObjectorModel):
+    FIELDS = (
+        "id", "date", "invoice", "paid_total", "paid_total_in_account_currency", "currency", "created_at",
+        "updated_at"
+    )
 
-        if "invoice" in kwargs.keys() and kwargs["invoice"] is not None:
-            i = obj.Invoice(**kwargs["invoice"])
-            nk["invoice"] = i
+    NESTED = {
+        "invoice": "Invoice"
+    }
 
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    DTYPES = {
+        "id": "int",
+        "date": "date",
+        "paid_total": "decimal",
+        "paid_total_in_account_currency": "decimal"
+    }
@@ -1,19 +1,27 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class Offer(object):
-    def __init__(self, **kwargs):
 
-        nk = kwargs
-        if "project" in kwargs.keys() and kwargs["project"] is not None:
-            p = obj.Project(**kwargs["project"])
-            nk["project"] = p
+class Offer(BaseObjectorModel):
+    FIELDS = (
+        "id", "identifier", "date", "due_date", "title", "recipient_address", "currency", "net_total", "tax",
+        "vat", "gross_total", "discount", "status", "salutation", "footer", "items", "tags",
+        "custom_properties", "company", "project", "deal", "internal_contact", "created_at", "updated_at",
+        "created_on", "updated_on"
+    )
 
-        if "deal" in kwargs.keys() and kwargs["deal"] is not None:
-            d = obj.Deal(**kwargs["deal"])
-            nk["deal"] = d
+    NESTED = {
+        "project": "Project",
+        "deal": "Deal",
+        "company": "Company"
+    }
 
-        if "company" in kwargs.keys() and kwargs["company"] is not None:
-            c = obj.Company(**kwargs["company"])
-            nk["company"] = c
-
-        self.__dict__.update(nk)
+    DTYPES = {
+        "id": "int",
+        "date": "date",
+        "due_date": "date",
+        "net_total": "decimal",
+        "tax": "float",
+        "gross_total": "decimal",
+        "discount": "float",
+        "status": "moco_wrapper.models.offer.OfferStatus"
+    }
@@ -1,16 +1,20 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
 
-class PlanningEntry(object):
-    def __init__(self, **kwargs):
-        nk = kwargs
+class PlanningEntry(BaseObjectorModel):
+    FIELDS = (
+        "id", "title", "starts_on", "ends_on", "hours_per_day", "comment", "symbol", "color", "read_only",
+        "user", "project", "series_id", "created_at", "updated_at"
+    )
 
-        if "project" in kwargs.keys() and kwargs["project"] is not None:
-            p = obj.Project(**kwargs["project"])
-            nk["project"] = p
+    NESTED = {
+        "project": "Project",
+        "user": "User"
+    }
 
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            u = obj.User(**kwargs["user"])
-            nk["user"] = u
-
-        self.__dict__.update(nk)
+    DTYPES = {
+        "id": "int",
+        "starts_on": "date",
+        "ends_on": "date",
+        "hours_per_day": "float"
+    }
@@ -1,34 +1,31 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class Project(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
 
-        if "customer" in kwargs.keys() and kwargs["customer"] is not None:
-            c = obj.Company(**kwargs["customer"])
-            nk["customer"] = c
+class Project(BaseObjectorModel):
+    FIELDS = (
+        "id", "identifier", "name", "active", "billable", "fixed_price", "finish_date", "currency",
+        "billing_variant", "billing_address", "billing_email_to", "billing_email_cc", "billing_notes",
+        "setting_include_time_report", "budget", "budget_expenses", "hourly_rate", "info", "color", "tags",
+        "labels", "custom_properties", "leader", "co_leader", "customer", "customer_name", "deal", "tasks",
+        "contracts", "created_at", "updated_at"
+    )
 
-        if "leader" in kwargs.keys() and kwargs["leader"] is not None:
-            u = obj.User(**kwargs["leader"])
-            nk["leader"] = u
+    NESTED = {
+        "customer": "Company",
+        "leader": "User",
+        "contracts": "ProjectContract",
+        "tasks": "ProjectTask",
+        "deal": "Deal"
+    }
 
-        if "contracts" in kwargs.keys() and kwargs["contracts"] is not None:
-            items = []
-            for c in kwargs["contracts"]:
-                items.append(obj.ProjectContract(**c))
-            nk["contracts"] = items
-
-        if "tasks" in kwargs.keys() and kwargs["tasks"] is not None:
-            items = []
-            for t in kwargs["tasks"]:
-                items.append(obj.ProjectTask(**t))
-            nk["tasks"] = items
-
-        if "deal" in kwargs.keys() and kwargs["deal"] is not None:
-            d = obj.Deal(**kwargs["deal"])
-            nk["deal"] = d
-
-        self.__dict__.update(nk)
+    DTYPES = {
+        "id": "int",
+        "active": "bool",
+        "billable": "bool",
+        "fixed_price": "bool",
+        "finish_date": "date",
+        "budget": "decimal",
+        "budget_expenses": "decimal",
+        "hourly_rate": "decimal",
+        "billing_variant": "moco_wrapper.models.project.ProjectBillingVariant"
+    }
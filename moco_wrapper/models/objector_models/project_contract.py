@@ -1,7 +1,8 @@
-class ProjectContract(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        self.__dict__.update(kwargs)
-        
\ No newline at end of file
+from .base import BaseObjectorModel
+
+
+class ProjectContract(BaseObjectorModel):
+    FIELDS = (
+        "id", "user_id", "firstname", "lastname", "billable", "active", "budget", "hourly_rate", "created_at",
+        "updated_at"
+    )
@@ -1,19 +1,28 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class ProjectExpense(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
-        
-        if "project" in kwargs.keys() and kwargs["project"] is not None:
-            p = obj.Project(**kwargs["project"])
-            nk["project"] = p
 
-        if "company" in kwargs.keys() and kwargs["company"] is not None:
-            c = obj.Company(**kwargs["company"])
-            nk["company"] = c
+class ProjectExpense(BaseObjectorModel):
+    FIELDS = (
+        "id", "date", "title", "description", "quantity", "unit", "unit_price", "unit_cost", "price", "cost",
+        "currency", "budget_relevant", "billable", "billed", "service_period", "service_period_from",
+        "service_period_to", "file_url", "custom_properties", "company", "project", "purchase_id",
+        "purchase_item_id", "created_at", "updated_at"
+    )
 
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    NESTED = {
+        "project": "Project",
+        "company": "Company"
+    }
+
+    DTYPES = {
+        "id": "int",
+        "date": "date",
+        "quantity": "float",
+        "unit_price": "decimal",
+        "unit_cost": "decimal",
+        "price": "decimal",
+        "cost": "decimal",
+        "budget_relevant": "bool",
+        "billable": "bool",
+        "billed": "bool"
+    }
@@ -1,16 +1,11 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class ProjectPaymentSchedule(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
 
-        if "project" in kwargs.keys() and kwargs["project"] is not None:
-            p = obj.Project(**kwargs["project"])
-            nk["project"] = p
+class ProjectPaymentSchedule(BaseObjectorModel):
+    FIELDS = (
+        "id", "date", "title", "net_total", "project", "checked", "billed", "created_at", "updated_at"
+    )
 
-
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    NESTED = {
+        "project": "Project"
+    }
@@ -1,7 +1,9 @@
-class ProjectRecurringExpense(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        self.__dict__.update(kwargs)
-        
\ No newline at end of file
+from .base import BaseObjectorModel
+
+
+class ProjectRecurringExpense(BaseObjectorModel):
+    FIELDS = (
+        "id", "start_date", "finish_date", "recur_next_date", "period", "title", "description", "quantity",
+        "unit", "unit_price", "unit_cost", "price", "cost", "currency", "budget_relevant", "billable",
+        "service_period_direction", "custom_properties", "project", "created_at", "updated_at"
+    )
@@ -1,6 +1,14 @@
 from moco_wrapper.models import objector_models as obj
 
-class ProjectReport(object):
+from .base import BaseObjectorModel
+
+
+class ProjectReport(BaseObjectorModel):
+    FIELDS = (
+        "budget_total", "budget_progress_in_percentage", "budget_remaining", "invoiced_total", "currency",
+        "hours_total", "hours_billable", "hours_remaining", "costs_expenses", "costs_activities", "costs_by_task"
+    )
+
     def __init__(
         self,
         **kwargs
@@ -13,5 +21,4 @@ class ProjectReport(object):
                 items.append(obj.Task(**t))
             nk["cost_by_task"] = items
 
-        self.__dict__.update(nk)
-            
\ No newline at end of file
+        super(ProjectReport, self).__init__(**nk)
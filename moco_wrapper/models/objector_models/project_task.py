@@ -1,4 +1,7 @@
-class ProjectTask(object):
-    def __init__(self, **kwargs):
-        self.__dict__.update(kwargs)
-        
\ No newline at end of file
+from .base import BaseObjectorModel
+
+
+class ProjectTask(BaseObjectorModel):
+    FIELDS = (
+        "id", "name", "billable", "active", "budget", "hourly_rate", "created_at", "updated_at"
+    )
@@ -1,17 +1,25 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class Purchase(object):
-    def __init__(
-        self,
-        **kwargs
-        ):
 
-        nk = kwargs
+class Purchase(BaseObjectorModel):
+    FIELDS = (
+        "id", "identifier", "receipt_identifier", "title", "info", "iban", "reference", "date", "due_date",
+        "service_period_from", "service_period_to", "status", "payment_method", "net_total", "gross_total",
+        "currency", "file_url", "custom_properties", "tags", "company", "user", "items", "payments",
+        "created_at", "updated_at"
+    )
 
-        if "company" in kwargs.keys() and kwargs["company"] is not None:
-            nk["company"] = obj.Company(**kwargs["company"]) 
+    NESTED = {
+        "company": "Company",
+        "user": "User"
+    }
 
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            nk["user"] = obj.User(**kwargs["user"])
-
-        self.__dict__.update(nk)
\ No newline at end of file
+    DTYPES = {
+        "id": "int",
+        "date": "date",
+        "due_date": "date",
+        "net_total": "decimal",
+        "gross_total": "decimal",
+        "status": "moco_wrapper.models.purchase.PurchaseStatus",
+        "payment_method": "moco_wrapper.models.purchase.PurchasePaymentMethod"
+    }
@@ -1,9 +1,7 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
 
-class PurchaseCategory(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        self.__dict__.update(kwargs)
+class PurchaseCategory(BaseObjectorModel):
+    FIELDS = (
+        "id", "name", "credit_account", "active", "created_at", "updated_at"
+    )
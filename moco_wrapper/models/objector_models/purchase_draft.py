@@ -1,15 +1,11 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
 
-class PurchaseDraft(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
+class PurchaseDraft(BaseObjectorModel):
+    FIELDS = (
+        "id", "title", "email_from", "email_body", "user", "file_url", "created_at", "updated_at"
+    )
 
-        if "user" in kwargs.keys():
-            u = obj.User(**kwargs["user"]);
-            nk["user"] = u
-
-        self.__dict__.update(nk)
+    NESTED = {
+        "user": "User"
+    }
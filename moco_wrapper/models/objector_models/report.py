@@ -1,7 +1,15 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
 
-class Report(object):
+class Report(BaseObjectorModel):
+    FIELDS = (
+        "user", "total_vacation_days", "used_vacation_days", "planned_vacation_days", "sickdays"
+    )
+
+    NESTED = {
+        "user": "User"
+    }
+
     def __init__(
         self,
         user,
@@ -10,8 +18,10 @@ class Report(object):
         planned_vacation_days,
         sickdays,
     ):
-        self.user = obj.User(**user)
-        self.total_vacation_days = total_vacation_days
-        self.used_vacation_days = used_vacation_days
-        self.planned_vacation_days = planned_vacation_days
-        self.sickdays = sickdays
+        super(Report, self).__init__(
+            user=user,
+            total_vacation_days=total_vacation_days,
+            used_vacation_days=used_vacation_days,
+            planned_vacation_days=planned_vacation_days,
+            sickdays=sickdays
+        )
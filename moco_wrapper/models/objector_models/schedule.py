@@ -1,26 +1,18 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class Schedule(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
 
-        if "assignment" in kwargs.keys() and kwargs["assignment"] is not None:
-            a = ScheduleAssignment(**kwargs["assignment"])
-            nk["assignment"] = a
+class ScheduleAssignment(BaseObjectorModel):
+    FIELDS = (
+        "id", "name", "customer_name", "color", "type"
+    )
 
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            u = obj.User(**kwargs["user"])
-            nk["user"] = u
 
-        self.__dict__.update(nk)
+class Schedule(BaseObjectorModel):
+    FIELDS = (
+        "id", "date", "comment", "am", "pm", "symbol", "assignment", "user", "created_at", "updated_at"
+    )
 
-class ScheduleAssignment(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        self.__dict__.update(kwargs)
-        
\ No newline at end of file
+    NESTED = {
+        "assignment": ScheduleAssignment,
+        "user": "User"
+    }
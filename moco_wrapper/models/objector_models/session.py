@@ -1,4 +1,6 @@
 class SessionAuthentication(object):
+    __slots__ = ("api_key", "user_id")
+
     def __init__(
         self,
         api_key,
@@ -15,6 +17,7 @@ class SessionAuthentication(object):
 
 
 class SessionVerification(object):
+    __slots__ = ("id", "uuid")
 
     def __init__(
         self,
@@ -1,18 +1,11 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
 
-class Unit(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
+class Unit(BaseObjectorModel):
+    FIELDS = (
+        "id", "name", "custom_properties", "users", "created_at", "updated_at"
+    )
 
-        if "users" in kwargs.keys() and kwargs["users"] is not None:
-            items = []
-            for u in kwargs["users"]:
-                items.append(obj.User(**u))
-            nk["users"] = items
-
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    NESTED = {
+        "users": "User"
+    }
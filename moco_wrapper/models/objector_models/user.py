@@ -1,28 +1,25 @@
-from moco_wrapper.models import objector_models as obj
-from datetime import date
+from .base import BaseObjectorModel
 
 
-class User(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-
-        nk = kwargs
-        if "unit" in kwargs.keys():
-            u = obj.Unit(**kwargs["unit"])
+class User(BaseObjectorModel):
+    FIELDS = (
+        "id", "firstname", "lastname", "name", "email", "active", "extern", "mobile_phone", "work_phone",
+        "home_address", "info", "birthday", "iban", "avatar_url", "tags", "custom_properties", "unit", "created_at",
+        "updated_at"
+    )
 
-            del nk["unit"]
-            nk["unit"] = u
+    NESTED = {
+        "unit": "Unit"
+    }
 
-        if "bday" in nk.keys():
-            nk["birthday"] = nk["bday"]
-            del nk["bday"]
-
-        self.__dict__.update(nk)
+    RENAMED = {
+        "bday": "birthday"
+    }
 
 
 class UserPerformanceReport(object):
+    __slots__ = ("annually", "monthly")
+
     def __init__(
         self,
         **kwargs
@@ -44,6 +41,9 @@ class UserPerformanceReport(object):
 
 
 class AnnualUserPerformance(object):
+    __slots__ = ("year", "employment_hours", "target_hours", "hours_tracked_total", "variation",
+                 "variation_until_today")
+
     def __init__(
         self,
         year: int,
@@ -74,6 +74,8 @@ class AnnualUserPerformance(object):
 
 
 class MonthlyUserPerformance(object):
+    __slots__ = ("year", "month", "target_hours", "hours_tracked_total", "variation")
+
     def __init__(
         self,
         year: int,
@@ -1,23 +1,23 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class UserEmployment(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
 
-        if "from" in kwargs.keys():
-            nk["from_date"] = kwargs["from"]
-            del nk["from"]
+class UserEmployment(BaseObjectorModel):
+    FIELDS = (
+        "id", "weekly_target_hours", "pattern", "from_date", "to_date", "user", "created_at", "updated_at"
+    )
 
-        if "to" in kwargs.keys():
-            nk["to_date"] = kwargs["to"]
-            del nk["to"]
+    NESTED = {
+        "user": "User"
+    }
 
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            u = obj.User(**kwargs["user"])
-            nk["user"] = u
+    RENAMED = {
+        "from": "from_date",
+        "to": "to_date"
+    }
 
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    DTYPES = {
+        "id": "int",
+        "weekly_target_hours": "float",
+        "from_date": "date",
+        "to_date": "date"
+    }
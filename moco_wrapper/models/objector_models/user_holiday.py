@@ -1,16 +1,11 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
 
-class UserHoliday(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
+class UserHoliday(BaseObjectorModel):
+    FIELDS = (
+        "id", "year", "title", "days", "hours", "user", "created_at", "updated_at"
+    )
 
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            u = obj.User(**kwargs["user"])
-            nk["user"] = u
-
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    NESTED = {
+        "user": "User"
+    }
@@ -1,24 +1,16 @@
-from moco_wrapper.models import objector_models as obj
+from .base import BaseObjectorModel
 
-class UserPresence(object):
-    def __init__(
-        self,
-        **kwargs
-    ):
-        nk = kwargs
 
-        if "from" in kwargs.keys():
-            nk["from_time"] = kwargs["from"]
-            del nk["from"]
+class UserPresence(BaseObjectorModel):
+    FIELDS = (
+        "id", "date", "from_time", "to_time", "is_home_office", "user", "created_at", "updated_at"
+    )
 
-        if "to" in kwargs.keys():
-            nk["to_time"] = kwargs["to"]
-            del nk["to"]
+    NESTED = {
+        "user": "User"
+    }
 
-        if "user" in kwargs.keys() and kwargs["user"] is not None:
-            u = obj.User(**kwargs["user"])
-            nk["user"] = u
-
-
-        self.__dict__.update(nk)
-        
\ No newline at end of file
+    RENAMED = {
+        "from": "from_time",
+        "to": "to_time"
+    }
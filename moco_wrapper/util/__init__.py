@@ -6,9 +6,31 @@ __author__ = """Sommalia"""
 __email__ = 'sommalia@protonmail.com'
 __version__ = '0.10.0'
 
-from . import generator
+import sys
+from importlib import import_module
+
 from . import requestor
 from . import objector
 from . import response
 from . import endpoint
-from . import io
+from . import limiter
+from . import instrumentation
+from . import tracing
+
+_LAZY_SUBMODULES = ("generator", "io", "cache", "columnar", "coercion", "mirror", "bulk", "fake_server")
+"""
+Subpackages that are imported on first access, they are not needed for making requests
+"""
+
+
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return import_module("." + name, __name__)
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # module level __getattr__ needs python 3.7, older versions import everything up front
+    for _name in _LAZY_SUBMODULES:
+        import_module("." + _name, __name__)
@@ -0,0 +1 @@
+from .executor import BulkOperation, BulkResult, BulkReport, BulkExecutor
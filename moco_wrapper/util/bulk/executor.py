@@ -0,0 +1,462 @@
+import asyncio
+import collections
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+from moco_wrapper.exceptions import MocoException, UnprocessableException
+from moco_wrapper.util.response import ListResponse, ErrorResponse
+
+
+class BulkOperation(object):
+    """
+    Single request of a bulk run, addressed by endpoint slug like the request methods of :class:`moco_wrapper.Moco`
+
+    .. code-block:: python
+
+        from moco_wrapper.util.bulk import BulkOperation
+
+        BulkOperation("activity_create", data={"date": "2020-01-31", "project_id": 1, "task_id": 2, "hours": 1.5})
+    """
+
+    __slots__ = ("slug", "ep_params", "params", "data")
+
+    def __init__(self, slug: str, ep_params: dict = None, params: dict = None, data: dict = None):
+        """
+        Class constructor
+
+        :param slug: Endpoint slug (e.g. ``activity_create``)
+        :param ep_params: Url parameters of the endpoint (default ``None``)
+        :param params: Query string parameters (default ``None``)
+        :param data: Dictionary with data (http body) (default ``None``)
+
+        :type slug: str
+        :type ep_params: dict
+        :type params: dict
+        :type data: dict
+        """
+        self.slug = slug
+        self.ep_params = ep_params
+        self.params = params
+        self.data = data
+
+    def __repr__(self):
+        return "<BulkOperation, Endpoint: {}>".format(self.slug)
+
+
+class BulkResult(object):
+    """
+    Outcome of a single operation of a bulk run
+    """
+
+    __slots__ = ("index", "operation", "response", "data", "exception")
+
+    def __init__(self, index: int, operation, response=None, data=None, exception: Exception = None):
+        self.index = index
+        """
+        Position of the operation in the operations of the run
+        """
+
+        self.operation = operation
+        """
+        The operation (:class:`BulkOperation` or callable)
+        """
+
+        self.response = response
+        """
+        Response of the request (for operations merged into a bulk endpoint the response of the bulk request)
+        """
+
+        self.data = data
+        """
+        Converted result of the operation (e.g. the created object)
+        """
+
+        self.exception = exception
+        """
+        Exception the operation failed with, ``None`` if it succeeded
+        """
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns whether the operation succeeded
+
+        :type: bool
+        """
+        return self.exception is None
+
+    def __repr__(self):
+        return "<BulkResult, Index: {}, Ok: {}>".format(self.index, self.ok)
+
+
+class BulkReport(object):
+    """
+    Results of all operations of a bulk run, in the order of the operations
+    """
+
+    def __init__(self, results: list):
+        self.results = results
+
+    @property
+    def succeeded(self) -> list:
+        """
+        Results of the operations that succeeded
+
+        :type: list
+        """
+        return [x for x in self.results if x.ok]
+
+    @property
+    def failed(self) -> list:
+        """
+        Results of the operations that failed
+
+        :type: list
+        """
+        return [x for x in self.results if not x.ok]
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns whether all operations succeeded
+
+        :type: bool
+        """
+        return all(x.ok for x in self.results)
+
+    def raise_for_errors(self):
+        """
+        Raises the exception of the first failed operation (if there is one)
+        """
+        for result in self.results:
+            if not result.ok:
+                raise result.exception
+
+    def __iter__(self):
+        return iter(self.results)
+
+    def __len__(self):
+        return len(self.results)
+
+    def __getitem__(self, index):
+        return self.results[index]
+
+    def __str__(self):
+        return "<BulkReport, Operations: {}, Failed: {}>".format(len(self.results), len(self.failed))
+
+
+def _expense_group(operation):
+    return operation.ep_params["project_id"],
+
+
+def _expense_request(operations):
+    return {"project_id": operations[0].ep_params["project_id"]}, {"bulk_data": [x.data for x in operations]}
+
+
+def _payment_group(operation):
+    return ()
+
+
+def _payment_request(operations):
+    return None, {"bulk_data": [x.data for x in operations]}
+
+
+def _comment_group(operation):
+    if "attachment_content" in operation.data:
+        return None  # attachments can not be created in bulk
+
+    return operation.data["commentable_type"], operation.data["text"]
+
+
+def _comment_request(operations):
+    data = {
+        "commentable_ids": [x.data["commentable_id"] for x in operations],
+        "commentable_type": operations[0].data["commentable_type"],
+        "text": operations[0].data["text"]
+    }
+
+    return None, data
+
+
+class BulkExecutor(object):
+    """
+    Runs many write operations (creates, updates, deletes) on a pool of threads.
+
+    Every operation gets its own :class:`BulkResult`, failing operations do not stop the run. Operations of endpoints
+    that have a native bulk endpoint (see :attr:`BULK_ENDPOINTS`) are merged into bulk requests of up to
+    ``batch_size`` operations. If the api rejects a bulk request as invalid (``422``), its operations are sent one by
+    one, so every result carries the outcome of its own operation. Other errors fail all operations of the bulk
+    request, they are not sent again (the api might have applied the request already). All requests go through the requestor of the moco instance, so its rate limiter and
+    retry policy apply to them.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.bulk import BulkOperation
+
+        m = Moco(auth={..})
+
+        report = m.bulk(
+            (BulkOperation("activity_create", data=row) for row in rows),
+            max_workers=8
+        )
+
+        for result in report.failed:
+            print(result.index, result.exception)
+
+    Operations can also be callables, e.g. ``functools.partial(m.Activity.create, ...)``, these are called on the
+    pool as they are.
+    """
+
+    BULK_ENDPOINTS = {
+        "project_expense_create": ("project_expense_create_bulk", _expense_group, _expense_request),
+        "invoice_payment_create": ("invoice_payment_create_bulk", _payment_group, _payment_request),
+        "comment_create": ("comment_create_bulk", _comment_group, _comment_request),
+    }
+    """
+    Endpoints whose operations can be merged into a bulk request (slug => bulk endpoint slug, function returning
+    the group of an operation (``None`` if it can not be merged) and function creating the url parameters and data
+    of the bulk request of a group)
+    """
+
+    def __init__(self, moco, max_workers: int = 4, batch_size: int = 100, use_bulk_endpoints: bool = True):
+        """
+        Class constructor
+
+        :param moco: Moco instance the requests are sent with
+        :param max_workers: Number of requests that are sent concurrently (default ``4``)
+        :param batch_size: Maximum number of operations merged into one bulk request (default ``100``)
+        :param use_bulk_endpoints: If operations should be merged into bulk requests (default ``True``)
+
+        :type max_workers: int
+        :type batch_size: int
+        :type use_bulk_endpoints: bool
+        """
+        self.moco = moco
+        self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.use_bulk_endpoints = use_bulk_endpoints
+
+    def run(self, operations) -> BulkReport:
+        """
+        Runs the operations
+
+        :param operations: Iterable of :class:`BulkOperation` objects or callables, it is consumed while the
+            operations are running, so it can be a generator
+
+        :returns: Results of all operations
+        :rtype: :class:`BulkReport`
+        """
+        results = []
+        pending = collections.deque()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                for batch in self.batches(operations):
+                    pending.append(executor.submit(self.run_batch, batch))
+
+                    # bound the number of batches that are waiting, the operations may be a long generator
+                    while len(pending) >= self.max_workers * 2:
+                        results.extend(pending.popleft().result())
+
+                while pending:
+                    results.extend(pending.popleft().result())
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        results.sort(key=lambda x: x.index)
+
+        return BulkReport(results)
+
+    def batches(self, operations):
+        """
+        Groups the operations into the batches they are sent in
+
+        :param operations: Iterable of operations
+
+        :returns: Generator yielding lists of ``(index, operation)`` tuples, batches with more than one operation are
+            sent as one bulk request
+        """
+        groups = {}
+
+        for index, operation in enumerate(operations):
+            group = self._group(operation)
+            if group is None:
+                yield [(index, operation)]
+                continue
+
+            batch = groups.setdefault(group, [])
+            batch.append((index, operation))
+
+            if len(batch) >= self.batch_size:
+                del groups[group]
+                yield batch
+
+        for batch in groups.values():
+            yield batch
+
+    def run_batch(self, batch) -> list:
+        """
+        Sends the request of a batch, the operations of a bulk request that was rejected as invalid are sent one by one
+
+        :param batch: List of ``(index, operation)`` tuples (see :meth:`batches`)
+
+        :returns: List of :class:`BulkResult`
+        :rtype: list
+        """
+        try:
+            response = self._check(self._call(self._batch_operation(batch)))
+        except (Exception, MocoException) as ex:
+            if len(batch) > 1 and isinstance(ex, UnprocessableException):
+                # find the operations that made the bulk request invalid
+                return [result for item in batch for result in self.run_batch([item])]
+
+            return [BulkResult(index, operation, exception=ex) for index, operation in batch]
+
+        return self._results(batch, response)
+
+    async def run_async(self, operations) -> BulkReport:
+        """
+        Runs the operations with a :class:`moco_wrapper.AsyncMoco` instance, at most ``max_workers`` requests are
+        sent concurrently
+
+        :param operations: Iterable of :class:`BulkOperation` objects or callables returning awaitables
+
+        :returns: Results of all operations
+        :rtype: :class:`BulkReport`
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        async def run_batch(batch):
+            async with semaphore:
+                return await self.run_batch_async(batch)
+
+        results = []
+        pending = collections.deque()
+        try:
+            for batch in self.batches(operations):
+                pending.append(asyncio.ensure_future(run_batch(batch)))
+
+                while len(pending) >= self.max_workers * 2:
+                    results.extend(await pending.popleft())
+
+            while pending:
+                results.extend(await pending.popleft())
+        finally:
+            for future in pending:
+                future.cancel()
+
+        results.sort(key=lambda x: x.index)
+
+        return BulkReport(results)
+
+    async def run_batch_async(self, batch) -> list:
+        """
+        Sends the request of a batch with a :class:`moco_wrapper.AsyncMoco` instance
+
+        .. seealso::
+
+            :meth:`run_batch`
+        """
+        try:
+            response = self._call(self._batch_operation(batch))
+            if inspect.isawaitable(response):
+                response = await response
+
+            response = self._check(response)
+        except (Exception, MocoException) as ex:
+            if len(batch) > 1 and isinstance(ex, UnprocessableException):
+                # find the operations that made the bulk request invalid
+                results = []
+                for item in batch:
+                    results.extend(await self.run_batch_async([item]))
+
+                return results
+
+            return [BulkResult(index, operation, exception=ex) for index, operation in batch]
+
+        return self._results(batch, response)
+
+    def _batch_operation(self, batch):
+        """
+        Returns the operation of a batch, the operations of a batch with more than one operation are merged into a
+        bulk request
+        """
+        if len(batch) == 1:
+            return batch[0][1]
+
+        operations = [x[1] for x in batch]
+        bulk_slug, _, bulk_request = self.BULK_ENDPOINTS[operations[0].slug]
+        ep_params, data = bulk_request(operations)
+
+        return BulkOperation(bulk_slug, ep_params=ep_params, data=data)
+
+    def _results(self, batch, response):
+        """
+        Creates the results of the operations of a batch from the response of its request
+        """
+        if len(batch) == 1:
+            index, operation = batch[0]
+            return [BulkResult(index, operation, response=response, data=getattr(response, "data", response))]
+
+        items = response.items if isinstance(response, ListResponse) else []
+        if len(items) != len(batch):
+            items = [None] * len(batch)  # the created objects can not be assigned to the operations
+
+        return [
+            BulkResult(index, operation, response=response, data=item)
+            for (index, operation), item in zip(batch, items)
+        ]
+
+    def _group(self, operation):
+        """
+        Returns the key of the bulk request group of an operation, ``None`` if it is sent on its own
+        """
+        if not self.use_bulk_endpoints or self.batch_size <= 1 or not isinstance(operation, BulkOperation):
+            return None
+
+        bulk_endpoint = self.BULK_ENDPOINTS.get(operation.slug, None)
+        if bulk_endpoint is None or operation.data is None:
+            return None
+
+        try:
+            group = bulk_endpoint[1](operation)
+        except (KeyError, TypeError):
+            return None  # incomplete operation, sent on its own to get the error of the api
+
+        if group is None:
+            return None
+
+        return (operation.slug, ) + group
+
+    def _call(self, operation):
+        """
+        Sends the request of a single operation (or calls it)
+        """
+        if isinstance(operation, BulkOperation):
+            ep = self.moco.endpoint_manager.get(operation.slug)
+            if ep is None:
+                raise ValueError("Unknown endpoint {}".format(operation.slug))
+
+            return self.moco.request_e(ep, ep_params=operation.ep_params, params=operation.params,
+                                       data=operation.data)
+
+        return operation()
+
+    @staticmethod
+    def _check(response):
+        """
+        Raises the exception of an error response that was not raised by the objector (e.g. the
+        :class:`moco_wrapper.util.objector.NoErrorObjector`)
+        """
+        if isinstance(response, ErrorResponse):
+            if isinstance(response.data, (Exception, MocoException)):
+                raise response.data
+
+            if response.response.status_code == 422:
+                raise UnprocessableException(response.response, response.data)
+
+            raise MocoException(response.response, response.data)
+
+        return response
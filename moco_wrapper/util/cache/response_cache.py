@@ -0,0 +1,289 @@
+import collections
+import threading
+import time
+
+from moco_wrapper.util.endpoint import Endpoint
+
+
+class ResponseCache(object):
+    """
+    Cache for the (converted) responses of read endpoints.
+
+    Responses are cached by endpoint slug, url and query parameters, impersonated user and api key. Only ``GET``
+    endpoints that have a time to live are cached. Whenever a mutating endpoint is called through the same
+    :class:`moco_wrapper.Moco` instance, all cached responses of related endpoints (endpoints whose url path starts
+    with the path of the mutating endpoint or the other way round, e.g. ``/users`` and ``/users/{id}``) are dropped.
+
+    When the cache holds more than ``maxsize`` responses, the least recently used ones are dropped.
+
+    With ``revalidate`` enabled, expired responses that came with an ``ETag`` or ``Last-Modified`` header are kept
+    and the next request for them is sent as a conditional request (``If-None-Match``/``If-Modified-Since``). If the
+    api answers with ``304 Not Modified``, the cached (already converted) response is returned and its time to live
+    starts again. A time to live of ``0`` revalidates the response on every request, which is useful for polling:
+
+    .. code-block:: python
+
+        cache = ResponseCache(
+            ttl={
+                "project_get": 0,
+                "invoice_get": 0
+            },
+            revalidate=True
+        )
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.cache import ResponseCache
+
+        cache = ResponseCache(
+            ttl={
+                "unit_getlist": 3600,
+                "user_getlist": 600,
+                "deal_category_getlist": 3600
+            },
+            maxsize=512
+        )
+
+        m = Moco(auth={..}, cache=cache)
+
+        m.Unit.getlist()  # sent to the api
+        m.Unit.getlist()  # returned from the cache
+
+    .. warning::
+
+        Cached responses are shared between callers, do not modify them.
+    """
+
+    def __init__(
+        self,
+        ttl: dict = None,
+        default_ttl: float = None,
+        maxsize: int = 1024,
+        revalidate: bool = False,
+        clock=time.monotonic
+    ):
+        """
+        Class constructor
+
+        :param ttl: Dictionary of time to live in seconds by endpoint slug (default ``None``)
+        :param default_ttl: Time to live in seconds of all other ``GET`` endpoints
+            (default ``None``, other endpoints are not cached)
+        :param maxsize: Maximum number of cached responses (default ``1024``)
+        :param revalidate: If expired responses are revalidated with conditional requests (default ``False``)
+        :param clock: Function returning the current time in seconds (default ``time.monotonic``)
+
+        :type ttl: dict
+        :type default_ttl: float
+        :type maxsize: int
+        :type revalidate: bool
+        """
+        self.ttl = ttl if ttl is not None else {}
+        self.default_ttl = default_ttl
+        self.maxsize = maxsize
+        self.revalidate = revalidate
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ttl_for(self, ep: Endpoint) -> float:
+        """
+        Returns the time to live of responses of an endpoint
+
+        :param ep: Endpoint
+
+        :type ep: :class:`moco_wrapper.util.endpoint.Endpoint`
+
+        :returns: Time to live in seconds, ``None`` if the endpoint is not cached
+        :rtype: float
+        """
+        if ep.method != "GET":
+            return None
+
+        return self.ttl.get(ep.slug, self.default_ttl)
+
+    def cacheable(self, ep: Endpoint) -> bool:
+        """
+        Returns if responses of an endpoint are cached
+
+        :param ep: Endpoint
+
+        :type ep: :class:`moco_wrapper.util.endpoint.Endpoint`
+
+        :returns: ``True`` if the endpoint has a time to live (or is revalidated on every request)
+        :rtype: bool
+        """
+        ttl = self.ttl_for(ep)
+        if ttl is None:
+            return False
+
+        return ttl > 0 or self.revalidate
+
+    def key(self, ep: Endpoint, ep_params: dict = None, params: dict = None, scope=None) -> tuple:
+        """
+        Creates the cache key of a request
+
+        :param ep: Endpoint
+        :param ep_params: Url parameters of the endpoint (default ``None``)
+        :param params: Query string parameters (default ``None``)
+        :param scope: Anything else the response depends on, e.g. domain, api key and impersonated user
+            (default ``None``)
+
+        :returns: Hashable cache key
+        :rtype: tuple
+        """
+        return (
+            ep.slug,
+            self._freeze(ep_params),
+            self._freeze(params),
+            scope
+        )
+
+    def get(self, key):
+        """
+        Returns a cached response
+
+        :param key: Cache key (see :meth:`key`)
+
+        :returns: Cached response, ``None`` if there is no response or it has expired
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return None
+
+            expires_at, group, value, validators = entry
+            if expires_at <= self._clock():
+                if not (self.revalidate and validators):
+                    del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def conditional_headers(self, key) -> dict:
+        """
+        Returns the headers that revalidate an expired response
+
+        :param key: Cache key (see :meth:`key`)
+
+        :returns: Dictionary with the ``If-None-Match`` and/or ``If-Modified-Since`` headers, ``None`` if there is
+            no response to revalidate
+        :rtype: dict
+        """
+        if not self.revalidate:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return None
+
+            return dict(entry[3]) or None
+
+    def refresh(self, key, ep: Endpoint):
+        """
+        Restarts the time to live of a response that the api reported as not modified
+
+        :param key: Cache key (see :meth:`key`)
+        :param ep: Endpoint the response belongs to
+
+        :type ep: :class:`moco_wrapper.util.endpoint.Endpoint`
+
+        :returns: Cached response, ``None`` if it was dropped in the meantime
+        """
+        with self._lock:
+            entry = self._entries.get(key, None)
+            if entry is None:
+                return None
+
+            expires_at, group, value, validators = entry
+            self._entries[key] = (self._clock() + (self.ttl_for(ep) or 0), group, value, validators)
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(self, key, ep: Endpoint, value):
+        """
+        Caches a response (if the endpoint has a time to live)
+
+        :param key: Cache key (see :meth:`key`)
+        :param ep: Endpoint the response belongs to
+        :param value: Response to cache
+
+        :type ep: :class:`moco_wrapper.util.endpoint.Endpoint`
+        """
+        if not self.cacheable(ep):
+            return
+
+        validators = self._validators(value) if self.revalidate else {}
+        if self.ttl_for(ep) <= 0 and not validators:
+            return  # would have to be requested again anyway
+
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl_for(ep), self._group(ep), value, validators)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, ep: Endpoint):
+        """
+        Drops all cached responses of endpoints related to the given endpoint
+
+        :param ep: (Mutating) endpoint
+
+        :type ep: :class:`moco_wrapper.util.endpoint.Endpoint`
+        """
+        group = self._group(ep)
+
+        with self._lock:
+            for key in [k for k, entry in self._entries.items() if self._related(group, entry[1])]:
+                del self._entries[key]
+
+    def clear(self):
+        """
+        Drops all cached responses
+        """
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _group(ep: Endpoint) -> tuple:
+        """
+        Returns the static parts of the url template of an endpoint (``/projects/{id}/tasks`` => ``(projects, tasks)``)
+        """
+        return tuple(x for x in ep.url_template.split("/") if x != "" and not x.startswith("{"))
+
+    @staticmethod
+    def _validators(value) -> dict:
+        """
+        Reads the validators (``ETag``, ``Last-Modified``) of a response into conditional request headers
+        """
+        headers = getattr(getattr(value, "response", None), "headers", None)
+        if headers is None:
+            return {}
+
+        validators = {}
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+
+        return validators
+
+    @staticmethod
+    def _related(first: tuple, second: tuple) -> bool:
+        length = min(len(first), len(second))
+        return first[:length] == second[:length]
+
+    @staticmethod
+    def _freeze(params):
+        if params is None:
+            return None
+
+        return tuple(sorted((key, repr(value)) for key, value in params.items()))
@@ -0,0 +1,2 @@
+from .parsers import parse_date, parse_datetime, to_decimal
+from .coercer import Coercer
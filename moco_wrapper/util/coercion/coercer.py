@@ -0,0 +1,155 @@
+from enum import Enum
+from importlib import import_module
+
+from .parsers import parse_date, parse_datetime, to_decimal
+
+
+class Coercer(object):
+    """
+    Converts the declared fields of json records into python types before they are turned into objector models.
+
+    The types are taken from the ``DTYPES`` of the objector models (see
+    :class:`moco_wrapper.models.objector_models.base.BaseObjectorModel`). All records of a response are converted
+    in one pass per field, nested entities (e.g. the ``project`` of an activity) are converted with the types of
+    their own model. Dates and timestamps are parsed with a cache, so a date that appears in many records is only
+    parsed once.
+
+    ============ ==================================================================
+    Type         Result
+    ============ ==================================================================
+    ``date``     :class:`datetime.date`
+    ``datetime`` :class:`datetime.datetime` (timezone aware)
+    ``decimal``  :class:`decimal.Decimal`
+    ``float``    :class:`float`
+    enum path    member of the enum (e.g. ``moco_wrapper.models.invoice.InvoiceStatus``)
+    ============ ==================================================================
+
+    Values that can not be converted (e.g. a status the enum does not know yet) are kept as they are.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.coercion import Coercer
+        from moco_wrapper.util.objector import DefaultObjector
+
+        m = Moco(auth={..}, objector=DefaultObjector(coercer=Coercer()))
+
+        invoice = m.Invoice.get(1).data
+        invoice.date        # datetime.date(2020, 1, 31)
+        invoice.net_total   # Decimal('1190.5')
+        invoice.status      # InvoiceStatus.PAID
+    """
+
+    PARSERS = {
+        "date": parse_date,
+        "datetime": parse_datetime,
+        "decimal": to_decimal,
+        "float": float,
+    }
+    """
+    Parsers by field type, types that are not listed here (and are no enum path) are not converted
+    """
+
+    def __init__(self, dtypes: dict = None):
+        """
+        Class constructor
+
+        :param dtypes: Types of fields by model name, in addition to (or overwriting) the ``DTYPES`` of the models
+            (e.g. ``{"Activity": {"hours": "decimal"}}``, default ``None``)
+
+        :type dtypes: dict
+        """
+        self.dtypes = dtypes if dtypes is not None else {}
+
+        self._plans = {}
+
+    def coerce(self, model, records: list) -> list:
+        """
+        Converts the fields of json records (in place)
+
+        :param model: Objector model class of the records
+        :param records: List of dictionaries
+
+        :type records: list
+
+        :returns: The converted records
+        :rtype: list
+        """
+        if model is None or len(records) == 0:
+            return records
+
+        fields, nested = self._plan(model)
+
+        for key, parser in fields:
+            for record in records:
+                value = record.get(key, None)
+                if value is None:
+                    continue
+
+                try:
+                    record[key] = parser(value)
+                except (ValueError, TypeError, AttributeError, ArithmeticError):
+                    pass  # keep the raw value
+
+        for key, nested_model in nested:
+            children = []
+            for record in records:
+                value = record.get(key, None)
+                if isinstance(value, dict):
+                    children.append(value)
+                elif isinstance(value, list):
+                    children.extend(x for x in value if isinstance(x, dict))
+
+            self.coerce(nested_model, children)
+
+        return records
+
+    def parser_for(self, dtype):
+        """
+        Returns the parser of a field type
+
+        :param dtype: Field type (e.g. ``date``) or dotted path of an enum class
+
+        :returns: Callable converting a json value, or ``None`` if the type is not converted
+        """
+        parser = self.PARSERS.get(dtype, None)
+        if parser is not None:
+            return parser
+
+        if isinstance(dtype, str) and "." in dtype:
+            module_path, class_name = dtype.rsplit(".", 1)
+            dtype = getattr(import_module(module_path), class_name)
+
+        if isinstance(dtype, type) and issubclass(dtype, Enum):
+            return dtype
+
+        return None
+
+    def _plan(self, model):
+        """
+        Returns the (json key, parser) pairs and the (json key, model) pairs of the nested entities of a model
+        """
+        plan = self._plans.get(model, None)
+        if plan is not None:
+            return plan
+
+        dtypes = dict(getattr(model, "DTYPES", {}))
+        dtypes.update(self.dtypes.get(model.__name__, {}))
+
+        # the records still use the keys of the api
+        keys = {field: key for key, field in getattr(model, "RENAMED", {}).items()}
+
+        fields = []
+        for field, dtype in dtypes.items():
+            parser = self.parser_for(dtype)
+            if parser is not None:
+                fields.append((keys.get(field, field), parser))
+
+        nested = []
+        for field in getattr(model, "NESTED", {}).keys():
+            nested.append((keys.get(field, field), getattr(model, field).resolve_model()))
+
+        plan = (tuple(fields), tuple(nested))
+        self._plans[model] = plan
+
+        return plan
@@ -0,0 +1,66 @@
+import datetime
+import decimal
+import functools
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_date(value: str) -> datetime.date:
+    """
+    Parses a date of the api (``YYYY-MM-DD``).
+
+    The results are cached, the same dates appear in many items (e.g. activities of the same day).
+
+    :param value: Date string
+
+    :type value: str
+
+    :returns: Parsed date
+    :rtype: datetime.date
+
+    :raises ValueError: if the value is not a valid date
+    """
+    return datetime.datetime.strptime(value, "%Y-%m-%d").date()
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime.datetime:
+    """
+    Parses a timestamp of the api (e.g. ``2020-01-31T09:33:46Z``) into a timezone aware datetime
+
+    :param value: Timestamp string
+
+    :type value: str
+
+    :returns: Parsed timestamp
+    :rtype: datetime.datetime
+
+    :raises ValueError: if the value is not a valid timestamp
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+0000"
+    elif len(value) > 6 and value[-6] in "+-" and value[-3] == ":":
+        # %z accepts an offset with a colon (+01:00) only from python 3.7 on
+        value = value[:-3] + value[-2:]
+
+    for template in ("%Y-%m-%dT%H:%M:%S%z", "%Y-%m-%dT%H:%M:%S.%f%z"):
+        try:
+            return datetime.datetime.strptime(value, template)
+        except ValueError:
+            pass
+
+    raise ValueError("Invalid timestamp: {}".format(value))
+
+
+def to_decimal(value) -> decimal.Decimal:
+    """
+    Converts an amount of money into a decimal
+
+    :param value: Amount (``int``, ``float`` or ``str``)
+
+    :returns: Decimal of the shortest representation of the value (``0.1`` becomes ``Decimal("0.1")``)
+    :rtype: decimal.Decimal
+    """
+    if isinstance(value, float):
+        return decimal.Decimal(repr(value))
+
+    return decimal.Decimal(value)
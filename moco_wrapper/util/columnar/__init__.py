@@ -0,0 +1 @@
+from .columns import Columns
@@ -0,0 +1,336 @@
+from array import array
+
+from moco_wrapper.util.coercion import parse_date, parse_datetime
+
+
+class Columns(object):
+    """
+    Column oriented (struct of arrays) container for the items of list responses.
+
+    Every field is stored in one column. Fields with a declared type are stored in typed columns, ``int``,
+    ``float`` and ``decimal`` (as float) in :class:`array.array` objects (``None`` becomes ``nan`` in float
+    columns), ``date`` and ``datetime`` in lists of :class:`datetime.date` and :class:`datetime.datetime`. All other
+    fields are stored in lists. Nested fields can be selected with a dotted path (e.g. ``user.id``).
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.columnar import Columns
+        from moco_wrapper.util.objector import ColumnarObjector
+
+        m = Moco(auth={..}, objector=ColumnarObjector(fields=["id", "date", "hours", "user.id", "project.id"]))
+
+        activities = Columns.concat(
+            page.data for page in m.pages("activity_getlist", params={"from": "2020-01-01", "to": "2020-12-31"})
+        )
+
+        total_hours = sum(activities["hours"])
+        frame = activities.to_pandas()
+
+    .. seealso::
+
+        :class:`moco_wrapper.util.objector.ColumnarObjector`
+    """
+
+    TYPE_CODES = {
+        "int": "q",
+        "float": "d",
+        "decimal": "d",
+    }
+    """
+    Type codes of the :class:`array.array` columns by field type
+    """
+
+    def __init__(self, fields: list = None, dtypes: dict = None):
+        """
+        Class constructor
+
+        :param fields: Fields (columns) to store (default ``None``, every top level field of the first records)
+        :param dtypes: Types of the fields (field name => ``int``, ``float``, ``decimal``, ``bool``, ``date``,
+            ``datetime`` or ``None``) (default ``None``)
+
+        :type fields: list
+        :type dtypes: dict
+        """
+        self.fields = list(fields) if fields is not None else None
+        self.dtypes = dict(dtypes) if dtypes is not None else {}
+
+        self._columns = {}
+        self._length = 0
+
+        if self.fields is not None:
+            for field in self.fields:
+                self._columns[field] = self._new_column(field)
+
+    @classmethod
+    def from_records(cls, records: list, fields: list = None, dtypes: dict = None):
+        """
+        Creates the columns of a list of json records
+
+        :param records: List of dictionaries
+        :param fields: Fields to store (default ``None``, all top level fields)
+        :param dtypes: Types of the fields (default ``None``)
+
+        :type records: list
+        :type fields: list
+        :type dtypes: dict
+
+        :returns: Columns
+        :rtype: :class:`Columns`
+        """
+        columns = cls(fields=fields, dtypes=dtypes)
+        columns.append_records(records)
+
+        return columns
+
+    @classmethod
+    def concat(cls, parts):
+        """
+        Concatenates columns (e.g. of several pages) into new columns.
+
+        The result contains the fields of all parts, rows of parts without a field are filled with ``None``.
+
+        :param parts: Iterable of :class:`Columns`
+
+        :returns: Columns
+        :rtype: :class:`Columns`
+        """
+        parts = [x for x in parts if x.fields is not None]
+        if len(parts) == 0:
+            return cls()
+
+        fields = []
+        dtypes = {}
+        for part in parts:
+            fields.extend(x for x in part.fields if x not in fields)
+            dtypes.update(part.dtypes)
+
+        result = cls(fields=fields, dtypes=dtypes)
+        for part in parts:
+            result.extend(part)
+
+        return result
+
+    def append_records(self, records: list):
+        """
+        Appends json records to the columns
+
+        :param records: List of dictionaries
+
+        :type records: list
+        """
+        if len(records) == 0:
+            return
+
+        if self.fields is None:
+            self.fields = list(records[0].keys())
+
+        for field in self.fields:
+            if "." in field:
+                path = field.split(".")
+                values = [self._get_path(x, path) for x in records]
+            else:
+                values = [x.get(field, None) for x in records]
+
+            self._extend_column(field, values)
+
+        self._length += len(records)
+
+    def extend(self, other):
+        """
+        Appends the rows of other columns
+
+        :param other: Columns to append
+
+        :type other: :class:`Columns`
+        """
+        if len(other) == 0:
+            return
+
+        if self.fields is None:
+            self.fields = list(other.fields)
+
+        for field in self.fields:
+            if field in other.keys():
+                values = other[field]
+            else:
+                values = [None] * len(other)
+
+            self._extend_column(field, values)
+
+        self._length += len(other)
+
+    def row(self, index: int) -> dict:
+        """
+        Returns a single row
+
+        :param index: Index of the row (negative indexes count from the end)
+
+        :type index: int
+
+        :returns: Dictionary of field => value
+        :rtype: dict
+
+        :raises IndexError: if there is no row at the index
+        """
+        if index < 0:
+            index += self._length
+
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+
+        return {x: self._columns[x][index] for x in self.keys()}
+
+    def rows(self):
+        """
+        Returns a generator yielding every row as a dictionary (field => value)
+        """
+        fields = self.keys()
+        columns = [self._columns[x] for x in fields]
+
+        for index in range(self._length):
+            yield {field: column[index] for field, column in zip(fields, columns)}
+
+    def keys(self) -> list:
+        """
+        Returns the names of the columns
+
+        :rtype: list
+        """
+        return list(self.fields or [])
+
+    def to_dict(self) -> dict:
+        """
+        Returns the columns as a dictionary (field => column)
+
+        :rtype: dict
+        """
+        return {x: self[x] for x in self.keys()}
+
+    def to_numpy(self) -> dict:
+        """
+        Returns the columns as numpy arrays (needs ``numpy``), the arrays are copies of the columns
+
+        :returns: Dictionary of field => ``numpy.ndarray``
+        :rtype: dict
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("Columns.to_numpy needs the numpy package, install it with: pip install numpy")
+
+        result = {}
+        for field in self.keys():
+            column = self[field]
+            dtype = self.dtypes.get(field, None)
+
+            if isinstance(column, array):
+                # a view on the buffer would keep the column from being extended (BufferError)
+                result[field] = numpy.array(column, dtype=column.typecode)
+            elif dtype == "date":
+                result[field] = numpy.array(column, dtype="datetime64[D]")
+            elif dtype == "bool" and None not in column:
+                result[field] = numpy.array(column, dtype=bool)
+            else:
+                result[field] = numpy.array(column, dtype=object)
+
+        return result
+
+    def to_pandas(self):
+        """
+        Returns the columns as a data frame (needs ``pandas``)
+
+        :rtype: ``pandas.DataFrame``
+        """
+        try:
+            import pandas
+        except ImportError:
+            raise ImportError("Columns.to_pandas needs the pandas package, install it with: pip install pandas")
+
+        return pandas.DataFrame(self.to_numpy(), columns=self.keys())
+
+    def to_arrow(self):
+        """
+        Returns the columns as an arrow table (needs ``pyarrow``)
+
+        :rtype: ``pyarrow.Table``
+        """
+        try:
+            import pyarrow
+        except ImportError:
+            raise ImportError("Columns.to_arrow needs the pyarrow package, install it with: pip install pyarrow")
+
+        return pyarrow.table({x: list(self[x]) for x in self.keys()})
+
+    def __getitem__(self, field):
+        return self._columns[field]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __contains__(self, field):
+        return field in self._columns
+
+    def __len__(self):
+        return self._length
+
+    def __str__(self):
+        return "<Columns, Rows: {}, Fields: {}>".format(self._length, ", ".join(self.keys()))
+
+    def _new_column(self, field):
+        type_code = self.TYPE_CODES.get(self.dtypes.get(field, None), None)
+        if type_code is not None:
+            return array(type_code)
+
+        return []
+
+    def _extend_column(self, field, values):
+        column = self._columns.get(field, None)
+        if column is None:
+            # field that was not present in the first records, fill the rows before
+            column = self._new_column(field)
+            self._columns[field] = column
+            self._extend_column(field, [None] * self._length)
+
+        dtype = self.dtypes.get(field, None)
+
+        if dtype == "date":
+            values = [self._parse(parse_date, x) for x in values]
+        elif dtype == "datetime":
+            values = [self._parse(parse_datetime, x) for x in values]
+        elif dtype in ("float", "decimal"):
+            values = [float("nan") if x is None else x for x in values]
+
+        if isinstance(column, array):
+            try:
+                column.extend(array(column.typecode, values))
+                return
+            except TypeError:
+                # values that do not fit the typed column (e.g. None in an int column), fall back to a list
+                column = column.tolist()
+                self._columns[field] = column
+
+        column.extend(values)
+
+    @staticmethod
+    def _parse(parser, value):
+        """
+        Parses a string value, values that can not be parsed (e.g. empty dates) are kept as they are
+        """
+        if not isinstance(value, str):
+            return value
+
+        try:
+            return parser(value)
+        except ValueError:
+            return value
+
+    @staticmethod
+    def _get_path(record, path):
+        value = record
+        for key in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key, None)
+
+        return value
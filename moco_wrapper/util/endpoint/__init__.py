@@ -1,2 +1,2 @@
 from .endpoint import Endpoint
-from .manager import EndpointManager
+from .manager import EndpointManager, default_manager
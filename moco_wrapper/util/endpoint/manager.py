@@ -1,7 +1,51 @@
-from moco_wrapper import models as m
+import re
+import threading
+
 from moco_wrapper.util.endpoint import Endpoint
 
 
+_lock = threading.RLock()
+_endpoints = None
+_default_manager = None
+
+
+def _model_endpoints() -> tuple:
+    """
+    Returns the endpoints of all models (of the registry in :mod:`moco_wrapper.models`), they are collected once and
+    shared by all managers
+    """
+    global _endpoints
+
+    if _endpoints is None:
+        with _lock:
+            if _endpoints is None:
+                from moco_wrapper import models
+
+                endpoints = []
+                for name in models._MODELS:
+                    endpoints.extend(getattr(models, name).endpoints())
+
+                _endpoints = tuple(endpoints)
+
+    return _endpoints
+
+
+def default_manager():
+    """
+    Returns the endpoint manager shared by all :class:`moco_wrapper.Moco` instances, it is created on first use
+
+    :rtype: :class:`moco_wrapper.util.endpoint.EndpointManager`
+    """
+    global _default_manager
+
+    if _default_manager is None:
+        with _lock:
+            if _default_manager is None:
+                _default_manager = EndpointManager()
+
+    return _default_manager
+
+
 class EndpointManager(object):
     """
     Class for managing all models that the moco class uses
@@ -12,39 +56,8 @@ class EndpointManager(object):
         """
         self.map = {}
 
-        self.endpoints = []
-
-        self.endpoints.extend(m.AccountFixedCost.endpoints())
-        self.endpoints.extend(m.Activity.endpoints())
-        self.endpoints.extend(m.Comment.endpoints())
-        self.endpoints.extend(m.Company.endpoints())
-        self.endpoints.extend(m.Contact.endpoints())
-        self.endpoints.extend(m.Deal.endpoints())
-        self.endpoints.extend(m.DealCategory.endpoints())
-        self.endpoints.extend(m.AccountHourlyRate.endpoints())
-        self.endpoints.extend(m.Invoice.endpoints())
-        self.endpoints.extend(m.InvoicePayment.endpoints())
-        self.endpoints.extend(m.Offer.endpoints())
-        self.endpoints.extend(m.PlanningEntry.endpoints())
-        self.endpoints.extend(m.Project.endpoints())
-        self.endpoints.extend(m.ProjectContract.endpoints())
-        self.endpoints.extend(m.ProjectExpense.endpoints())
-        self.endpoints.extend(m.ProjectPaymentSchedule.endpoints())
-        self.endpoints.extend(m.ProjectRecurringExpense.endpoints())
-        self.endpoints.extend(m.ProjectTask.endpoints())
-        self.endpoints.extend(m.Purchase.endpoints())
-        self.endpoints.extend(m.PurchaseCategory.endpoints())
-        self.endpoints.extend(m.PurchaseDraft.endpoints())
-        self.endpoints.extend(m.Schedule.endpoints())
-        self.endpoints.extend(m.Session.endpoints())
-        self.endpoints.extend(m.Tagging.endpoints())
-        self.endpoints.extend(m.Unit.endpoints())
-        self.endpoints.extend(m.User.endpoints())
-        self.endpoints.extend(m.UserEmployment.endpoints())
-        self.endpoints.extend(m.UserHoliday.endpoints())
-        self.endpoints.extend(m.UserPresence.endpoints())
-        self.endpoints.extend(m.AccountInternalHourlyRate.endpoints())
-        self.endpoints.extend(m.Report.endpoints())
+        self.endpoints = list(_model_endpoints())
+        self._routes = None
 
         self._build_map()
 
@@ -64,3 +77,55 @@ class EndpointManager(object):
         :rtype: :class:`moco_wrapper.util.endpoint.Endpoint`
         """
         return self.map.get(slug, None)
+
+    def resolve(self, method: str, path: str):
+        """
+        Finds the endpoint of a request by its http method and path
+
+        :param method: Http method (e.g. ``GET``)
+        :param path: Path of the request below the api prefix (e.g. ``/projects/1/tasks``)
+
+        :type method: str
+        :type path: str
+
+        :return: Tuple of the endpoint and its url parameters (numeric parameters as ``int``), ``(None, None)`` if
+            no endpoint matches
+        :rtype: tuple
+
+        .. code-block:: python
+
+            >> manager.resolve("GET", "/projects/1/tasks")
+            (<Endpoint project_task_getlist>, {"project_id": 1})
+
+        .. note::
+
+            Endpoints with a static path (e.g. ``/projects/assigned``) take precedence over templates that would
+            match the same path (e.g. ``/projects/{id}``), templates with more static text over the others (e.g.
+            ``/invoices/{id}.pdf`` over ``/invoices/{id}``)
+        """
+        if self._routes is None:
+            routes = []
+            for endpoint in self.endpoints:
+                pattern = re.sub(r"\\{(\w+)\\}", r"(?P<\1>[^/]+?)", re.escape(endpoint.url_template))
+                static_length = len(re.sub(r"{\w+}", "", endpoint.url_template))
+                routes.append((
+                    (endpoint.url_template.count("{"), -static_length),
+                    re.compile("^" + pattern + "$"),
+                    endpoint
+                ))
+
+            # most specific templates first
+            routes.sort(key=lambda x: x[0])
+            self._routes = [x[1:] for x in routes]
+
+        for pattern, endpoint in self._routes:
+            if endpoint.method != method:
+                continue
+
+            match = pattern.match(path)
+            if match is not None:
+                return endpoint, {
+                    key: int(value) if value.isdigit() else value for key, value in match.groupdict().items()
+                }
+
+        return None, None
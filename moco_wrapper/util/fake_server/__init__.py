@@ -0,0 +1,2 @@
+from .data import generate_item, generate_items
+from .server import FakeMocoServer, FakeServerStats
@@ -0,0 +1,162 @@
+import datetime
+import inspect
+import random
+from importlib import import_module
+
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.models.objector_models.base import BaseObjectorModel
+
+
+BASE_TIME = datetime.datetime(2020, 1, 1, 8, 0, 0)
+"""
+Time the synthetic items are created at, item ``n`` is created and updated ``n`` hours later
+"""
+
+_RATE = {"currency": "str", "hourly_rate": "float"}
+
+RECORDS = {
+    ("AccountFixedCost", "costs"): {"year": "int", "month": "int", "amount": "float"},
+    ("AccountHourlyRate", "defaults_rates"): _RATE,
+    ("AccountHourlyRate", "tasks"): {"id": "int", "name": "str", "rates": _RATE},
+    ("AccountHourlyRate", "users"): {"id": "int", "full_name": "str", "rates": _RATE},
+    ("AccountInternalHourlyRate", "rates"): {"year": "int", "rate": "float"},
+}
+"""
+Fields that contain lists of plain records instead of entities (model name, field name => field types of the
+records, a dictionary as field type is a list of records again)
+"""
+
+
+def _model_class(model):
+    if isinstance(model, str):
+        return getattr(om, model)
+
+    return model
+
+
+def _fields(model) -> list:
+    """
+    Returns the ``(api key, field name)`` tuples of a model
+    """
+    if issubclass(model, BaseObjectorModel):
+        keys = {value: key for key, value in model.RENAMED.items()}
+        return [(keys.get(x, x), x) for x in model.FIELDS]
+
+    # models that are not based on BaseObjectorModel are created with their constructor arguments
+    parameters = inspect.signature(model.__init__).parameters.values()
+    names = [x.name for x in parameters if x.name != "self" and x.kind == x.POSITIONAL_OR_KEYWORD]
+
+    return [(x, x) for x in names]
+
+
+def _value(rng: random.Random, field: str, dtype, item_id: int):
+    if dtype == "int":
+        return rng.randint(1, 10000)
+    elif dtype in ("float", "decimal"):
+        return round(rng.uniform(0, 1000), 2)
+    elif dtype == "bool":
+        return rng.random() < 0.5
+    elif dtype == "date":
+        return (BASE_TIME + datetime.timedelta(days=rng.randint(0, 730))).date().isoformat()
+    elif dtype == "datetime":
+        return (BASE_TIME + datetime.timedelta(hours=item_id)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    elif dtype == "str":
+        return "{} {}".format(field.replace("_", " ").capitalize(), item_id)
+    elif dtype is not None:
+        module_path, class_name = dtype.rsplit(".", 1)
+        enum_class = getattr(import_module(module_path), class_name)
+        return rng.choice(list(enum_class)).value
+
+    if field == "tags" or field.endswith("_ids") or field.endswith("_emails"):
+        return []
+    elif field in ("custom_properties", "labels"):
+        return {}
+    elif field.endswith("_id"):
+        return rng.randint(1, 10000)
+    elif "email" in field:
+        return "{}{}@example.com".format(field.split("_")[0], item_id)
+
+    return "{} {}".format(field.replace("_", " ").capitalize(), item_id)
+
+
+def _records(rng: random.Random, record: dict, item_id: int) -> list:
+    result = []
+    for _ in range(2):
+        result.append({
+            field: _records(rng, dtype, item_id) if isinstance(dtype, dict) else _value(rng, field, dtype, item_id)
+            for field, dtype in record.items()
+        })
+
+    return result
+
+
+def _nested(rng: random.Random, field: str, model):
+    reference = {
+        "id": rng.randint(1, 10000),
+        "name": "{} {}".format(_model_class(model).__name__, rng.randint(1, 100))
+    }
+
+    # fields holding lists of entities are named in plural (e.g. tasks, contracts)
+    if field.endswith("s"):
+        return [reference]
+
+    return reference
+
+
+def generate_item(model, item_id: int, rng: random.Random) -> dict:
+    """
+    Generates the json data of an entity with synthetic values matching the field types of its objector model
+
+    :param model: Objector model class (or its name in :mod:`moco_wrapper.models.objector_models`)
+    :param item_id: Id of the item, also determines its ``created_at`` and ``updated_at`` timestamps
+    :param rng: Random number generator the values are drawn from
+
+    :type model: type, str
+    :type item_id: int
+    :type rng: :class:`random.Random`
+
+    :returns: Json data of the entity (keyed like the api)
+    :rtype: dict
+    """
+    model = _model_class(model)
+
+    if model is om.UserPerformanceReport:
+        return {
+            "annually": generate_item(om.user.AnnualUserPerformance, item_id, rng),
+            "monthly": [generate_item(om.user.MonthlyUserPerformance, month, rng) for month in range(1, 13)]
+        }
+
+    dtypes = getattr(model, "DTYPES", {})
+    nested = getattr(model, "NESTED", {})
+
+    item = {}
+    for key, field in _fields(model):
+        if field == "id":
+            item[key] = item_id
+        elif field in nested:
+            item[key] = _nested(rng, field, nested[field])
+        elif (model.__name__, field) in RECORDS:
+            item[key] = _records(rng, RECORDS[(model.__name__, field)], item_id)
+        else:
+            item[key] = _value(rng, field, dtypes.get(field, None), item_id)
+
+    return item
+
+
+def generate_items(model, count: int, seed) -> list:
+    """
+    Generates a list of entities with the ids ``1`` to ``count``, the same seed always generates the same items
+
+    :param model: Objector model class (or its name in :mod:`moco_wrapper.models.objector_models`)
+    :param count: Number of items
+    :param seed: Seed of the random number generator
+
+    :type model: type, str
+    :type count: int
+
+    :returns: List of json data
+    :rtype: list
+    """
+    rng = random.Random(seed)
+
+    return [generate_item(model, item_id, rng) for item_id in range(1, count + 1)]
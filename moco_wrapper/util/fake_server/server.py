@@ -0,0 +1,572 @@
+import datetime
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from moco_wrapper.util.endpoint import default_manager
+from moco_wrapper.util.limiter import TokenBucket
+
+from .data import generate_item, generate_items
+
+
+API_PREFIX = "/api/v1"
+
+OBJECT_ENDPOINTS = frozenset([
+    "account_hourly_rate_get",
+    "project_report",
+    "session_verify",
+    "user_performance_report",
+])
+"""
+Read endpoints whose path does not end with an id, but that return a single object instead of a listing
+"""
+
+PDF_CONTENT = b"%PDF-1.4\n% moco_wrapper fake server\n%%EOF\n"
+
+
+class FakeServerStats(object):
+    """
+    Counters of the requests a :class:`FakeMocoServer` handled
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Sets all counters to zero
+        """
+        with self._lock:
+            self.requests = 0
+            """
+            Number of requests
+            """
+
+            self.throttled = 0
+            """
+            Number of requests answered with status ``429``
+            """
+
+            self.endpoints = {}
+            """
+            Number of requests per endpoint slug
+            """
+
+            self.in_flight = 0
+            """
+            Number of requests that are currently handled
+            """
+
+            self.max_in_flight = 0
+            """
+            Highest number of requests that were handled at the same time
+            """
+
+    def started(self):
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def finished(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def count_throttled(self):
+        with self._lock:
+            self.throttled += 1
+
+    def count_endpoint(self, slug: str):
+        with self._lock:
+            self.endpoints[slug] = self.endpoints.get(slug, 0) + 1
+
+    def to_dict(self) -> dict:
+        """
+        Returns the counters as dictionary
+
+        :rtype: dict
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "endpoints": dict(self.endpoints),
+                "max_in_flight": self.max_in_flight,
+            }
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    # keep connections open, like the real api does
+    protocol_version = "HTTP/1.1"
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length > 0 else b""
+
+        status_code, headers, content = self.server.fake.handle(self.command, self.path, self.headers, body)
+
+        self.send_response(status_code)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+
+        if content:
+            self.wfile.write(content)
+
+    do_GET = _dispatch
+    do_POST = _dispatch
+    do_PUT = _dispatch
+    do_PATCH = _dispatch
+    do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _HttpServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, fake):
+        self.fake = fake
+        super(_HttpServer, self).__init__(address, _RequestHandler)
+
+
+class FakeMocoServer(object):
+    """
+    Local stand-in for the moco api, for load and concurrency tests of the client without the real service
+
+    The server implements the endpoints the models declare (see :class:`moco_wrapper.util.endpoint.EndpointManager`)
+    on an in-memory store. Every collection is filled with deterministic synthetic items on its first use, the
+    items match the fields and types of the objector model of the endpoint. Listings are paginated like the api does
+    (``X-Page``, ``X-Per-Page``, ``X-Total`` and ``Link`` headers), created, updated and deleted items are kept until
+    the server is stopped or :meth:`reset`.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.fake_server import FakeMocoServer
+
+        with FakeMocoServer(latency=(0.01, 0.05), throttle_rate=0.1, seed=42) as server:
+            m = Moco(auth={"api_key": "test", "domain": "test"}, base_url=server.url)
+
+            projects = list(m.paginate("project_getlist", max_workers=4))
+
+            print(server.stats.to_dict())
+
+    The server runs in a background thread and handles every connection in its own thread.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        seed=0,
+        collection_size: int = 50,
+        per_page: int = 100,
+        latency=0,
+        throttle_rate: float = 0.0,
+        retry_after: int = 1,
+        rate_limit: float = None,
+        api_key: str = None
+    ):
+        """
+        Class constructor
+
+        :param host: Host the server listens on (default ``127.0.0.1``)
+        :param port: Port the server listens on (default ``0``, a free port is chosen)
+        :param seed: Seed of the synthetic data, of the latency and the injected ``429`` responses (default ``0``)
+        :param collection_size: Number of items every collection is filled with (default ``50``)
+        :param per_page: Page size of the listings if the request does not set ``per_page`` (default ``100``)
+        :param latency: Seconds every request is delayed, either a fixed value or a ``(min, max)`` tuple the delay is
+            drawn from (default ``0``)
+        :param throttle_rate: Share of the requests that are answered with status ``429`` (default ``0.0``)
+        :param retry_after: Value of the ``Retry-After`` header of the injected ``429`` responses (default ``1``)
+        :param rate_limit: Requests per second the server accepts, requests exceeding the limit are answered with
+            status ``429`` and the seconds until the next request is accepted (default ``None``, no limit)
+        :param api_key: Api key the requests have to authenticate with, other requests are answered with status
+            ``401`` (default ``None``, every request is accepted)
+
+        :type host: str
+        :type port: int
+        :type collection_size: int
+        :type per_page: int
+        :type latency: float, tuple
+        :type throttle_rate: float
+        :type retry_after: int
+        :type rate_limit: float
+        :type api_key: str
+        """
+        self.host = host
+        self.port = port
+        self.seed = seed
+        self.collection_size = collection_size
+        self.per_page = per_page
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.api_key = api_key
+
+        self.rate_limiter = TokenBucket(rate_limit, 1) if rate_limit is not None else None
+        """
+        Token bucket limiting the accepted requests (``None`` if there is no rate limit)
+        """
+
+        self.stats = FakeServerStats()
+        """
+        Counters of the handled requests
+        """
+
+        self.endpoint_manager = default_manager()
+
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+        self._store_lock = threading.RLock()
+        self._collections = {}
+        self._tags = {}
+
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        Url of the api of the running server, to be passed as ``base_url`` to :class:`moco_wrapper.Moco`
+
+        :type: str
+        """
+        if self._server is None:
+            raise RuntimeError("The server is not running")
+
+        return "http://{}:{}{}".format(self.host, self._server.server_address[1], API_PREFIX)
+
+    def start(self):
+        """
+        Starts the server in a background thread
+
+        :returns: The server itself
+        :rtype: :class:`FakeMocoServer`
+        """
+        if self._server is not None:
+            raise RuntimeError("The server is already running")
+
+        self._server = _HttpServer((self.host, self.port), self)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},  # stop quickly, tests start and stop many servers
+            name="moco-fake-server",
+            daemon=True
+        )
+        self._thread.start()
+
+        return self
+
+    def stop(self):
+        """
+        Stops the server (the stored data is kept)
+        """
+        if self._server is None:
+            return
+
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+        self._server = None
+        self._thread = None
+
+    def reset(self):
+        """
+        Discards all stored data and counters, the collections are filled with the same synthetic items again
+        """
+        with self._store_lock:
+            self._collections = {}
+            self._tags = {}
+
+        self.stats.reset()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    def collection(self, path: str) -> list:
+        """
+        Returns the items of a collection (filling it on its first use)
+
+        :param path: Path of the listing below the api prefix (e.g. ``/projects/1/tasks``)
+
+        :type path: str
+
+        :returns: List of the json data of the items
+        :rtype: list
+        """
+        with self._store_lock:
+            return list(self._collection(path).values())
+
+    def handle(self, method: str, path: str, headers, body: bytes) -> tuple:
+        """
+        Answers a request, used by the http server for every request it receives
+
+        :param method: Http method
+        :param path: Requested path including the query string (e.g. ``/api/v1/projects?page=2``)
+        :param headers: Http headers of the request
+        :param body: Body of the request
+
+        :returns: Tuple of status code, headers and body of the response
+        :rtype: tuple
+        """
+        self.stats.started()
+        try:
+            self._wait()
+            return self._handle(method, path, headers, body)
+        finally:
+            self.stats.finished()
+
+    def _wait(self):
+        latency = self.latency
+        if isinstance(latency, (tuple, list)):
+            with self._random_lock:
+                latency = self._random.uniform(latency[0], latency[1])
+
+        if latency > 0:
+            time.sleep(latency)
+
+    def _handle(self, method, path, headers, body):
+        url = urlsplit(path)
+        if not url.path.startswith(API_PREFIX):
+            return self._json(404, {"message": "Not found"})
+
+        path = url.path[len(API_PREFIX):]
+        query = dict(parse_qsl(url.query))
+
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.try_acquire()
+            if wait > 0:
+                return self._throttled(int(math.ceil(wait)))
+
+        if self.throttle_rate > 0:
+            with self._random_lock:
+                throttled = self._random.random() < self.throttle_rate
+
+            if throttled:
+                return self._throttled(self.retry_after)
+
+        if self.api_key is not None and headers.get("Authorization") != "Token token={}".format(self.api_key):
+            return self._json(401, {"message": "Unauthorized"})
+
+        endpoint, ep_params = self.endpoint_manager.resolve(method, path)
+        if endpoint is None:
+            return self._json(404, {"message": "Not found"})
+
+        self.stats.count_endpoint(endpoint.slug)
+
+        data = {}
+        if body:
+            try:
+                data = json.loads(body.decode("utf-8"))
+            except ValueError:
+                return self._json(422, {"message": "Invalid json"})
+
+        with self._store_lock:
+            return self._route(method, endpoint, ep_params, path, query, data)
+
+    def _route(self, method, endpoint, ep_params, path, query, data):
+        template = endpoint.url_template
+
+        if template.startswith("/taggings/"):
+            return self._taggings(method, path, data)
+
+        if method == "GET":
+            if template.endswith(".pdf"):
+                return 200, {"Content-Type": "application/pdf"}, PDF_CONTENT
+
+            if endpoint.slug in OBJECT_ENDPOINTS:
+                item_id = next(iter(ep_params.values()), 1)
+                return self._json(200, generate_item(endpoint.objector_model_type, item_id, self._rng(path)))
+
+            if template.endswith("}"):
+                item = self._item(path)
+                if item is None:
+                    return self._json(404, {"message": "Not found"})
+
+                return self._json(200, item)
+
+            return self._listing(path, query)
+
+        if method == "DELETE":
+            if template.endswith("/destroy_all"):
+                self._collection(path.rsplit("/", 1)[0]).clear()
+            elif template.endswith("}"):
+                collection_path, item_id = self._split(path)
+                if self._collection(collection_path).pop(item_id, None) is None:
+                    return self._json(404, {"message": "Not found"})
+
+            return 204, {}, b""
+
+        if endpoint.objector_model_type is None:
+            # actions without a response body (e.g. disregard)
+            return 204, {}, b""
+
+        if method == "POST":
+            if "bulk_data" in data:
+                collection_path = path.rsplit("/", 1)[0]
+                return self._json(200, [self._create(collection_path, x) for x in data["bulk_data"]])
+
+            if "commentable_ids" in data:
+                collection_path = path.rsplit("/", 1)[0]
+                items = []
+                for commentable_id in data.pop("commentable_ids"):
+                    items.append(self._create(collection_path, dict(data, commentable_id=commentable_id)))
+
+                return self._json(200, items)
+
+            if self._is_collection(path):
+                return self._json(200, self._create(path, data))
+
+            # actions returning another entity (e.g. sending an invoice email)
+            item = generate_item(endpoint.objector_model_type, 1, self._rng(path))
+            item.update((key, value) for key, value in data.items() if key in item)
+
+            return self._json(200, item)
+
+        # PUT and PATCH update an entity, actions (e.g. /invoices/{id}/update_status) the one they belong to
+        if template.endswith("}"):
+            item = self._item(path)
+        else:
+            item = self._item(path.rsplit("/", 1)[0])
+
+        if item is None:
+            return self._json(404, {"message": "Not found"})
+
+        item.update(data)
+        item["updated_at"] = self._now()
+
+        return self._json(200, item)
+
+    def _listing(self, path, query):
+        items = list(self._collection(path).values())
+
+        updated_after = query.get("updated_after", None)
+        if updated_after is not None:
+            items = [x for x in items if str(x.get("updated_at", ""))[:19] > updated_after[:19]]
+
+        updated_from = query.get("updated_from", None)
+        if updated_from is not None:
+            items = [x for x in items if str(x.get("updated_at", "")) >= updated_from]
+
+        page = max(1, int(query.get("page", 1)))
+        per_page = max(1, int(query.get("per_page", self.per_page)))
+        last_page = max(1, int(math.ceil(len(items) / float(per_page))))
+
+        headers = {
+            "X-Page": str(page),
+            "X-Per-Page": str(per_page),
+            "X-Total": str(len(items)),
+        }
+
+        # like the api, the last page links neither the next nor the last page
+        links = []
+        if page > 1:
+            links.append(self._link(path, query, 1, "first"))
+            links.append(self._link(path, query, min(page - 1, last_page), "prev"))
+        if page < last_page:
+            links.append(self._link(path, query, page + 1, "next"))
+            links.append(self._link(path, query, last_page, "last"))
+        if links:
+            headers["Link"] = ", ".join(links)
+
+        return self._json(200, items[(page - 1) * per_page:page * per_page], headers)
+
+    def _link(self, path, query, page, rel):
+        params = dict(query, page=page)
+        base = self.url if self._server is not None else API_PREFIX
+
+        return "<{}{}?{}>; rel=\"{}\"".format(base, path, urlencode(params), rel)
+
+    def _taggings(self, method, path, data):
+        tags = self._tags.setdefault(path, [])
+
+        if method == "PUT":
+            tags[:] = list(data.get("tags", []))
+        elif method == "PATCH":
+            tags.extend(x for x in data.get("tags", []) if x not in tags)
+        elif method == "DELETE":
+            tags[:] = [x for x in tags if x not in data.get("tags", [])]
+
+        return self._json(200, tags)
+
+    def _collection(self, path):
+        """
+        Returns the items of a collection by id (filled with synthetic items on its first use)
+        """
+        items = self._collections.get(path, None)
+        if items is None:
+            endpoint, _ = self.endpoint_manager.resolve("GET", path)
+
+            items = {}
+            if endpoint is not None and endpoint.objector_model_type is not None:
+                generated = generate_items(endpoint.objector_model_type, self.collection_size, self._seed(path))
+                items = {x.get("id", index): x for index, x in enumerate(generated, 1)}
+
+            self._collections[path] = items
+
+        return items
+
+    def _is_collection(self, path):
+        endpoint, _ = self.endpoint_manager.resolve("GET", path)
+
+        return endpoint is not None and endpoint.slug not in OBJECT_ENDPOINTS \
+            and not endpoint.url_template.endswith("}")
+
+    def _item(self, path):
+        collection_path, item_id = self._split(path)
+        return self._collection(collection_path).get(item_id, None)
+
+    def _create(self, collection_path, data):
+        items = self._collection(collection_path)
+        endpoint, _ = self.endpoint_manager.resolve("GET", collection_path)
+
+        item_id = max(items.keys(), default=0) + 1
+        item = generate_item(endpoint.objector_model_type, item_id, self._rng(collection_path))
+        item.update(data)
+        item["id"] = item_id
+        item["created_at"] = item["updated_at"] = self._now()
+
+        items[item_id] = item
+
+        return item
+
+    def _split(self, path):
+        collection_path, item_id = path.rsplit("/", 1)
+        return collection_path, int(item_id) if item_id.isdigit() else item_id
+
+    def _seed(self, path):
+        return "{}:{}".format(self.seed, path)
+
+    def _rng(self, path):
+        return random.Random(self._seed(path))
+
+    def _now(self):
+        return datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def _throttled(self, retry_after):
+        self.stats.count_throttled()
+
+        return self._json(429, {"message": "Too many requests"}, {"Retry-After": str(retry_after)})
+
+    def _json(self, status_code, data, headers=None):
+        response_headers = {"Content-Type": "application/json; charset=utf-8"}
+        if headers is not None:
+            response_headers.update(headers)
+
+        return status_code, response_headers, json.dumps(data).encode("utf-8")
@@ -0,0 +1,2 @@
+from .hooks import Hooks, RequestEvent
+from .metrics import MetricsCollector, Histogram
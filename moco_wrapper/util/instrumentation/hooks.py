@@ -0,0 +1,296 @@
+import time
+
+from moco_wrapper.util.response import RawResponse, StreamedListResponse
+
+
+class RequestEvent(object):
+    """
+    State of a single request, passed to every hook that is called for it
+    """
+
+    __slots__ = (
+        "hooks", "slug", "method", "path", "started_at", "elapsed", "attempts", "status_codes", "status_code",
+        "response_bytes", "response", "exception", "objectify_time"
+    )
+
+    def __init__(self, hooks, slug: str, method: str, path: str):
+        self.hooks = hooks
+
+        self.slug = slug
+        """
+        Endpoint slug of the request (e.g. ``activity_getlist``), ``None`` for requests of
+        :meth:`moco_wrapper.Moco.request`
+        """
+
+        self.method = method
+        """
+        Http method
+        """
+
+        self.path = path
+        """
+        Full url of the request
+        """
+
+        self.started_at = time.perf_counter()
+        """
+        Time the request was started at (:func:`time.perf_counter`)
+        """
+
+        self.elapsed = None
+        """
+        Seconds the request took including all retries, set before ``after_response`` is called
+        """
+
+        self.attempts = 1
+        """
+        Number of times the request was sent
+        """
+
+        self.status_codes = []
+        """
+        Status codes of the responses that were retried
+        """
+
+        self.status_code = None
+        """
+        Status code of the final response (``None`` if no response was received)
+        """
+
+        self.response_bytes = None
+        """
+        Size of the body of the final response (``None`` if it is unknown, e.g. for streamed responses without a
+        ``Content-Length`` header)
+        """
+
+        self.response = None
+        """
+        Response object the requestor returned (see :ref:`response`)
+        """
+
+        self.exception = None
+        """
+        Exception the request failed with (e.g. a connection error)
+        """
+
+        self.objectify_time = None
+        """
+        Seconds the objector took to convert the response, set before ``on_objectify`` is called
+        """
+
+    @property
+    def retries(self) -> int:
+        """
+        Number of times the request was retried
+
+        :type: int
+        """
+        return self.attempts - 1
+
+    def retried(self, attempt: int, delay: float, response=None, exception: Exception = None):
+        """
+        Records a retry of the request (passed to the requestor as ``on_retry``)
+
+        :param attempt: Number of the attempt that failed
+        :param delay: Seconds that are waited before the next attempt
+        :param response: http response of the failed attempt (default ``None``)
+        :param exception: Exception of the failed attempt (default ``None``)
+        """
+        self.attempts = attempt + 1
+        if response is not None:
+            self.status_codes.append(response.status_code)
+
+        self.hooks.emit("on_retry", self, delay, response, exception)
+
+    def finished(self, response=None, exception: Exception = None):
+        """
+        Records the final response of the request (or the exception it failed with)
+
+        :param response: Response object the requestor returned (default ``None``)
+        :param exception: Exception the request failed with (default ``None``)
+        """
+        self.elapsed = time.perf_counter() - self.started_at
+        self.response = response
+        self.exception = exception
+
+        http_response = getattr(response, "response", None)
+        if http_response is not None:
+            self.status_code = http_response.status_code
+            self.response_bytes = response_size(response)
+
+        self.hooks.emit("after_response", self)
+
+    def objectified(self, seconds: float):
+        """
+        Records the time the objector took to convert the response
+
+        :param seconds: Conversion time in seconds
+        """
+        self.objectify_time = seconds
+
+        self.hooks.emit("on_objectify", self)
+
+    def __repr__(self):
+        return "<RequestEvent, {} {}, Status Code: {}>".format(self.method, self.slug or self.path, self.status_code)
+
+
+def response_size(response_obj) -> int:
+    """
+    Returns the size of the body of a response without reading a body that was not read yet
+
+    :param response_obj: Response object (see :ref:`response`)
+
+    :returns: Number of bytes, ``None`` if the size is unknown
+    :rtype: int
+    """
+    if isinstance(response_obj, RawResponse):
+        return len(response_obj.data)
+
+    http_response = response_obj.response
+
+    content_length = http_response.headers.get("Content-Length", None)
+    if content_length is not None:
+        try:
+            return int(content_length)
+        except ValueError:
+            pass
+
+    if isinstance(response_obj, StreamedListResponse):
+        return None  # the body is read while the items are iterated over
+
+    content = getattr(http_response, "content", None)
+    if isinstance(content, (bytes, bytearray)):
+        return len(content)
+
+    return None
+
+
+class Hooks(object):
+    """
+    Registry of the functions that are called at the stages of every request.
+
+    =================== ============================================ ==================================================
+    Event               Arguments                                    Called
+    =================== ============================================ ==================================================
+    ``before_request``  ``event``                                    before the request is passed to the requestor
+    ``on_retry``        ``event, delay, response, exception``        when the requestor retries the request
+    ``after_response``  ``event``                                    when the requestor returned (or raised)
+    ``on_objectify``    ``event``                                    when the objector converted the response
+    =================== ============================================ ==================================================
+
+    ``event`` is the :class:`RequestEvent` of the request, responses served by the
+    :class:`moco_wrapper.util.cache.ResponseCache` are not requests and call no hooks.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+
+        m = Moco(auth={..})
+
+        @m.hooks.on("after_response")
+        def log_slow(event):
+            if event.elapsed > 2:
+                print("{} took {:.1f}s".format(event.slug, event.elapsed))
+
+    .. note::
+
+        Exceptions raised by a hook are not caught, they end the request.
+    """
+
+    EVENTS = ("before_request", "on_retry", "after_response", "on_objectify")
+    """
+    Names of the events hooks can be registered for
+    """
+
+    def __init__(self):
+        # tuples are replaced instead of changed, emitting needs no lock
+        self._listeners = {event: () for event in self.EVENTS}
+
+    def register(self, event: str, function):
+        """
+        Registers a function for an event
+
+        :param event: Name of the event (see :attr:`EVENTS`)
+        :param function: Function that is called with the arguments of the event
+
+        :type event: str
+
+        :returns: The function
+        """
+        self._check_event(event)
+        self._listeners[event] = self._listeners[event] + (function, )
+
+        return function
+
+    def unregister(self, event: str, function):
+        """
+        Removes a function that was registered for an event
+
+        :param event: Name of the event (see :attr:`EVENTS`)
+        :param function: Registered function
+
+        :type event: str
+        """
+        self._check_event(event)
+        self._listeners[event] = tuple(x for x in self._listeners[event] if x != function)
+
+    def on(self, event: str):
+        """
+        Decorator registering a function for an event
+
+        :param event: Name of the event (see :attr:`EVENTS`)
+
+        :type event: str
+        """
+        def decorator(function):
+            return self.register(event, function)
+
+        return decorator
+
+    def has_listeners(self, event: str = None) -> bool:
+        """
+        Returns whether functions are registered for an event
+
+        :param event: Name of the event (default ``None``, any event)
+
+        :type event: str
+
+        :rtype: bool
+        """
+        if event is None:
+            return any(len(x) > 0 for x in self._listeners.values())
+
+        return len(self._listeners[event]) > 0
+
+    def emit(self, event: str, *args):
+        """
+        Calls the functions registered for an event
+
+        :param event: Name of the event
+        :param args: Arguments of the event
+        """
+        for function in self._listeners[event]:
+            function(*args)
+
+    def start(self, slug: str, method: str, path: str) -> RequestEvent:
+        """
+        Creates the event of a request and calls the ``before_request`` hooks
+
+        :param slug: Endpoint slug (``None`` if the request was not made through an endpoint)
+        :param method: Http method
+        :param path: Full url of the request
+
+        :returns: Event of the request, ``None`` if no hooks are registered (nothing is recorded)
+        :rtype: :class:`RequestEvent`
+        """
+        if not self.has_listeners():
+            return None
+
+        event = RequestEvent(self, slug, method, path)
+        self.emit("before_request", event)
+
+        return event
+
+    def _check_event(self, event):
+        if event not in self._listeners:
+            raise ValueError("Unknown event {}, must be one of {}".format(event, ", ".join(self.EVENTS)))
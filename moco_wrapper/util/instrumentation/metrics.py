@@ -0,0 +1,312 @@
+import bisect
+import threading
+
+
+class Histogram(object):
+    """
+    Histogram with fixed, cumulative buckets (like the histograms of Prometheus)
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum")
+
+    def __init__(self, buckets):
+        """
+        Class constructor
+
+        :param buckets: Upper bounds of the buckets in ascending order (``+Inf`` is added implicitly)
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        """
+        Adds a value to the histogram
+
+        :param value: Observed value
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> list:
+        """
+        Returns the cumulative counts of the buckets
+
+        :returns: List of ``(upper bound, count)`` tuples, the last upper bound is ``float("inf")``
+        :rtype: list
+        """
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"), ), self.counts):
+            total += count
+            result.append((bound, total))
+
+        return result
+
+    def to_dict(self) -> dict:
+        """
+        Returns the histogram as dictionary (``count``, ``sum`` and the cumulative ``buckets`` by upper bound)
+
+        :rtype: dict
+        """
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "buckets": dict(self.cumulative())
+        }
+
+
+class EndpointMetrics(object):
+    """
+    Metrics of the requests of a single endpoint
+    """
+
+    __slots__ = ("requests", "errors", "retries", "throttled", "status_codes", "latency", "response_bytes",
+                 "objectify")
+
+    def __init__(self, latency_buckets, size_buckets):
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttled = 0
+        self.status_codes = {}
+        self.latency = Histogram(latency_buckets)
+        self.response_bytes = Histogram(size_buckets)
+        self.objectify = Histogram(latency_buckets)
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "status_codes": dict(self.status_codes),
+            "latency": self.latency.to_dict(),
+            "response_bytes": self.response_bytes.to_dict(),
+            "objectify": self.objectify.to_dict(),
+        }
+
+
+class MetricsCollector(object):
+    """
+    Collects metrics of the requests of one or more moco instances by endpoint slug.
+
+    For every endpoint it counts the requests, failed requests, retries, responses with status code 429 (including
+    the ones that were retried) and the final status codes, and records histograms of the latency (including retries),
+    the size of the response bodies and the time the objector took to convert the responses.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.instrumentation import MetricsCollector
+
+        m = Moco(auth={..})
+
+        metrics = MetricsCollector()
+        metrics.install(m.hooks)
+
+        ...
+
+        print(metrics.to_dict()["activity_getlist"]["throttled"])
+        print(metrics.to_prometheus())
+
+    Requests made with :meth:`moco_wrapper.Moco.request` (without an endpoint) are collected as :attr:`OTHER`.
+    """
+
+    LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    """
+    Default upper bounds (seconds) of the buckets of the latency and conversion time histograms
+    """
+
+    SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+    """
+    Default upper bounds (bytes) of the buckets of the response size histograms
+    """
+
+    OTHER = "other"
+    """
+    Name the requests without an endpoint slug are collected under
+    """
+
+    def __init__(self, latency_buckets=None, size_buckets=None):
+        """
+        Class constructor
+
+        :param latency_buckets: Upper bounds in seconds of the latency buckets (default ``None``, see
+            :attr:`LATENCY_BUCKETS`)
+        :param size_buckets: Upper bounds in bytes of the response size buckets (default ``None``, see
+            :attr:`SIZE_BUCKETS`)
+        """
+        self.latency_buckets = tuple(latency_buckets) if latency_buckets is not None else self.LATENCY_BUCKETS
+        self.size_buckets = tuple(size_buckets) if size_buckets is not None else self.SIZE_BUCKETS
+
+        self._lock = threading.Lock()
+        self._endpoints = {}
+
+    def install(self, hooks):
+        """
+        Registers the collector at the hooks of a moco instance
+
+        :param hooks: Hooks (e.g. ``m.hooks``, see :class:`moco_wrapper.util.instrumentation.Hooks`)
+
+        :returns: The collector
+        """
+        hooks.register("on_retry", self.on_retry)
+        hooks.register("after_response", self.after_response)
+        hooks.register("on_objectify", self.on_objectify)
+
+        return self
+
+    def uninstall(self, hooks):
+        """
+        Removes the collector from the hooks of a moco instance
+
+        :param hooks: Hooks the collector was installed at
+        """
+        hooks.unregister("on_retry", self.on_retry)
+        hooks.unregister("after_response", self.after_response)
+        hooks.unregister("on_objectify", self.on_objectify)
+
+    def on_retry(self, event, delay, response, exception):
+        """
+        Hook counting a retry
+        """
+        with self._lock:
+            metrics = self._metrics(event)
+            metrics.retries += 1
+            if response is not None and response.status_code == 429:
+                metrics.throttled += 1
+
+    def after_response(self, event):
+        """
+        Hook recording the final response of a request
+        """
+        with self._lock:
+            metrics = self._metrics(event)
+            metrics.requests += 1
+            metrics.latency.observe(event.elapsed)
+
+            if event.status_code is None:
+                metrics.errors += 1
+                return
+
+            metrics.status_codes[event.status_code] = metrics.status_codes.get(event.status_code, 0) + 1
+            if event.status_code >= 400:
+                metrics.errors += 1
+
+            if event.status_code == 429:
+                metrics.throttled += 1
+
+            if event.response_bytes is not None:
+                metrics.response_bytes.observe(event.response_bytes)
+
+    def on_objectify(self, event):
+        """
+        Hook recording the conversion time of a response
+        """
+        with self._lock:
+            self._metrics(event).objectify.observe(event.objectify_time)
+
+    def reset(self):
+        """
+        Removes all collected metrics
+        """
+        with self._lock:
+            self._endpoints = {}
+
+    def to_dict(self) -> dict:
+        """
+        Returns the collected metrics
+
+        :returns: Dictionary of the metrics by endpoint slug
+        :rtype: dict
+
+        .. code-block:: python
+
+            {
+                "activity_getlist": {
+                    "requests": 12,
+                    "errors": 1,
+                    "retries": 3,
+                    "throttled": 3,
+                    "status_codes": {200: 11, 429: 1},
+                    "latency": {"count": 12, "sum": 4.2, "buckets": {0.005: 0, .., inf: 12}},
+                    "response_bytes": {..},
+                    "objectify": {..}
+                }
+            }
+        """
+        with self._lock:
+            return {slug: metrics.to_dict() for slug, metrics in self._endpoints.items()}
+
+    def to_prometheus(self, prefix: str = "moco_wrapper") -> str:
+        """
+        Returns the collected metrics in the text format of Prometheus
+
+        :param prefix: Prefix of the metric names (default ``moco_wrapper``)
+
+        :type prefix: str
+
+        :returns: Metrics in the Prometheus text exposition format
+        :rtype: str
+        """
+        metrics = self.to_dict()
+        lines = []
+
+        counters = (
+            ("requests_total", "requests", "Number of requests"),
+            ("errors_total", "errors", "Number of requests that failed"),
+            ("retries_total", "retries", "Number of retried requests"),
+            ("throttled_total", "throttled", "Number of responses with status code 429"),
+        )
+        for name, key, description in counters:
+            lines.append("# HELP {}_{} {}".format(prefix, name, description))
+            lines.append("# TYPE {}_{} counter".format(prefix, name))
+            for slug in sorted(metrics):
+                lines.append("{}_{}{{slug=\"{}\"}} {}".format(prefix, name, slug, metrics[slug][key]))
+
+        lines.append("# HELP {}_responses_total Number of responses by status code".format(prefix))
+        lines.append("# TYPE {}_responses_total counter".format(prefix))
+        for slug in sorted(metrics):
+            for status_code, count in sorted(metrics[slug]["status_codes"].items()):
+                lines.append(
+                    "{}_responses_total{{slug=\"{}\",status=\"{}\"}} {}".format(prefix, slug, status_code, count)
+                )
+
+        histograms = (
+            ("request_duration_seconds", "latency", "Duration of the requests including retries"),
+            ("response_size_bytes", "response_bytes", "Size of the response bodies"),
+            ("objectify_duration_seconds", "objectify", "Duration of the conversion of the responses"),
+        )
+        for name, key, description in histograms:
+            lines.append("# HELP {}_{} {}".format(prefix, name, description))
+            lines.append("# TYPE {}_{} histogram".format(prefix, name))
+            for slug in sorted(metrics):
+                histogram = metrics[slug][key]
+                for bound, count in histogram["buckets"].items():
+                    lines.append("{}_{}_bucket{{slug=\"{}\",le=\"{}\"}} {}".format(
+                        prefix, name, slug, self._format_bound(bound), count
+                    ))
+
+                lines.append("{}_{}_sum{{slug=\"{}\"}} {}".format(prefix, name, slug, histogram["sum"]))
+                lines.append("{}_{}_count{{slug=\"{}\"}} {}".format(prefix, name, slug, histogram["count"]))
+
+        return "\n".join(lines) + "\n"
+
+    def _metrics(self, event):
+        slug = event.slug if event.slug is not None else self.OTHER
+
+        metrics = self._endpoints.get(slug, None)
+        if metrics is None:
+            metrics = self._endpoints[slug] = EndpointMetrics(self.latency_buckets, self.size_buckets)
+
+        return metrics
+
+    @staticmethod
+    def _format_bound(bound):
+        if bound == float("inf"):
+            return "+Inf"
+
+        return repr(bound)
@@ -0,0 +1,2 @@
+from .token_bucket import TokenBucket
+from .rate_limiter import RateLimiter
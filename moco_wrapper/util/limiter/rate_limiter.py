@@ -0,0 +1,120 @@
+import threading
+import time
+
+from urllib.parse import urlsplit
+
+from moco_wrapper.util.limiter.token_bucket import TokenBucket
+
+
+class RateLimiter(object):
+    """
+    Client side rate limiter, that throttles requests before they are sent to the api.
+
+    Every combination of domain and api key gets its own :class:`.TokenBucket`. Assign the same rate limiter
+    to the requestors of several :class:`moco_wrapper.Moco` instances to share the budget between them
+    (the limiter is thread safe).
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.limiter import RateLimiter
+        from moco_wrapper.util.requestor import DefaultRequestor
+
+        limiter = RateLimiter(requests=100, per=15)
+
+        m1 = Moco(auth={..}, requestor=DefaultRequestor(rate_limiter=limiter))
+        m2 = Moco(auth={..}, requestor=DefaultRequestor(rate_limiter=limiter))
+
+    Limits for single domains or api keys can be overwritten:
+
+    .. code-block:: python
+
+        limiter = RateLimiter(
+            requests=100,
+            per=15,
+            limits={
+                "testabcd.mocoapp.com": (50, 15),  # by host of the api
+                "my-api-key": (10, 1)  # by api key
+            }
+        )
+    """
+
+    def __init__(
+        self,
+        requests: int = 100,
+        per: float = 15.0,
+        limits: dict = None,
+        clock=time.monotonic
+    ):
+        """
+        Class constructor
+
+        :param requests: Number of requests allowed within ``per`` seconds (default ``100``)
+        :param per: Length of the window in seconds (default ``15.0``)
+        :param limits: Dictionary of ``(requests, per)`` tuples by host or api key, overwrites the default limit
+            (default ``None``)
+        :param clock: Function returning the current time in seconds (default ``time.monotonic``)
+
+        :type requests: int
+        :type per: float
+        :type limits: dict
+        """
+        self.requests = requests
+        self.per = per
+        self.limits = limits if limits is not None else {}
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def bucket(self, path: str, headers: dict = None) -> TokenBucket:
+        """
+        Returns the bucket used for requests to ``path``
+
+        :param path: Full url of the request
+        :param headers: Http headers of the request (default ``None``)
+
+        :type path: str
+        :type headers: dict
+
+        :rtype: :class:`.TokenBucket`
+        """
+        host = urlsplit(path).netloc
+        api_key = None
+        if headers is not None and "Authorization" in headers:
+            api_key = headers["Authorization"].split("token=")[-1]
+
+        key = (host, api_key)
+        with self._lock:
+            if key not in self._buckets:
+                requests, per = self.limits.get(api_key, self.limits.get(host, (self.requests, self.per)))
+                self._buckets[key] = TokenBucket(requests, per=per, clock=self._clock)
+
+            return self._buckets[key]
+
+    def reserve(self, path: str, headers: dict = None) -> float:
+        """
+        Reserves a request to ``path``
+
+        :param path: Full url of the request
+        :param headers: Http headers of the request (default ``None``)
+
+        :type path: str
+        :type headers: dict
+
+        :returns: Seconds the caller has to wait before sending the request
+        :rtype: float
+        """
+        return self.bucket(path, headers).reserve()
+
+    def acquire(self, path: str, headers: dict = None):
+        """
+        Reserves a request to ``path`` and blocks until it may be sent
+
+        :param path: Full url of the request
+        :param headers: Http headers of the request (default ``None``)
+
+        :type path: str
+        :type headers: dict
+        """
+        self.bucket(path, headers).acquire()
@@ -0,0 +1,123 @@
+import threading
+import time
+
+
+class TokenBucket(object):
+    """
+    Thread safe token bucket, that refills ``rate`` tokens every ``per`` seconds.
+
+    Callers reserve a token and get the time they have to wait until the token can be used. As reservations can
+    go into debt, concurrent callers are queued up in the order they reserved their tokens.
+
+    .. code-block:: python
+
+        from moco_wrapper.util.limiter import TokenBucket
+
+        # 10 requests per second
+        bucket = TokenBucket(10, per=1.0)
+
+        for i in range(100):
+            bucket.acquire()
+            # send request
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        per: float = 1.0,
+        capacity: float = None,
+        clock=time.monotonic
+    ):
+        """
+        Class constructor
+
+        :param rate: Number of tokens that are added to the bucket every ``per`` seconds
+        :param per: Length of the refill window in seconds (default ``1.0``)
+        :param capacity: Maximum number of tokens the bucket holds (default ``None``, same as ``rate``)
+        :param clock: Function returning the current time in seconds (default ``time.monotonic``)
+
+        :type rate: float
+        :type per: float
+        :type capacity: float
+        """
+        if rate <= 0 or per <= 0:
+            raise ValueError("rate and per must be greater than zero")
+
+        self.rate = rate
+        self.per = per
+        self.capacity = capacity if capacity is not None else rate
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated_at = clock()
+
+    @property
+    def tokens(self) -> float:
+        """
+        Number of tokens currently in the bucket (negative if tokens were reserved in advance)
+
+        :type: float
+        """
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Takes tokens from the bucket
+
+        :param tokens: Number of tokens to take (default ``1``)
+
+        :type tokens: float
+
+        :returns: Seconds the caller has to wait before the tokens may be used (``0`` if they are available right away)
+        :rtype: float
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens * self.per / self.rate
+
+    def try_acquire(self, tokens: float = 1) -> float:
+        """
+        Takes tokens from the bucket only if they are available right away
+
+        :param tokens: Number of tokens to take (default ``1``)
+
+        :type tokens: float
+
+        :returns: ``0`` if the tokens were taken, otherwise the seconds until they will be available (nothing is
+            taken)
+        :rtype: float
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return 0.0
+
+            return (tokens - self._tokens) * self.per / self.rate
+
+    def acquire(self, tokens: float = 1):
+        """
+        Takes tokens from the bucket and blocks until they may be used
+
+        :param tokens: Number of tokens to take (default ``1``)
+
+        :type tokens: float
+        """
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _refill(self):
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate / self.per)
@@ -0,0 +1 @@
+from .sqlite_mirror import SqliteMirror
@@ -0,0 +1,383 @@
+import datetime
+import json
+import sqlite3
+import threading
+
+from moco_wrapper.util.coercion import parse_datetime
+from moco_wrapper.util.response import decoder
+
+
+class SqliteMirror(object):
+    """
+    Local copy of selected entities of the moco api in a SQLite database.
+
+    The first :meth:`sync` of an entity loads all of its items, every later one only requests the items that were
+    changed since the last sync (its watermark, the newest ``updated_at`` of the mirrored items). The mirrored items
+    can be queried without any request to the api:
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.mirror import SqliteMirror
+
+        m = Moco(auth={..})
+        mirror = SqliteMirror(m, "moco.sqlite", entities=["projects", "users", "activities"])
+
+        mirror.sync()  # full load the first time, changes only afterwards
+
+        for project in mirror.query("projects", where={"active": True, "leader.id": 5}, order_by="-updated_at"):
+            print(project.name)
+
+    Items are stored as json (one table per entity) and filtered with the json functions of SQLite, nested fields
+    are addressed with a dotted path (e.g. ``leader.id``).
+
+    .. note::
+
+        Deleted items are only removed by a full sync (``mirror.sync(full=True)``), the api does not report
+        deletions in its change listings. Items of entities with query parameters (see ``params``) are never
+        removed, items that no longer match the parameters can not be told apart from deleted ones.
+
+    .. note::
+
+        If the query parameters of an entity change, its next sync loads all items again.
+
+    .. note::
+
+        The mirror requests its pages as raw responses (see :class:`moco_wrapper.util.response.RawResponse`) and
+        needs a synchronous :class:`moco_wrapper.Moco` instance.
+    """
+
+    ENTITIES = {
+        "projects": ("project_getlist", "updated_from", "date"),
+        "companies": ("company_getlist", "updated_after", "datetime"),
+        "contacts": ("contact_getlist", "updated_after", "datetime"),
+        "users": ("user_getlist", "updated_after", "datetime"),
+        "deals": ("deal_getlist", "updated_after", "datetime"),
+        "invoices": ("invoice_getlist", "updated_after", "datetime"),
+        "activities": ("activity_getlist", "updated_after", "datetime"),
+    }
+    """
+    Entities that can be mirrored (name => list endpoint slug, query parameter for changes since the watermark and
+    whether the parameter takes a ``date`` or a ``datetime``)
+    """
+
+    def __init__(self, moco, path: str = ":memory:", entities: list = None, params: dict = None):
+        """
+        Class constructor
+
+        :param moco: Moco instance the items are requested with
+        :param path: Path of the SQLite database (default ``":memory:"``, in memory database)
+        :param entities: Names of the entities to mirror (default ``None``, all of :attr:`ENTITIES`)
+        :param params: Additional query parameters by entity name (e.g. ``{"activities": {"from": "2020-01-01",
+            "to": "2020-12-31"}}``, default ``None``)
+
+        :type path: str
+        :type entities: list
+        :type params: dict
+        """
+        self.moco = moco
+        self.entities = list(entities) if entities is not None else list(self.ENTITIES.keys())
+        self.params = params if params is not None else {}
+
+        for entity in self.entities:
+            self._check_entity(entity)
+
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._create_tables()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """
+        Connection to the SQLite database, e.g. for queries :meth:`query` does not support
+        """
+        return self._connection
+
+    def sync(self, entities: list = None, full: bool = False) -> dict:
+        """
+        Updates the mirrored items
+
+        :param entities: Names of the entities to update (default ``None``, all entities of the mirror)
+        :param full: If all items should be loaded again (default ``False``, only the changes since the last sync
+            are loaded if the entity was synced before). A full sync also removes deleted items
+
+        :type entities: list
+        :type full: bool
+
+        :returns: Number of items received by entity name
+        :rtype: dict
+        """
+        result = {}
+        for entity in (entities if entities is not None else self.entities):
+            self._check_entity(entity)
+            result[entity] = self._sync_entity(entity, full)
+
+        return result
+
+    def watermark(self, entity: str) -> str:
+        """
+        Returns the newest ``updated_at`` of the mirrored items of an entity
+
+        :param entity: Entity name
+
+        :type entity: str
+
+        :returns: Timestamp of the api, ``None`` if the entity was never synced
+        :rtype: str
+        """
+        self._check_entity(entity)
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT watermark FROM mirror_state WHERE entity = ?",
+                (entity, )
+            ).fetchone()
+
+        return row[0] if row is not None else None
+
+    def synced_at(self, entity: str) -> datetime.datetime:
+        """
+        Returns when an entity was synced the last time
+
+        :param entity: Entity name
+
+        :type entity: str
+
+        :returns: Time of the last sync (UTC), ``None`` if the entity was never synced
+        :rtype: datetime.datetime
+        """
+        self._check_entity(entity)
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT synced_at FROM mirror_state WHERE entity = ?",
+                (entity, )
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return parse_datetime(row[0])
+
+    def get(self, entity: str, item_id: int, raw: bool = False):
+        """
+        Returns a single mirrored item
+
+        :param entity: Entity name
+        :param item_id: Id of the item
+        :param raw: If the json data should be returned instead of the objector model (default ``False``)
+
+        :type entity: str
+        :type item_id: int
+        :type raw: bool
+
+        :returns: Item, ``None`` if it is not mirrored
+        """
+        self._check_entity(entity)
+
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM {} WHERE id = ?".format(entity),
+                (item_id, )
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return self._to_item(entity, row[0], raw)
+
+    def query(
+        self,
+        entity: str,
+        where: dict = None,
+        order_by: str = None,
+        limit: int = None,
+        raw: bool = False
+    ) -> list:
+        """
+        Returns the mirrored items of an entity
+
+        :param entity: Entity name
+        :param where: Fields (dotted path for nested fields) and the values they must be equal to, a list of values
+            matches any of them (default ``None``, all items)
+        :param order_by: Field the items are sorted by, a leading ``-`` sorts descending (default ``None``, by id)
+        :param limit: Maximum number of items (default ``None``)
+        :param raw: If the json data should be returned instead of objector models (default ``False``)
+
+        :type entity: str
+        :type where: dict
+        :type order_by: str
+        :type limit: int
+        :type raw: bool
+
+        :returns: List of items
+        :rtype: list
+
+        .. code-block:: python
+
+            mirror.query("activities", where={"user.id": [1, 2], "billable": True}, order_by="-date", limit=100)
+        """
+        self._check_entity(entity)
+
+        sql = ["SELECT data FROM {}".format(entity)]
+        values = []
+
+        clauses = []
+        for field, value in (where or {}).items():
+            if value is None:
+                clauses.append("json_extract(data, ?) IS NULL")
+                values.append(self._json_path(field))
+            elif isinstance(value, (list, tuple, set)):
+                clauses.append("json_extract(data, ?) IN ({})".format(", ".join("?" * len(value))))
+                values.append(self._json_path(field))
+                values.extend(value)
+            else:
+                clauses.append("json_extract(data, ?) = ?")
+                values.extend((self._json_path(field), value))
+
+        if clauses:
+            sql.append("WHERE " + " AND ".join(clauses))
+
+        if order_by is not None:
+            descending = order_by.startswith("-")
+            sql.append("ORDER BY json_extract(data, ?) {}, id".format("DESC" if descending else "ASC"))
+            values.append(self._json_path(order_by.lstrip("-")))
+        else:
+            sql.append("ORDER BY id")
+
+        if limit is not None:
+            sql.append("LIMIT ?")
+            values.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(" ".join(sql), values).fetchall()
+
+        return [self._to_item(entity, x[0], raw) for x in rows]
+
+    def count(self, entity: str) -> int:
+        """
+        Returns the number of mirrored items of an entity
+
+        :param entity: Entity name
+
+        :type entity: str
+
+        :rtype: int
+        """
+        self._check_entity(entity)
+
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM {}".format(entity)).fetchone()[0]
+
+    def close(self):
+        """
+        Closes the database connection
+        """
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _check_entity(self, entity):
+        """
+        Makes sure the entity is known (the name is used as table name)
+        """
+        if entity not in self.ENTITIES:
+            raise ValueError("Unknown entity {}, must be one of {}".format(entity, ", ".join(self.ENTITIES.keys())))
+
+    def _create_tables(self):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS mirror_state "
+                "(entity TEXT PRIMARY KEY, watermark TEXT, synced_at TEXT, params TEXT)"
+            )
+
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(mirror_state)")]
+            if "params" not in columns:
+                # database of an older version
+                self._connection.execute("ALTER TABLE mirror_state ADD COLUMN params TEXT")
+
+            for entity in self.entities:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS {} (id INTEGER PRIMARY KEY, updated_at TEXT, data TEXT NOT NULL)"
+                    .format(entity)
+                )
+
+    def _sync_entity(self, entity, full):
+        slug, delta_param, delta_type = self.ENTITIES[entity]
+        params = dict(self.params.get(entity, {}))
+        params_key = json.dumps(params, sort_keys=True, default=str)
+
+        with self._lock:
+            state = self._connection.execute(
+                "SELECT watermark, params FROM mirror_state WHERE entity = ?",
+                (entity, )
+            ).fetchone()
+
+        watermark = None
+        if not full and state is not None and state[1] == params_key:
+            # changed parameters can match items older than the watermark, they are loaded again
+            watermark = state[0]
+
+        if watermark is not None:
+            # the items changed at the watermark itself are requested again, replacing them does no harm
+            params[delta_param] = watermark[:10] if delta_type == "date" else watermark
+
+        synced_at = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+        received = 0
+        newest = watermark
+
+        received_ids = set()
+
+        # pages are requested without holding the lock, readers only wait while a page is written
+        for page in self.moco.pages(slug, params=params, raw=True):
+            items = decoder.decode_json(page.response)
+
+            rows = []
+            for item in items:
+                updated_at = item.get("updated_at", None)
+                if updated_at is not None and (newest is None or updated_at > newest):
+                    newest = updated_at
+
+                rows.append((item["id"], updated_at, json.dumps(item)))
+                received_ids.add(item["id"])
+
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO {} (id, updated_at, data) VALUES (?, ?, ?)".format(entity),
+                    rows
+                )
+
+            received += len(rows)
+
+        with self._lock, self._connection:
+            if watermark is None and not params:
+                # full load, items that were not received again were deleted (with parameters they might just no
+                # longer match them)
+                stored_ids = [row[0] for row in self._connection.execute("SELECT id FROM {}".format(entity))]
+                self._connection.executemany(
+                    "DELETE FROM {} WHERE id = ?".format(entity),
+                    [(x, ) for x in stored_ids if x not in received_ids]
+                )
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO mirror_state (entity, watermark, synced_at, params) VALUES (?, ?, ?, ?)",
+                (entity, newest, synced_at, params_key)
+            )
+
+        return received
+
+    def _to_item(self, entity, data, raw):
+        item = json.loads(data)
+        if raw:
+            return item
+
+        model = self.moco.endpoint_manager.get(self.ENTITIES[entity][0]).type
+        return model(**item)
+
+    @staticmethod
+    def _json_path(field):
+        return "$." + field
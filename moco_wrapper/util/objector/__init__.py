@@ -1,3 +1,5 @@
 from .raw import RawObjector
 from .default import DefaultObjector
 from .no_error import NoErrorObjector
+from .identity_map import IdentityMap
+from .columnar import ColumnarObjector
@@ -0,0 +1,87 @@
+from .default import DefaultObjector
+
+from moco_wrapper.util.columnar import Columns
+from moco_wrapper.util.response import ListResponse, PagedListResponse
+
+
+class ColumnarObjector(DefaultObjector):
+    """
+    Objector that converts the items of list responses into :class:`moco_wrapper.util.columnar.Columns` instead of
+    one object per item. The types of the columns are taken from the ``DTYPES`` of the objector model of the
+    endpoint, single objects and error responses are handled like the :class:`moco_wrapper.util.objector.DefaultObjector`
+    does.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.columnar import Columns
+        from moco_wrapper.util.objector import ColumnarObjector
+
+        m = Moco(
+            objector=ColumnarObjector(fields=["id", "date", "hours", "user.id", "project.id"])
+        )
+
+        activities = Columns.concat(
+            page.data for page in m.pages("activity_getlist", params={"from": "2020-01-01", "to": "2020-12-31"})
+        )
+
+    .. note::
+
+        The ``data`` (and ``items``) of list responses is a :class:`moco_wrapper.util.columnar.Columns` object
+        when this objector is used.
+    """
+
+    def __init__(self, fields: list = None, dtypes: dict = None):
+        """
+        Class constructor
+
+        :param fields: Fields (columns) to keep, nested fields as dotted path (e.g. ``user.id``)
+            (default ``None``, all top level fields)
+        :param dtypes: Types of fields, in addition to (or overwriting) the ones of the objector model
+            (default ``None``)
+
+        :type fields: list
+        :type dtypes: dict
+        """
+        super(ColumnarObjector, self).__init__()
+
+        self.fields = fields
+        self.dtypes = dtypes if dtypes is not None else {}
+
+    def convert(self, requestor_response):
+        if isinstance(requestor_response, (ListResponse, PagedListResponse)):
+            class_name = self.get_class_name_from_request_url(str(requestor_response.response.request.url))
+            model = self.get_class(class_name) if class_name is not None else None
+
+            return self._to_columns(requestor_response, model)
+
+        return super(ColumnarObjector, self).convert(requestor_response)
+
+    def convert_e(self, requestor_response, endpoint):
+        if isinstance(requestor_response, (ListResponse, PagedListResponse)):
+            return self._to_columns(requestor_response, endpoint.type)
+
+        return super(ColumnarObjector, self).convert_e(requestor_response, endpoint)
+
+    def dtypes_for(self, model) -> dict:
+        """
+        Returns the types of the fields of a model
+
+        :param model: Objector model class (or ``None``)
+
+        :returns: Dictionary of field => type
+        :rtype: dict
+        """
+        dtypes = dict(getattr(model, "DTYPES", {}))
+        dtypes.update(self.dtypes)
+
+        return dtypes
+
+    def _to_columns(self, requestor_response, model):
+        requestor_response._data = Columns.from_records(
+            requestor_response.items,
+            fields=self.fields,
+            dtypes=self.dtypes_for(model)
+        )
+
+        return requestor_response
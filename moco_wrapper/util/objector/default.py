@@ -1,6 +1,7 @@
 from .base import BaseObjector
 
-from moco_wrapper.util.response import EmptyResponse, PagedListResponse, ListResponse, ObjectResponse, ErrorResponse
+from moco_wrapper.util.response import EmptyResponse, PagedListResponse, ListResponse, ObjectResponse, ErrorResponse, \
+    StreamedListResponse
 
 from importlib import import_module
 
@@ -17,7 +18,21 @@ class DefaultObjector(BaseObjector):
 
     """
 
-    def __init__(self):
+    def __init__(self, coercer=None):
+        """
+        Class constructor
+
+        :param coercer: Coercer converting the typed fields (dates, amounts, statuses) of the json data before the
+            objects are created (see :class:`moco_wrapper.util.coercion.Coercer`, default ``None``, the json values
+            are kept)
+
+        :type coercer: :class:`moco_wrapper.util.coercion.Coercer`
+        """
+        self._routes = None
+        self._classes = None
+
+        self.coercer = coercer
+
         self.module_path = "moco_wrapper.models.objector_models"
 
         self.class_map = {
@@ -110,18 +125,6 @@ class DefaultObjector(BaseObjector):
                 "Offer": None,
             }
         }
-        """
-        Dictionary used to find the appropriate classes from url-part-path created in :meth:`get_class_name_from_request_url`
-
-        For example the path ``project=>tasks`` means ``ProjectTask`` is the responsible class. The dictionary contains the following:
-
-        .. code-block:: python
-
-            "projects": {
-                "base" => "Project",
-                "tasks" => "ProjectTask"
-            }
-        """
 
         self.error_module_path = "moco_wrapper.exceptions"
 
@@ -131,7 +134,10 @@ class DefaultObjector(BaseObjector):
             404: "NotFoundException",
             422: "UnprocessableException",
             429: "RateLimitException",
-            500: "ServerErrorException"
+            500: "ServerErrorException",
+            502: "ServerErrorException",
+            503: "ServerErrorException",
+            504: "ServerErrorException"
         }
         """
         Dictionary used to convert http status codes into the appropriate exceptions
@@ -144,6 +150,89 @@ class DefaultObjector(BaseObjector):
             }
         """
 
+    @property
+    def class_map(self) -> dict:
+        """
+        Dictionary used to find the appropriate classes from url-part-path created in :meth:`get_class_name_from_request_url`
+
+        For example the path ``project=>tasks`` means ``ProjectTask`` is the responsible class. The dictionary contains the following:
+
+        .. code-block:: python
+
+            "projects": {
+                "base" => "Project",
+                "tasks" => "ProjectTask"
+            }
+
+        .. note:: The map is compiled into a route table on first use. Assigning a new map resets the table, after modifying the map in place call :meth:`compile_routes`
+        """
+        return self._class_map
+
+    @class_map.setter
+    def class_map(self, value):
+        self._class_map = value
+        self._routes = None
+
+    @property
+    def module_path(self) -> str:
+        """
+        Path of the module the classes of :attr:`class_map` are looked up in
+        """
+        return self._module_path
+
+    @module_path.setter
+    def module_path(self, value):
+        self._module_path = value
+        self._routes = None
+
+    def compile_routes(self):
+        """
+        Compiles :attr:`class_map` into a route table (path without ids => class name) and resolves the classes of
+        :attr:`module_path`, so looking up the class of a url is a single dictionary access
+        """
+        routes = {}
+        classes = {}
+        module = import_module(self.module_path)
+
+        def walk(path, node):
+            if isinstance(node, dict):
+                if "base" in node.keys() and path:
+                    walk(path, node["base"])
+
+                for key, value in node.items():
+                    if key != "base":
+                        walk(path + (key, ), value)
+            else:
+                routes[path] = node
+                if node is not None and hasattr(module, node):
+                    classes[node] = getattr(module, node)
+
+        walk((), self.class_map)
+
+        self._routes = routes
+        self._classes = classes
+
+    def get_class(self, class_name: str):
+        """
+        Returns the class of :attr:`module_path` with the given name
+
+        :param class_name: Name of the class
+
+        :type class_name: str
+
+        :returns: Class
+        """
+        if self._routes is None:
+            self.compile_routes()
+
+        class_ = self._classes.get(class_name, None)
+        if class_ is None:
+            # not part of the class map, raises if the class does not exist
+            class_ = getattr(import_module(self.module_path), class_name)
+            self._classes[class_name] = class_
+
+        return class_
+
     def convert(self, requestor_response):
         """
         Converts the data of a response object (for example json) into a python object.
@@ -157,26 +246,20 @@ class DefaultObjector(BaseObjector):
         """
         http_response = requestor_response.response
 
-        if isinstance(requestor_response, (ObjectResponse, ListResponse, PagedListResponse)):
-            class_name = self.get_class_name_from_request_url(http_response.request.url)
+        if isinstance(requestor_response, (ObjectResponse, ListResponse, PagedListResponse, StreamedListResponse)):
+            class_name = self.get_class_name_from_request_url(str(http_response.request.url))
             if class_name is not None:
-                class_ = getattr(
-                    import_module(self.module_path),
-                    class_name
-                )
+                class_ = self.get_class(class_name)
 
                 if isinstance(requestor_response, ObjectResponse):
+                    self._coerce(class_, [requestor_response.data])
                     obj = class_(**requestor_response.data)
                     requestor_response._data = obj
                 elif isinstance(requestor_response, (ListResponse, PagedListResponse)):
-                    new_items = []
-
-                    for item in requestor_response.items:
-                        new_items.append(
-                            class_(**item)
-                        )
-
-                    requestor_response._data = new_items
+                    self._coerce(class_, requestor_response.items)
+                    requestor_response._data = [class_(**item) for item in requestor_response.items]
+                elif isinstance(requestor_response, StreamedListResponse):
+                    requestor_response.map(self._item_converter(class_))
 
         elif isinstance(requestor_response, ErrorResponse):
             # convert the data for the error response into an actual exception
@@ -198,11 +281,16 @@ class DefaultObjector(BaseObjector):
         http_response = requestor_response.response
 
         if isinstance(requestor_response, ObjectResponse) and endpoint.type is not None:
+            self._coerce(endpoint.type, [requestor_response.data])
             obj = endpoint.type(**requestor_response.data)
             requestor_response._data = obj
         elif isinstance(requestor_response, (ListResponse, PagedListResponse)) and endpoint.type is not None:
+            self._coerce(endpoint.type, requestor_response.items)
             obj_list = [endpoint.type(**x) for x in requestor_response.items]
             requestor_response._data = obj_list
+        elif isinstance(requestor_response, StreamedListResponse) and endpoint.type is not None:
+            # items are converted one by one while they are streamed
+            requestor_response.map(self._item_converter(endpoint.type))
         elif isinstance(requestor_response, ErrorResponse):
             # convert the data for the error response into an actual exception
             class_name = self.get_error_class_name_from_response_status_code(http_response.status_code)
@@ -219,6 +307,26 @@ class DefaultObjector(BaseObjector):
 
         return requestor_response
 
+    def _item_converter(self, class_):
+        """
+        Returns a function converting a single json item into an object (for streamed responses)
+        """
+        def convert_item(item):
+            if not isinstance(item, dict):
+                return item
+
+            self._coerce(class_, [item])
+            return class_(**item)
+
+        return convert_item
+
+    def _coerce(self, class_, records):
+        """
+        Converts the typed fields of json records with the :attr:`coercer` (if there is one)
+        """
+        if self.coercer is not None and isinstance(class_, type):
+            self.coercer.coerce(class_, [x for x in records if isinstance(x, dict)])
+
     def get_error_class_name_from_response_status_code(self, status_code) -> str:
         """
         Get the class name of the exception class based on the given http status code
@@ -290,14 +398,29 @@ class DefaultObjector(BaseObjector):
         We use the path we generated and walk our class_map until we get the entry at the end of the path. In our case that would be ``ProjectTask``. As this value is a string that is our final classname.
 
         .. note:: if the final value is a dictionary, the base case will be returned. For example if path was ``projects``, the value at the end of our path is a dictionary. If that is the case the *base* key will be used.
+
+        .. note:: The walk is done once for all paths of the map, the results are kept in the route table (see :meth:`compile_routes`)
         """
+        if self._routes is None:
+            self.compile_routes()
 
-        parts = url.split("/api/v1/")[-1].split("/")
+        # remove query string parameters and ids
+        path = url.split("/api/v1/")[-1].split("?")[0]
+        parts = tuple(x for x in path.split("/") if not x.isdigit())
 
-        # remove ids and query string parameters
-        parts = [x for x in parts if not x.isdigit()]
-        if "?" in parts[-1]:
-            parts[-1] = parts[-1].split("?")[0]
+        try:
+            return self._routes[parts]
+        except KeyError:
+            pass
+
+        # every path of the class map is in the route table, the walk only finds entries added to the map in place
+        # (or raises), its result is not stored so unknown urls do not grow the table
+        return self._walk_class_map(list(parts))
+
+    def _walk_class_map(self, parts):
+        """
+        Finds the class name of a path (without ids) by walking :attr:`class_map`
+        """
 
         # find classname by walking the classname
         # pop the first item from the stack
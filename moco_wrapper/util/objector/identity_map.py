@@ -0,0 +1,157 @@
+import collections
+import threading
+
+
+class IdentityMap(object):
+    """
+    Deduplicates the nested entities of objector models.
+
+    The same user, company or project is nested in many activities, invoices or planning entries. Objects that
+    share an identity map build every nested entity (by model and id) only once, all later occurrences reuse that
+    object. Fields that the first occurrence did not contain are added from later ones of the same response. An
+    occurrence in a later response overwrites the fields it contains, so a long-lived map does not keep returning
+    stale data (if both occurrences have an ``updated_at``, the more recently updated one wins).
+
+    An identity map can be used for a single call, for all pages of :meth:`moco_wrapper.Moco.paginate` or for every
+    call of a :class:`moco_wrapper.Moco` instance:
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.objector import IdentityMap
+
+        m = Moco(auth={..})
+
+        # single call
+        activities = m.get("activity_getlist", params={"from": "2020-01-01", "to": "2020-01-31"}, identity_map=True)
+
+        # all pages
+        for activity in m.paginate("activity_getlist", params={..}, identity_map=True):
+            print(activity.user.id)
+
+        # every call, at most 10000 entities are kept
+        m = Moco(auth={..}, identity_map=IdentityMap(maxsize=10000))
+
+    .. warning::
+
+        Shared entities are the same object everywhere they appear, modifying one modifies all of them.
+    """
+
+    def __init__(self, maxsize: int = None):
+        """
+        Class constructor
+
+        :param maxsize: Maximum number of entities, the least recently used ones are dropped first
+            (default ``None``, unbounded)
+
+        :type maxsize: int
+        """
+        self.maxsize = maxsize
+
+        self._lock = threading.Lock()
+        self._entities = collections.OrderedDict()  # (model, id) => (entity, generation of the data it was set from)
+        self._scope = _ResponseScope(self, 0)
+
+    def __len__(self):
+        return len(self._entities)
+
+    def scope(self):
+        """
+        Returns a view of the map for the entities of a new response, entities that were created from older
+        responses are updated with the data of this one
+
+        :returns: Object with the :meth:`get_or_create` and :meth:`attach` methods of the map
+        """
+        with self._lock:
+            self._scope = _ResponseScope(self, self._scope.generation + 1)
+            return self._scope
+
+    def get_or_create(self, model, data: dict):
+        """
+        Returns the object of an entity, creating it if the map does not contain it yet
+
+        :param model: Objector model class
+        :param data: Json data of the entity (of the newest response, see :meth:`scope`)
+
+        :type data: dict
+
+        :returns: Objector model object
+        """
+        return self._get_or_create(model, data, self._scope)
+
+    def attach(self, obj):
+        """
+        Makes the nested entities of an objector model object use this identity map
+
+        :param obj: Objector model object (other objects are ignored)
+        """
+        self._scope.attach(obj)
+
+    def clear(self):
+        """
+        Drops all entities
+        """
+        with self._lock:
+            self._entities.clear()
+
+    def _get_or_create(self, model, data, scope):
+        entity_id = data.get("id", None)
+        if entity_id is None:
+            return self._create(model, data, scope)
+
+        key = (model, entity_id)
+        newer = False
+
+        with self._lock:
+            found = self._entities.get(key, None)
+            if found is not None:
+                self._entities.move_to_end(key)
+
+                entity, generation = found
+                newer = scope.generation > generation
+                if newer:
+                    self._entities[key] = (entity, scope.generation)
+
+        if found is not None:
+            if hasattr(entity, "merge"):
+                entity.merge(data, newer=newer)
+            return entity
+
+        entity = self._create(model, data, scope)
+
+        with self._lock:
+            # another thread might have created the entity in the meantime
+            entity = self._entities.setdefault(key, (entity, scope.generation))[0]
+            self._entities.move_to_end(key)
+
+            if self.maxsize is not None:
+                while len(self._entities) > self.maxsize:
+                    self._entities.popitem(last=False)
+
+        return entity
+
+    @staticmethod
+    def _create(model, data, scope):
+        entity = model(**data)
+        scope.attach(entity)
+
+        return entity
+
+
+class _ResponseScope(object):
+    """
+    Identity map of the entities of one response (see :meth:`IdentityMap.scope`)
+    """
+
+    __slots__ = ("identity_map", "generation")
+
+    def __init__(self, identity_map, generation: int):
+        self.identity_map = identity_map
+        self.generation = generation
+
+    def get_or_create(self, model, data: dict):
+        return self.identity_map._get_or_create(model, data, self)
+
+    def attach(self, obj):
+        if hasattr(obj, "_identity_map"):
+            obj._identity_map = self
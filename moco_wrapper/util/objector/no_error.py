@@ -1,5 +1,5 @@
 from . import DefaultObjector
-from moco_wrapper.util.response import ObjectResponse, ListResponse, PagedListResponse
+from moco_wrapper.util.response import ObjectResponse, ListResponse, PagedListResponse, StreamedListResponse
 
 
 class NoErrorObjector(DefaultObjector):
@@ -35,13 +35,13 @@ class NoErrorObjector(DefaultObjector):
 
         .. note:: if the method :meth:`get_class_name_from_request_url` that is used to find the right class for conversion, returns ``None``, no conversion of objects will take place
         """
-        if isinstance(requestor_response, (ObjectResponse, ListResponse, PagedListResponse)):
+        if isinstance(requestor_response, (ObjectResponse, ListResponse, PagedListResponse, StreamedListResponse)):
             return super(NoErrorObjector, self).convert(requestor_response)
 
         return requestor_response
 
     def convert_e(self, requestor_response, endpoint):
-        if isinstance(requestor_response, (ObjectResponse, ListResponse, PagedListResponse)):
+        if isinstance(requestor_response, (ObjectResponse, ListResponse, PagedListResponse, StreamedListResponse)):
             return super(NoErrorObjector, self).convert_e(requestor_response, endpoint)
 
         return requestor_response
@@ -1,3 +1,21 @@
+import sys
+
+from .session import create_session
+from .retry import RetryPolicy
 from .default import DefaultRequestor
 from .raw import RawRequestor
 from .no_retry import NoRetryRequestor
+
+
+def __getattr__(name):
+    # asyncio is only imported by clients that use it
+    if name == "AsyncRequestor":
+        from .asynchronous import AsyncRequestor
+        return AsyncRequestor
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info < (3, 7):  # pragma: no cover
+    # module level __getattr__ needs python 3.7, older versions import everything up front
+    AsyncRequestor = __getattr__("AsyncRequestor")
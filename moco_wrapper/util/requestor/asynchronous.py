@@ -0,0 +1,195 @@
+import asyncio
+
+from moco_wrapper.exceptions import DeadlineExceededException
+from moco_wrapper.util.requestor.base import BaseRequestor
+from moco_wrapper.util.requestor.retry import RetryPolicy
+from moco_wrapper.util.response import ErrorResponse
+from moco_wrapper.util.tracing import NOOP_TRACER
+
+
+class AsyncRequestor(BaseRequestor):
+    """
+    Requestor class that is used by the :class:`moco_wrapper.AsyncMoco` instance.
+
+    Requests are sent with an ``httpx.AsyncClient``, so every request method of this requestor returns a coroutine.
+    Like the :class:`moco_wrapper.util.requestor.DefaultRequestor` it waits a bit and tries the request again
+    when it sees the error code 429 (too many requests), as decided by its
+    :class:`moco_wrapper.util.requestor.RetryPolicy`.
+
+    .. note::
+
+        This requestor needs the ``httpx`` package (``pip install moco-wrapper[async]``)
+
+    .. seealso::
+        :class:`moco_wrapper.util.requestor.DefaultRequestor`
+    """
+
+    def __init__(
+        self,
+        delay_ms: float = 1000.0,
+        rate_limiter=None,
+        retry_policy: RetryPolicy = None,
+        **client_kwargs
+    ):
+        """
+        Class constructor
+
+        :param delay_ms: How long the requestor should wait before retrying the resource the first time,
+            the delay grows with every further retry (default 1000).
+        :param rate_limiter: Rate limiter that throttles requests before they are sent
+            (see :class:`moco_wrapper.util.limiter.RateLimiter`, default ``None``)
+        :param retry_policy: Policy deciding if and when failed requests are retried
+            (default ``None``, a :class:`moco_wrapper.util.requestor.RetryPolicy` with ``delay_ms`` as backoff)
+        :param client_kwargs: Additional arguments for the ``httpx.AsyncClient`` (e.g. ``limits``)
+
+        .. code-block:: python
+
+            import httpx
+            from moco_wrapper.util.requestor import AsyncRequestor
+            from moco_wrapper import AsyncMoco
+
+            requestor = AsyncRequestor(
+                limits=httpx.Limits(max_connections=200)
+            )
+
+            m = AsyncMoco(
+                requestor = requestor
+            )
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("The AsyncRequestor needs the httpx package, install it with: pip install httpx")
+
+        self._session = httpx.AsyncClient(**client_kwargs)
+        self._connection_errors = (httpx.TransportError, )
+
+        self.delay_milliseconds_on_error = delay_ms
+        self.rate_limiter = rate_limiter
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy(backoff_ms=delay_ms)
+
+        self.retry_policy = retry_policy
+
+    @property
+    def session(self):
+        """
+        Http client this requestor uses (``httpx.AsyncClient``)
+        """
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: dict = None,
+        data: dict = None,
+        deadline: float = None,
+        raw: bool = False,
+        stream: bool = False,
+        on_retry=None,
+        tracer=None,
+        **kwargs
+    ):
+        """
+        Request the given resource.
+
+        :param method: HTTP Method (eg. POST, GET, PUT, DELETE)
+        :param path: Path of the resource (e.g. ``/projects``)
+        :param params: Url parameters (e.g. ``page=1``, query parameters) (default ``None``)
+        :param data: Dictionary with data (http body) (default ``None``)
+        :param deadline: Seconds the request may take in total, including all retries and the time waited in
+            between (default ``None``)
+        :param raw: If the body of a successful response should be passed through undecoded (default ``False``)
+        :param stream: Streamed responses are not supported by this requestor, ``True`` raises a ``ValueError``
+            (default ``False``)
+        :param on_retry: Function called before a retry with the number of the failed attempt, the delay in seconds
+            and the ``response`` or ``exception`` of the failed attempt (default ``None``)
+        :param tracer: Tracer recording spans for every attempt, retry wait and the decoding of the response
+            (default ``None``, see :mod:`moco_wrapper.util.tracing`)
+        :param kwargs: Additional http arguments.
+
+        :type method: str
+        :type path: str
+        :type params: dict
+        :type data: dict
+        :type deadline: float
+        :type raw: bool
+        :type stream: bool
+        :type on_retry: callable
+
+        :returns: Response object
+
+        :raises moco_wrapper.exceptions.DeadlineExceededException: if the deadline expires before a response
+            was received
+        """
+        if stream:
+            raise ValueError("Streamed responses need a synchronous requestor")
+
+        if tracer is None:
+            tracer = NOOP_TRACER
+
+        request = self._request(method, path, params, data, raw, on_retry, tracer, **kwargs)
+        if deadline is None:
+            return await request
+
+        try:
+            return await asyncio.wait_for(request, deadline)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededException(None, "Deadline exceeded")
+
+    async def _request(self, method, path, params, data, raw, on_retry, tracer, **kwargs):
+        """
+        Sends the request and retries it as decided by the retry policy
+        """
+        if params is not None:
+            params = self._format_params(params)
+
+        attempt = 1
+        while True:
+            # wait until the rate limiter allows the request
+            rate_limit_delay = self._rate_limit_delay(path, kwargs.get("headers"))
+            if rate_limit_delay > 0:
+                await asyncio.sleep(rate_limit_delay)
+
+            try:
+                with tracer.span("moco.send", self._span_attributes(method, path, attempt)) as span:
+                    response = await self.session.request(method, path, params=params, json=data, **kwargs)
+                    span.set_attribute("http.status_code", response.status_code)
+            except self._connection_errors as ex:
+                retry_delay = self.retry_policy.retry_delay(method, attempt, connection_error=ex)
+                if retry_delay is None:
+                    raise
+
+                if on_retry is not None:
+                    on_retry(attempt, retry_delay, exception=ex)
+
+                with tracer.span("moco.retry_wait", {"moco.attempt": attempt, "moco.retry_delay": retry_delay}):
+                    await asyncio.sleep(retry_delay)
+                attempt += 1
+                continue
+
+            # convert the response into an MWRAPResponse object
+            with tracer.span("moco.decode"):
+                response_obj = self._convert_response(response, raw=raw)
+
+            if isinstance(response_obj, ErrorResponse):
+                retry_delay = self.retry_policy.retry_delay(method, attempt, response=response)
+                if retry_delay is not None:
+                    # error is recoverable, wait and try the resource again
+                    if on_retry is not None:
+                        on_retry(attempt, retry_delay, response=response)
+
+                    with tracer.span("moco.retry_wait", {"moco.attempt": attempt, "moco.retry_delay": retry_delay}):
+                        await asyncio.sleep(retry_delay)
+                    attempt += 1
+                    continue
+
+            return response_obj
+
+    async def close(self):
+        """
+        Closes the http client and all of its connections
+        """
+        await self.session.aclose()
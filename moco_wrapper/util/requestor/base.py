@@ -1,11 +1,36 @@
+import time
+
+from moco_wrapper.exceptions import DeadlineExceededException
+from moco_wrapper.util.response.decoder import decode_json, starts_json_array
+from moco_wrapper.util.response import PagedListResponse, ListResponse, ObjectResponse, ErrorResponse, EmptyResponse, \
+    FileResponse, NotModifiedResponse, RawResponse, StreamedListResponse
+
+
 class BaseRequestor(object):
     """
     Base class all other Requestor classes inherit from
     """
 
-    ERROR_STATUS_CODES = [400, 401, 403, 404, 422, 429, 500]
+    ERROR_STATUS_CODES = [400, 401, 403, 404, 422, 429, 500, 502, 503, 504]
     SUCCESS_STATUS_CODES = [200, 201, 204]
 
+    DEFAULT_TIMEOUT = (10.0, 60.0)
+    """
+    Default ``(connect, read)`` timeout in seconds of the requestors that send requests over the network
+    """
+
+    json_decoder = None
+    """
+    Function json response bodies are decoded with
+    (default ``None``, see :func:`moco_wrapper.util.response.decoder.get_decoder`)
+    """
+
+    rate_limiter = None
+    """
+    Client side rate limiter the requestor throttles its requests with
+    (see :class:`moco_wrapper.util.limiter.RateLimiter`, default ``None``)
+    """
+
     @property
     def session(self):
         return None
@@ -43,3 +68,161 @@ class BaseRequestor(object):
                 new_params[key] = value
 
         return new_params
+
+    def _rate_limit_delay(self, path, headers) -> float:
+        """
+        Reserves a request at the assigned rate limiter
+
+        :param path: Full url of the request
+        :param headers: Http headers of the request
+        :returns: Seconds to wait before the request may be sent (``0`` if no rate limiter is assigned)
+        """
+        if self.rate_limiter is None:
+            return 0
+
+        return self.rate_limiter.reserve(path, headers)
+
+    def _deadline_expires_at(self, deadline):
+        """
+        Converts a deadline (seconds from now) into the point in time (:func:`time.monotonic`) it expires at
+
+        :param deadline: Seconds the request may take in total or ``None``
+        :returns: Expiry time or ``None`` if there is no deadline
+        """
+        if deadline is None:
+            return None
+
+        return time.monotonic() + deadline
+
+    def _deadline_remaining(self, expires_at, response=None) -> float:
+        """
+        Returns the seconds left until the deadline expires
+
+        :param expires_at: Expiry time (see :meth:`_deadline_expires_at`) or ``None``
+        :param response: Last http response, attached to the exception (default ``None``)
+        :returns: Remaining seconds, ``None`` if there is no deadline
+
+        :raises DeadlineExceededException: if the deadline has already expired
+        """
+        if expires_at is None:
+            return None
+
+        remaining = expires_at - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededException(response, "Deadline exceeded")
+
+        return remaining
+
+    def _sleep(self, seconds, expires_at, response=None):
+        """
+        Waits for the given time, but fails right away if the deadline would expire in the meantime
+        """
+        remaining = self._deadline_remaining(expires_at, response)
+        if remaining is not None and seconds >= remaining:
+            raise DeadlineExceededException(response, "Deadline exceeded")
+
+        time.sleep(seconds)
+
+    def _cap_timeout(self, timeout, remaining):
+        """
+        Limits a (connect, read) timeout to the time that is left until the deadline
+
+        :param timeout: Single timeout value, ``(connect, read)`` tuple or ``None``
+        :param remaining: Seconds left until the deadline or ``None``
+        :returns: New timeout
+        """
+        if remaining is None:
+            return timeout
+
+        if timeout is None:
+            return remaining
+
+        if isinstance(timeout, tuple):
+            return tuple(remaining if x is None else min(x, remaining) for x in timeout)
+
+        return min(timeout, remaining)
+
+    def _span_attributes(self, method, path, attempt) -> dict:
+        """
+        Returns the attributes of the tracing span of a single attempt of a request
+
+        :param method: Http method
+        :param path: Full url of the request
+        :param attempt: Number of the attempt
+        :returns: Span attributes
+        """
+        return {
+            "http.method": method,
+            "http.url": path,
+            "moco.attempt": attempt
+        }
+
+    def _convert_response(self, response, raw: bool = False, stream: bool = False):
+        """
+        Converts the http response into the matching response object (see :ref:`response`)
+
+        :param response: http response object
+        :param raw: If the body of a successful response should be passed through undecoded (default ``False``,
+            see :class:`moco_wrapper.util.response.RawResponse`)
+        :param stream: If the json list of a successful response should be decoded while it is read (default
+            ``False``, see :class:`moco_wrapper.util.response.StreamedListResponse`), other bodies are decoded as
+            usual
+        :returns: Response object (``None`` if the status code is unknown)
+        """
+        try:
+            # check if the response has a success status code
+            if response.status_code in self.SUCCESS_STATUS_CODES:
+                if raw:
+                    return RawResponse(response)
+
+                # filter by content type what type of response this is
+                if response.status_code == 204:
+                    # no content but success
+                    return EmptyResponse(response)
+
+                content = None
+                if stream and response.headers.get("Content-Type", None) != "application/pdf":
+                    is_list, chunks = starts_json_array(response.iter_content(StreamedListResponse.CHUNK_SIZE))
+                    if is_list:
+                        # the body is read while the items are iterated over
+                        return StreamedListResponse(response, chunks=chunks)
+
+                    # any other body is read at once and decoded like a response that was not streamed
+                    content = b"".join(chunks)
+                    if hasattr(response, "_content"):
+                        # keep the body readable on the response object (requests does not allow it after streaming)
+                        response._content = content
+
+                    if not content.strip():
+                        return EmptyResponse(response)
+                else:
+                    if response.status_code == 200 and not response.content.strip():
+                        # touch endpoint returns 200 with no content
+                        return EmptyResponse(response)
+
+                    if response.headers["Content-Type"] == "application/pdf":
+                        return FileResponse(response)
+
+                # json response handling is the default, the body is decoded only once
+                response_content = decode_json(response, self.json_decoder, content)
+
+                # if response is a list, return list response
+                if isinstance(response_content, list):
+                    if "X-Page" in response.headers:
+                        return PagedListResponse(response, response_content)  # response is a paged list
+                    else:
+                        return ListResponse(response, response_content)  # response is an unpaged list
+
+                # return single json response
+                return ObjectResponse(response, response_content)
+
+            # conditional request, the resource did not change
+            if response.status_code == 304:
+                return NotModifiedResponse(response)
+
+            # check if the response has an error status code
+            if response.status_code in self.ERROR_STATUS_CODES:
+                return ErrorResponse(response)
+
+        except ValueError:
+            return ErrorResponse(response)
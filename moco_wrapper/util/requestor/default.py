@@ -2,7 +2,10 @@ import requests
 import time
 
 from moco_wrapper.util.requestor.base import BaseRequestor
-from moco_wrapper.util.response import PagedListResponse, ListResponse, ObjectResponse, ErrorResponse, EmptyResponse, FileResponse
+from moco_wrapper.util.requestor.retry import RetryPolicy
+from moco_wrapper.util.requestor.session import create_session
+from moco_wrapper.util.response import ErrorResponse
+from moco_wrapper.util.tracing import NOOP_TRACER
 
 
 class DefaultRequestor(BaseRequestor):
@@ -10,7 +13,8 @@ class DefaultRequestor(BaseRequestor):
     Default Requestor class that is used by the :class:`moco_wrapper.Moco` instance.
 
     When the default requestor requests a resources and it sees the error code 429 (too many requests),
-    it waits a bit and then tries the request again. If you do not want that behaviour, use
+    it waits a bit and then tries the request again. How often and how long it waits is decided by its
+    :class:`moco_wrapper.util.requestor.RetryPolicy`. If you do not want that behaviour, use
     :class:`moco_wrapper.util.requestor.NoRetryRequestor`.
 
     .. seealso::
@@ -19,12 +23,47 @@ class DefaultRequestor(BaseRequestor):
 
     def __init__(
         self,
-        delay_ms: float = 1000.0
+        delay_ms: float = 1000.0,
+        rate_limiter=None,
+        retry_policy: RetryPolicy = None,
+        session: requests.Session = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout=BaseRequestor.DEFAULT_TIMEOUT
     ):
         """
         Class constructor
 
-        :param delay_ms: How long the requestor should wait before retrying the resource again (default 1000).
+        :param delay_ms: How long the requestor should wait before retrying the resource the first time,
+            the delay grows with every further retry (default 1000).
+        :param rate_limiter: Rate limiter that throttles requests before they are sent
+            (see :class:`moco_wrapper.util.limiter.RateLimiter`, default ``None``)
+        :param retry_policy: Policy deciding if and when failed requests are retried
+            (default ``None``, a :class:`moco_wrapper.util.requestor.RetryPolicy` with ``delay_ms`` as backoff)
+        :param session: Http session to use, pass the same session to several requestors to share
+            its connection pool (default ``None``, a new session is created, see
+            :func:`moco_wrapper.util.requestor.create_session`)
+        :param pool_connections: Number of hosts connection pools are kept for (default ``10``)
+        :param pool_maxsize: Maximum number of connections kept per host (default ``10``)
+        :param pool_block: If requests wait for a free connection when the pool is exhausted (default ``False``)
+        :param keep_alive: If TCP keep-alive is enabled on the connections (default ``True``)
+        :param timeout: Timeout in seconds for every request, either a single value or a ``(connect, read)`` tuple,
+            ``None`` disables the timeout (default :attr:`DEFAULT_TIMEOUT`)
+
+        :type delay_ms: float
+        :type retry_policy: :class:`moco_wrapper.util.requestor.RetryPolicy`
+        :type session: :class:`requests.Session`
+        :type pool_connections: int
+        :type pool_maxsize: int
+        :type pool_block: bool
+        :type keep_alive: bool
+        :type timeout: float, tuple
+
+        .. note::
+
+            The pool arguments are ignored if a ``session`` is passed
 
         Overwrite delay:
 
@@ -42,9 +81,24 @@ class DefaultRequestor(BaseRequestor):
                 requestor = lazy_requestor
             )
         """
-        self._session = requests.Session()
+        if session is None:
+            session = create_session(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive
+            )
+
+        self._session = session
+        self.timeout = timeout
 
         self.delay_milliseconds_on_error = delay_ms
+        self.rate_limiter = rate_limiter
+
+        if retry_policy is None:
+            retry_policy = RetryPolicy(backoff_ms=delay_ms)
+
+        self.retry_policy = retry_policy
 
     @property
     def session(self):
@@ -60,6 +114,11 @@ class DefaultRequestor(BaseRequestor):
         params: dict = None,
         data: dict = None,
         delay_ms: float = 0,
+        deadline: float = None,
+        raw: bool = False,
+        stream: bool = False,
+        on_retry=None,
+        tracer=None,
         **kwargs
     ):
         """
@@ -71,6 +130,15 @@ class DefaultRequestor(BaseRequestor):
         :param data: Dictionary with data (http body) (default ``None``)
         :param delay_ms: Delay in milliseconds the requestor should wait before sending the request
             (used for retrying, default ``0``)
+        :param deadline: Seconds the request may take in total, including all retries and the time waited in
+            between (default ``None``)
+        :param raw: If the body of a successful response should be passed through undecoded (default ``False``)
+        :param stream: If the json list of a successful response should be decoded while it is downloaded
+            (default ``False``, see :class:`moco_wrapper.util.response.StreamedListResponse`)
+        :param on_retry: Function called before a retry with the number of the failed attempt, the delay in seconds
+            and the ``response`` or ``exception`` of the failed attempt (default ``None``)
+        :param tracer: Tracer recording spans for every attempt, retry wait and the decoding of the response
+            (default ``None``, see :mod:`moco_wrapper.util.tracing`)
         :param kwargs: Additional http arguments.
 
         :type method: str
@@ -78,9 +146,18 @@ class DefaultRequestor(BaseRequestor):
         :type params: dict
         :type data: dict
         :type delay_ms: float
+        :type deadline: float
+        :type raw: bool
+        :type stream: bool
+        :type on_retry: callable
 
         :returns: Response object
+
+        :raises moco_wrapper.exceptions.DeadlineExceededException: if the deadline expires before a response
+            was received
         """
+        expires_at = self._deadline_expires_at(deadline)
+
         # if the request is being retried wait for a bit to not trigger 429 error responses
         if delay_ms > 0:
             time.sleep(delay_ms / 1000.0)
@@ -88,63 +165,77 @@ class DefaultRequestor(BaseRequestor):
         if params is not None:
             params = self._format_params(params)
 
+        if stream:
+            kwargs["stream"] = True
+
+        timeout = kwargs.pop("timeout", self.timeout)
+
+        if tracer is None:
+            tracer = NOOP_TRACER
+
+        attempt = 1
         response = None
+        while True:
+            # wait until the rate limiter allows the request
+            rate_limit_delay = self._rate_limit_delay(path, kwargs.get("headers"))
+            if rate_limit_delay > 0:
+                self._sleep(rate_limit_delay, expires_at, response)
+
+            remaining = self._deadline_remaining(expires_at, response)
+
+            try:
+                with tracer.span("moco.send", self._span_attributes(method, path, attempt)) as span:
+                    response = self._send(method, path, params, data, timeout=self._cap_timeout(timeout, remaining),
+                                          **kwargs)
+                    span.set_attribute("http.status_code", response.status_code)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as ex:
+                retry_delay = self.retry_policy.retry_delay(method, attempt, connection_error=ex)
+                if retry_delay is None:
+                    raise
+
+                if on_retry is not None:
+                    on_retry(attempt, retry_delay, exception=ex)
+
+                with tracer.span("moco.retry_wait", {"moco.attempt": attempt, "moco.retry_delay": retry_delay}):
+                    self._sleep(retry_delay, expires_at, response)
+                attempt += 1
+                continue
+
+            # convert the response into an MWRAPResponse object
+            with tracer.span("moco.decode"):
+                response_obj = self._convert_response(response, raw=raw, stream=stream)
+
+            if isinstance(response_obj, ErrorResponse):
+                retry_delay = self.retry_policy.retry_delay(method, attempt, response=response)
+
+                # only retry if the next attempt can be started before the deadline
+                if retry_delay is not None and (expires_at is None or time.monotonic() + retry_delay < expires_at):
+                    # error is recoverable, wait and try the resource again
+                    if on_retry is not None:
+                        on_retry(attempt, retry_delay, response=response)
+
+                    with tracer.span("moco.retry_wait", {"moco.attempt": attempt, "moco.retry_delay": retry_delay}):
+                        time.sleep(retry_delay)
+                    attempt += 1
+                    continue
+
+            return response_obj
+
+    def _send(self, method, path, params, data, **kwargs):
+        """
+        Sends the request with the session of this requestor
+
+        :returns: http response object
+        """
         if method == "GET":
-            response = self.session.get(path, params=params, json=data, **kwargs)
+            return self.session.get(path, params=params, json=data, **kwargs)
         elif method == "POST":
-            response = self.session.post(path, params=params, json=data, **kwargs)
+            return self.session.post(path, params=params, json=data, **kwargs)
         elif method == "DELETE":
-            response = self.session.delete(path, params=params, json=data, **kwargs)
+            return self.session.delete(path, params=params, json=data, **kwargs)
         elif method == "PUT":
-            response = self.session.put(path, params=params, json=data, **kwargs)
+            return self.session.put(path, params=params, json=data, **kwargs)
         elif method == "PATCH":
-            response = self.session.patch(path, params=params, json=data, **kwargs)
-
-        # convert the response into an MWRAPResponse object
-        try:
-            # check if the response has a success status code
-            if response.status_code in self.SUCCESS_STATUS_CODES:
-                if response.status_code == 204:
-                    # no content but success
-                    return EmptyResponse(response)
-
-                if response.status_code == 200 and response.text.strip() == "":
-                    # touch endpoint returns 200 with no content
-                    return EmptyResponse(response)
-
-                if response.headers["Content-Type"] == "application/pdf":
-                    return FileResponse(response)
-
-                # json response handling is the default
-                response_content = response.json()
-
-                # if response is a list, return list response
-                if isinstance(response_content, list):
-                    if "X-Page" in response.headers.keys():
-                        return PagedListResponse(response)  # response is a paged list
-                    else:
-                        return ListResponse(response)  # response is an unpaged list
-
-                # return object response as default
-                return ObjectResponse(response)
-
-            # check if the response has an error status code
-            if response.status_code in self.ERROR_STATUS_CODES:
-                response_obj = ErrorResponse(response)
-
-                if response_obj.is_recoverable:
-                    return self.request(method, path, params=params, data=data,
-                                        delay_ms=self.delay_milliseconds_on_error, **kwargs)
-
-                # error is not recoverable
-                return response_obj
-
-        except ValueError as ex:
-            response_obj = ErrorResponse(response)
-            if response_obj.is_recoverable:
-                # error is recoverable, try the resource again
-                return self.request(method, path, params=params, data=data,
-                                    delay_ms=self.delay_milliseconds_on_error, **kwargs)
-
-            # error is not recoverable
-            return response_obj
+            return self.session.patch(path, params=params, json=data, **kwargs)
+
+        return None
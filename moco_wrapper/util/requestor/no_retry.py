@@ -1,10 +1,8 @@
 import requests
-import time
-import collections
 
 from moco_wrapper.util.requestor.base import BaseRequestor
-from moco_wrapper.util.response import PagedListResponse, ListResponse, ObjectResponse, ErrorResponse, EmptyResponse, \
-    FileResponse
+from moco_wrapper.util.requestor.session import create_session
+from moco_wrapper.util.tracing import NOOP_TRACER
 
 
 class NoRetryRequestor(BaseRequestor):
@@ -30,11 +28,47 @@ class NoRetryRequestor(BaseRequestor):
         :class:`moco_wrapper.util.requestor.DefaultRequestor`
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        rate_limiter=None,
+        session: requests.Session = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout=BaseRequestor.DEFAULT_TIMEOUT
+    ):
         """
         Class constructor
+
+        :param rate_limiter: Rate limiter that throttles requests before they are sent
+            (see :class:`moco_wrapper.util.limiter.RateLimiter`, default ``None``)
+        :param session: Http session to use, pass the same session to several requestors to share
+            its connection pool (default ``None``, a new session is created, see
+            :func:`moco_wrapper.util.requestor.create_session`)
+        :param pool_connections: Number of hosts connection pools are kept for (default ``10``)
+        :param pool_maxsize: Maximum number of connections kept per host (default ``10``)
+        :param pool_block: If requests wait for a free connection when the pool is exhausted (default ``False``)
+        :param keep_alive: If TCP keep-alive is enabled on the connections (default ``True``)
+        :param timeout: Timeout in seconds for every request, either a single value or a ``(connect, read)`` tuple,
+            ``None`` disables the timeout (default :attr:`DEFAULT_TIMEOUT`)
+
+        .. note::
+
+            The pool arguments are ignored if a ``session`` is passed
         """
-        self._session = requests.Session()
+        if session is None:
+            session = create_session(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keep_alive=keep_alive
+            )
+
+        self._session = session
+        self.timeout = timeout
+
+        self.rate_limiter = rate_limiter
 
     @property
     def session(self):
@@ -43,7 +77,19 @@ class NoRetryRequestor(BaseRequestor):
         """
         return self._session
 
-    def request(self, method, path, params=None, data=None, **kwargs):
+    def request(
+        self,
+        method,
+        path,
+        params=None,
+        data=None,
+        deadline=None,
+        raw=False,
+        stream=False,
+        on_retry=None,
+        tracer=None,
+        **kwargs
+    ):
         """
         Request the given resource
 
@@ -51,67 +97,64 @@ class NoRetryRequestor(BaseRequestor):
         :param path: Path of the resource (e.g. ``/projects``)
         :param params: Url parameters (e.g. ``page=1``, query parameters)
         :param data: Dictionary with data (http body)
+        :param deadline: Seconds the request may take in total (default ``None``)
+        :param raw: If the body of a successful response should be passed through undecoded (default ``False``)
+        :param stream: If the json list of a successful response should be decoded while it is downloaded
+            (default ``False``, see :class:`moco_wrapper.util.response.StreamedListResponse`)
+        :param on_retry: Accepted for compatibility with the other requestors, never called (default ``None``)
+        :param tracer: Tracer recording spans for the request and the decoding of the response
+            (default ``None``, see :mod:`moco_wrapper.util.tracing`)
         :param kwargs: Additional http arguments.
 
         :type method: str
         :type path: str
         :type params: dict
         :type data: dict
+        :type deadline: float
+        :type raw: bool
+        :type stream: bool
 
         :returns: Response object
+
+        :raises moco_wrapper.exceptions.DeadlineExceededException: if the deadline expires before the request
+            was sent
         """
+        expires_at = self._deadline_expires_at(deadline)
+
+        # wait until the rate limiter allows the request
+        rate_limit_delay = self._rate_limit_delay(path, kwargs.get("headers"))
+        if rate_limit_delay > 0:
+            self._sleep(rate_limit_delay, expires_at)
 
         if params is not None:
             params = self._format_params(params)
 
+        if stream:
+            kwargs["stream"] = True
+
+        remaining = self._deadline_remaining(expires_at)
+        kwargs["timeout"] = self._cap_timeout(kwargs.get("timeout", self.timeout), remaining)
+
+        if tracer is None:
+            tracer = NOOP_TRACER
+
         # format data submitted to requests as json
         response = None
-        if method == "GET":
-            response = self.session.get(path, params=params, json=data, **kwargs)
-        elif method == "POST":
-            response = self.session.post(path, params=params, json=data, **kwargs)
-        elif method == "DELETE":
-            response = self.session.delete(path, params=params, json=data, **kwargs)
-        elif method == "PUT":
-            response = self.session.put(path, params=params, json=data, **kwargs)
-        elif method == "PATCH":
-            response = self.session.patch(path, params=params, json=data, **kwargs)
+        with tracer.span("moco.send", self._span_attributes(method, path, 1)) as span:
+            if method == "GET":
+                response = self.session.get(path, params=params, json=data, **kwargs)
+            elif method == "POST":
+                response = self.session.post(path, params=params, json=data, **kwargs)
+            elif method == "DELETE":
+                response = self.session.delete(path, params=params, json=data, **kwargs)
+            elif method == "PUT":
+                response = self.session.put(path, params=params, json=data, **kwargs)
+            elif method == "PATCH":
+                response = self.session.patch(path, params=params, json=data, **kwargs)
+
+            if response is not None:
+                span.set_attribute("http.status_code", response.status_code)
 
         # convert the response into an MWRAPResponse object
-        try:
-            # check if the response has a success status code
-            if response.status_code in self.SUCCESS_STATUS_CODES:
-                # filter by content type what type of response this is
-                if response.status_code == 204:
-                    # no content but success
-                    return EmptyResponse(response)
-
-                if response.status_code == 200 and response.text.strip() == "":
-                    # touch endpoint returns 200 with no content
-                    return EmptyResponse(response)
-
-                if response.headers["Content-Type"] == "application/pdf":
-                    return FileResponse(response)
-
-                # json response handling is the default
-                response_content = response.json()
-
-                # if response is a list, return list response
-                if isinstance(response_content, list):
-                    if "X-Page" in response.headers.keys():
-                        return PagedListResponse(response)  # response is a paged list
-                    else:
-                        return ListResponse(response) # response is an unpaged list
-
-                # return single json response
-                return ObjectResponse(response)
-
-            # check if the response has an error status code
-            if response.status_code in self.ERROR_STATUS_CODES:
-                error_response = ErrorResponse(response)
-                return error_response
-
-        except ValueError as ex:
-            # print("ValueError in response conversion:" + str(ex))
-            response_obj = ErrorResponse(response)
-            return response_obj
+        with tracer.span("moco.decode"):
+            return self._convert_response(response, raw=raw, stream=stream)
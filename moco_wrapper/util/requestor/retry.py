@@ -0,0 +1,192 @@
+import datetime
+import random
+
+from email.utils import parsedate_to_datetime
+
+
+class RetryPolicy(object):
+    """
+    Decides if and when a requestor retries a failed request.
+
+    Requests that were rejected with 429 (too many requests) are always retried. Server errors and connection
+    errors can be retried as well, but only for idempotent http methods, as the api might have processed the
+    request already.
+
+    The delay between two attempts grows exponentially (``backoff_ms * backoff_factor ** (attempt - 1)``, capped
+    at ``max_backoff_ms``) and is randomized by ``jitter``, so concurrent clients do not retry in lockstep.
+    If the api tells how long to wait (``Retry-After`` or ``RateLimit-Reset`` header), that value is used instead.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.requestor import DefaultRequestor, RetryPolicy
+
+        policy = RetryPolicy(
+            max_attempts=5,
+            backoff_ms=500,
+            retry_server_errors=True,
+            retry_connection_errors=True
+        )
+
+        m = Moco(
+            requestor=DefaultRequestor(retry_policy=policy)
+        )
+    """
+
+    IDEMPOTENT_METHODS = ("GET", "PUT", "DELETE")
+    """
+    Http methods that can be sent again without changing the result
+    """
+
+    SERVER_ERROR_STATUS_CODES = (500, 502, 503, 504)
+    """
+    Status codes that are considered temporary server errors
+    """
+
+    RATE_LIMIT_HEADERS = ("Retry-After", "RateLimit-Reset")
+    """
+    Response headers the policy reads the delay for the next attempt from (in that order)
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 10,
+        backoff_ms: float = 1000.0,
+        backoff_factor: float = 2.0,
+        max_backoff_ms: float = 60000.0,
+        jitter: float = 0.5,
+        retry_server_errors: bool = False,
+        retry_connection_errors: bool = False
+    ):
+        """
+        Class constructor
+
+        :param max_attempts: Maximum number of attempts, including the first request (default ``10``)
+        :param backoff_ms: Delay before the first retry in milliseconds (default ``1000``)
+        :param backoff_factor: Factor the delay grows with on every further retry (default ``2``)
+        :param max_backoff_ms: Upper bound of the delay in milliseconds (default ``60000``)
+        :param jitter: Fraction of the delay that is randomized, ``0`` disables jitter,
+            ``1`` spreads the delay over the whole range (default ``0.5``)
+        :param retry_server_errors: If server errors (5xx) of idempotent requests are retried (default ``False``)
+        :param retry_connection_errors: If connection errors and timeouts of idempotent requests are retried
+            (default ``False``)
+
+        :type max_attempts: int
+        :type backoff_ms: float
+        :type backoff_factor: float
+        :type max_backoff_ms: float
+        :type jitter: float
+        :type retry_server_errors: bool
+        :type retry_connection_errors: bool
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_ms = backoff_ms
+        self.backoff_factor = backoff_factor
+        self.max_backoff_ms = max_backoff_ms
+        self.jitter = jitter
+        self.retry_server_errors = retry_server_errors
+        self.retry_connection_errors = retry_connection_errors
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        response=None,
+        connection_error: Exception = None
+    ) -> float:
+        """
+        Returns how long to wait before the next attempt
+
+        :param method: Http method of the request
+        :param attempt: Number of the attempt that just failed (the first request is attempt ``1``)
+        :param response: Http response of the failed attempt (default ``None``)
+        :param connection_error: Exception raised while sending the request, if there was no response
+            (default ``None``)
+
+        :type method: str
+        :type attempt: int
+        :type connection_error: Exception
+
+        :returns: Delay in seconds, or ``None`` if the request should not be retried
+        :rtype: float
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+
+        if connection_error is not None:
+            if not (self.retry_connection_errors and idempotent):
+                return None
+        elif response is None:
+            return None
+        elif response.status_code == 429:
+            pass
+        elif response.status_code in self.SERVER_ERROR_STATUS_CODES:
+            if not (self.retry_server_errors and idempotent):
+                return None
+        else:
+            return None
+
+        if response is not None:
+            server_delay = self._delay_from_headers(response)
+            if server_delay is not None:
+                return server_delay
+
+        return self.backoff(attempt)
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the exponential backoff delay (with jitter) after the given attempt
+
+        :param attempt: Number of the attempt that just failed
+
+        :type attempt: int
+
+        :returns: Delay in seconds
+        :rtype: float
+        """
+        delay_ms = min(self.max_backoff_ms, self.backoff_ms * self.backoff_factor ** (attempt - 1))
+
+        if self.jitter > 0:
+            delay_ms -= delay_ms * self.jitter * random.random()
+
+        return delay_ms / 1000.0
+
+    def _delay_from_headers(self, response):
+        """
+        Reads the delay the api asks for from the response headers
+
+        :param response: Http response
+        :returns: Delay in seconds or ``None`` if the response has no (valid) header
+        """
+        headers = getattr(response, "headers", None)
+        if headers is None:
+            return None
+
+        for header in self.RATE_LIMIT_HEADERS:
+            if header not in headers:
+                continue
+
+            value = headers[header].strip()
+            try:
+                return max(0.0, float(value))
+            except ValueError:
+                pass
+
+            # Retry-After can also be a http date
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                continue
+
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+
+            now = datetime.datetime.now(datetime.timezone.utc)
+            return max(0.0, (retry_at - now).total_seconds())
+
+        return None
@@ -0,0 +1,112 @@
+import socket
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+class PoolAdapter(HTTPAdapter):
+    """
+    Http adapter that passes socket options (e.g. TCP keep-alive) to the connections of its pool
+    """
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["socket_options"]
+
+    def __init__(self, socket_options=None, **kwargs):
+        """
+        Class constructor
+
+        :param socket_options: List of ``(level, option, value)`` tuples set on every new connection
+            (default ``None``, the defaults of urllib3 are used)
+        :param kwargs: Arguments for :class:`requests.adapters.HTTPAdapter` (e.g. ``pool_maxsize``)
+        """
+        # has to be set first, the parent constructor creates the pool manager
+        self.socket_options = socket_options
+
+        super(PoolAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self.socket_options is not None:
+            kwargs["socket_options"] = self.socket_options
+
+        super(PoolAdapter, self).init_poolmanager(*args, **kwargs)
+
+
+def keep_alive_socket_options(idle: int = 60, interval: int = 15, count: int = 4) -> list:
+    """
+    Returns socket options enabling TCP keep-alive (in addition to the urllib3 defaults)
+
+    :param idle: Seconds a connection has to be idle before keep-alive probes are sent (default ``60``)
+    :param interval: Seconds between two keep-alive probes (default ``15``)
+    :param count: Number of failed probes after which the connection is dropped (default ``4``)
+
+    :returns: List of socket options
+
+    .. note::
+
+        ``idle``, ``interval`` and ``count`` are only applied on platforms that support them
+    """
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+    for name, value in (
+        ("TCP_KEEPIDLE", idle),
+        ("TCP_KEEPINTVL", interval),
+        ("TCP_KEEPCNT", count)
+    ):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+
+    return options
+
+
+def create_session(
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    keep_alive: bool = True
+) -> requests.Session:
+    """
+    Creates a http session with a tuned connection pool
+
+    :param pool_connections: Number of hosts connection pools are kept for (default ``10``)
+    :param pool_maxsize: Maximum number of connections kept per host, set this to at least the number of threads
+        using the session (default ``10``)
+    :param pool_block: If ``True`` requests wait for a free connection when the pool is exhausted instead of
+        opening (and discarding) additional connections (default ``False``)
+    :param keep_alive: If TCP keep-alive is enabled on the connections (default ``True``)
+
+    :type pool_connections: int
+    :type pool_maxsize: int
+    :type pool_block: bool
+    :type keep_alive: bool
+
+    :returns: Http session
+    :rtype: :class:`requests.Session`
+
+    The session can be shared between several requestors, for example when multiple :class:`moco_wrapper.Moco`
+    instances impersonate different users:
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.requestor import DefaultRequestor, create_session
+
+        session = create_session(pool_maxsize=50)
+
+        m1 = Moco(auth={..}, requestor=DefaultRequestor(session=session), impersonate_user_id=1)
+        m2 = Moco(auth={..}, requestor=DefaultRequestor(session=session), impersonate_user_id=2)
+    """
+    adapter = PoolAdapter(
+        socket_options=keep_alive_socket_options() if keep_alive else None,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
@@ -4,3 +4,7 @@ from .list import ListResponse
 from .paged_list import PagedListResponse
 from .empty import EmptyResponse
 from .file import FileResponse
+from .not_modified import NotModifiedResponse
+from .raw import RawResponse
+from .streamed_list import StreamedListResponse
+from . import decoder
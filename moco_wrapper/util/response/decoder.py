@@ -0,0 +1,209 @@
+import codecs
+import itertools
+import json
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+_DECODED_ATTRIBUTE = "_moco_wrapper_json"
+
+_decoder = None
+
+# states of iter_json_array
+_ARRAY_START, _ARRAY_FIRST_ITEM, _ARRAY_ITEM, _ARRAY_SEPARATOR = range(4)
+
+
+def default_decoder():
+    """
+    Returns the function json response bodies are decoded with, if none was set with :func:`set_decoder`
+
+    :returns: ``orjson.loads`` if ``orjson`` is installed, otherwise ``json.loads``
+    """
+    if orjson is not None:
+        return orjson.loads
+
+    if sys.version_info < (3, 6):  # pragma: no cover
+        # json.loads accepts bytes only from python 3.6 on
+        return _loads_bytes
+
+    return json.loads
+
+
+def _loads_bytes(content):
+    if isinstance(content, bytes):
+        content = content.decode("utf-8")
+
+    return json.loads(content)
+
+
+def get_decoder():
+    """
+    Returns the function json response bodies are currently decoded with
+
+    :returns: Decoder function
+    """
+    if _decoder is None:
+        return default_decoder()
+
+    return _decoder
+
+
+def set_decoder(decoder):
+    """
+    Sets the function json response bodies are decoded with
+
+    :param decoder: Function that takes the raw response body (``bytes``) and returns the decoded json, it must
+        raise a ``ValueError`` on invalid input (e.g. ``ujson.loads``). ``None`` restores the default decoder
+
+    .. code-block:: python
+
+        import ujson
+        from moco_wrapper.util.response import decoder
+
+        decoder.set_decoder(ujson.loads)
+    """
+    global _decoder
+    _decoder = decoder
+
+
+def decode_json(response, decoder=None, content: bytes = None):
+    """
+    Decodes the json body of a http response.
+
+    The result is cached on the response object, so the body is decoded only once no matter how often this function
+    is called for the same response.
+
+    :param response: http response object
+    :param decoder: Decoder function (default ``None``, see :func:`get_decoder`)
+    :param content: Body of the response if it was already read from a stream (default ``None``, the body is taken
+        from the response)
+
+    :returns: Decoded json
+
+    :raises ValueError: if the body is not valid json
+    """
+    decoded = getattr(response, _DECODED_ATTRIBUTE, None)
+    if decoded is not None:
+        return decoded
+
+    if decoder is None:
+        decoder = get_decoder()
+
+    raw_content = content if content is not None else getattr(response, "content", None)
+    if raw_content is None:
+        # response object without access to the raw body
+        content = response.json()
+    else:
+        content = decoder(raw_content)
+
+    try:
+        setattr(response, _DECODED_ATTRIBUTE, content)
+    except AttributeError:
+        pass  # response does not allow new attributes, decode it again next time
+
+    return content
+
+
+def starts_json_array(chunks):
+    """
+    Reads the chunks of a body up to its first non-whitespace byte, to find out if the body is a json array
+
+    :param chunks: Iterator of ``bytes`` chunks of the body
+
+    :returns: Tuple of whether the body starts with ``[`` and an iterator over all chunks, including the ones that
+        were read
+    """
+    chunks = iter(chunks)
+
+    read = []
+    for chunk in chunks:
+        read.append(chunk)
+
+        stripped = chunk.lstrip()
+        if stripped:
+            return stripped[:1] == b"[", itertools.chain(read, chunks)
+
+    return False, iter(read)
+
+
+def iter_json_array(chunks):
+    """
+    Decodes a json array incrementally and yields its items as soon as they are complete.
+
+    Only the item that is currently decoded (and the rest of the last chunk) is kept in memory, so arrays of any size
+    can be processed while they are downloaded. Items are decoded with :class:`json.JSONDecoder`, the decoder set with
+    :func:`set_decoder` is not used.
+
+    :param chunks: Iterable of ``bytes`` chunks of the body (e.g. ``response.iter_content(65536)``)
+
+    :returns: Generator yielding the decoded items
+
+    :raises ValueError: if the body is not a valid json array
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    chunks = iter(chunks)
+
+    buffer = ""
+    position = 0
+    exhausted = False
+    state = _ARRAY_START
+
+    while True:
+        # skip whitespace
+        while position < len(buffer) and buffer[position] in " \t\r\n":
+            position += 1
+
+        if position < len(buffer):
+            character = buffer[position]
+
+            if state == _ARRAY_START:
+                if character != "[":
+                    raise ValueError("Expected a json array")
+
+                state = _ARRAY_FIRST_ITEM
+                position += 1
+                continue
+
+            if character == "]" and state in (_ARRAY_FIRST_ITEM, _ARRAY_SEPARATOR):
+                return
+
+            if state == _ARRAY_SEPARATOR:
+                if character != ",":
+                    raise ValueError("Expected , or ] in the json array")
+
+                state = _ARRAY_ITEM
+                position += 1
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except ValueError:
+                item, end = None, None
+
+            # a value that ends with the buffer might continue in the next chunk (e.g. a number)
+            if end is not None and (end < len(buffer) or exhausted):
+                yield item
+
+                # drop the decoded item from the buffer
+                buffer = buffer[end:]
+                position = 0
+                state = _ARRAY_SEPARATOR
+                continue
+
+        if exhausted:
+            raise ValueError("Invalid or incomplete json array")
+
+        # keep only the unfinished part of the buffer and read the next chunk
+        buffer = buffer[position:]
+        position = 0
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer += text_decoder.decode(b"", final=True)
+        else:
+            buffer += text_decoder.decode(chunk)
@@ -1,4 +1,5 @@
 from .base import MWRAPResponse
+from .decoder import decode_json
 
 
 class ListResponse(MWRAPResponse):
@@ -8,21 +9,21 @@ class ListResponse(MWRAPResponse):
     The difference to :class:`moco_wrapper.util.response.PagedListResponse` is that ListResponses are not paged.
     """
 
-    def __init__(self, response):
+    def __init__(self, response, content: list = None):
         """
         Class constructor
 
         :param response: http response object
+        :param content: Already decoded json body of the response (default ``None``, the body is decoded)
+
+        :type content: list
         """
         super(ListResponse, self).__init__(response)
 
-        # loop over every single item in the json dictionary and convert it into an object by itself
-        json_content = response.json()
-        items = []
-        for json_item in json_content:
-            items.append(json_item)
+        if content is None:
+            content = decode_json(response)
 
-        self._data = items
+        self._data = content
 
     @property
     def items(self) -> list:
@@ -60,8 +61,12 @@ class ListResponse(MWRAPResponse):
 
     def __iter__(self):
         """
-        Returns the iterator of the items list so we can loop over the response
+        Returns the iterator of the items list so we can loop over the response (the rows for the columns of the
+        :class:`moco_wrapper.util.objector.ColumnarObjector`)
         """
+        if hasattr(self.items, "rows"):
+            return self.items.rows()
+
         return iter(self.items)
 
     def __getitem__(self, key):
@@ -69,9 +74,13 @@ class ListResponse(MWRAPResponse):
         Return the item of items with at key i
 
         :param key: Index
-        :returns: item at key
+        :returns: item at key (a dictionary of the row for the columns of the
+            :class:`moco_wrapper.util.objector.ColumnarObjector`)
         """
         if key < len(self.items):
+            if hasattr(self.items, "row"):
+                return self.items.row(key)
+
             return self.items[key]
 
         raise IndexError("list index out of range")
@@ -0,0 +1,28 @@
+from .base import MWRAPResponse
+
+
+class NotModifiedResponse(MWRAPResponse):
+    """
+    Class for handling responses of conditional requests (status code 304), the resource did not change since the
+    response the request was validated against (see :class:`moco_wrapper.util.cache.ResponseCache`)
+    """
+
+    def __init__(self, response):
+        """
+        Class constructor
+
+        :param response: http response object
+        """
+        super(NotModifiedResponse, self).__init__(response)
+
+    @property
+    def data(self):
+        """
+        No data in a not modified response, returns None
+
+        :returns: ``None``
+        """
+        return None
+
+    def __str__(self):
+        return "<NotModifiedResponse, Status Code: {}>".format(self.response.status_code)
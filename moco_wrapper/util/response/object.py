@@ -1,4 +1,5 @@
 from .base import MWRAPResponse
+from .decoder import decode_json
 
 
 class ObjectResponse(MWRAPResponse):
@@ -22,15 +23,21 @@ class ObjectResponse(MWRAPResponse):
         """
         return self._data
 
-    def __init__(self, response):
+    def __init__(self, response, content: dict = None):
         """
         class constructor
 
         :param response: http response object
+        :param content: Already decoded json body of the response (default ``None``, the body is decoded)
+
+        :type content: dict
         """
         super(ObjectResponse, self).__init__(response)
 
-        self._data = self.response.json()
+        if content is None:
+            content = decode_json(response)
+
+        self._data = content
 
     def __str__(self):
         return "<ObjectResponse, Status Code: {}, Data: {}>".format(self.response.status_code, str(self._data))
@@ -1,4 +1,5 @@
 from .list import ListResponse
+from .pagination import pagination_headers
 
 
 class PagedListResponse(ListResponse):
@@ -38,6 +39,17 @@ class PagedListResponse(ListResponse):
         for i in range(2, project_list.last_page + 1): #first page alread queried
             project_list = m.Project.getlist(page=i)
             all_projects.extend(project_list.items)
+
+    Or let the moco instance handle the pages (see :meth:`moco_wrapper.Moco.paginate`):
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+
+        m = Moco()
+
+        for project in m.paginate("project_getlist"):
+            print(project.name)
     """
 
     @property
@@ -104,48 +116,24 @@ class PagedListResponse(ListResponse):
         # result has rest, so there is another page
         return last_page + 1
 
-    def __init__(self, response):
+    def __init__(self, response, content: list = None):
         """
         Class constructor
 
         :param response: http response object
+        :param content: Already decoded json body of the response (default ``None``, the body is decoded)
+
+        :type content: list
         """
-        super(PagedListResponse, self).__init__(response)
-
-        # loop over every single item in the json dictionary and convert it into an object by itself
-        json_content = response.json()
-        items = []
-        for json_item in json_content:
-            items.append(json_item)
-
-        self._data = items
-
-        if "x-page" in response.headers.keys():
-            self._current_page = int(response.headers["x-page"])
-        else:
-            self._current_page = 1
-
-        if "x-total" in response.headers.keys():
-            self._total = int(response.headers["x-total"])
-        else:
-            self._total = len(items)
-
-        if "x-per-page" in response.headers.keys():
-            self._page_size = int(response.headers["x-per-page"])
-        else:
-            self._page_size = self._total
-
-        if "Link" in response.headers.keys():
-            link_parts = response.headers["Link"].split(",")
-            rel = []
-            # extract rels
-            for link in link_parts:
-                _rel = link.split("; rel=")[-1].strip().replace("\"", "")
-                rel.append(_rel)
-
-            self._is_last = "last" not in rel
-        else:
-            self._is_last = True
+        super(PagedListResponse, self).__init__(response, content=content)
+        items = self._data
+
+        current_page, total, page_size, is_last = pagination_headers(response.headers)
+
+        self._current_page = current_page if current_page is not None else 1
+        self._total = total if total is not None else len(items)
+        self._page_size = page_size if page_size is not None else self._total
+        self._is_last = is_last
 
     def __str__(self):
         return "<PagedListResponse, Status Code: {}, Data: {}>".format(self.response.status_code, str(self._data))
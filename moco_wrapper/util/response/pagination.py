@@ -0,0 +1,110 @@
+def pagination_headers(headers):
+    """
+    Reads the pagination metadata of a listing from the http headers of its response
+
+    :param headers: Http headers of the response
+
+    :returns: Tuple of current page, total number of items, page size (``None`` if the header is missing) and if the
+        page is the last one
+    :rtype: tuple
+    """
+    current_page = int(headers["x-page"]) if "x-page" in headers else None
+    total = int(headers["x-total"]) if "x-total" in headers else None
+    page_size = int(headers["x-per-page"]) if "x-per-page" in headers else None
+
+    if "Link" in headers:
+        link_parts = headers["Link"].split(",")
+        rel = []
+        # extract rels
+        for link in link_parts:
+            _rel = link.split("; rel=")[-1].strip().replace("\"", "")
+            rel.append(_rel)
+
+        is_last = "last" not in rel
+    else:
+        is_last = True
+
+    return current_page, total, page_size, is_last
+
+
+class PaginationMixin(object):
+    """
+    Pagination metadata of responses whose items are not decoded up front (read from the http headers only)
+    """
+
+    def _read_pagination(self, headers):
+        """
+        Sets the pagination metadata of the response from its http headers
+        """
+        current_page, total, page_size, is_last = pagination_headers(headers)
+
+        self._current_page = current_page
+        self._total = total
+        self._page_size = page_size
+        self._is_last = is_last
+
+    @property
+    def is_paged(self) -> bool:
+        """
+        Returns whether the response is a page of a paginated listing
+
+        :type: bool
+        """
+        return self._current_page is not None
+
+    @property
+    def current_page(self) -> int:
+        """
+        Returns the current page number (``None`` if the response is not paged)
+
+        :type: int
+        """
+        return self._current_page
+
+    @property
+    def page_size(self) -> int:
+        """
+        Returns the maximum amount of items of a page (``None`` if the header is missing)
+
+        :type: int
+        """
+        return self._page_size
+
+    @property
+    def total(self) -> int:
+        """
+        Returns the amount of items in the paginated collection (``None`` if the header is missing)
+
+        :type: int
+        """
+        return self._total
+
+    @property
+    def is_last(self) -> bool:
+        """
+        Returns whether the current page is the last page
+
+        :type: bool
+        """
+        return self._is_last
+
+    @property
+    def next_page(self) -> int:
+        """
+        Returns the next page number
+
+        :type: int
+        """
+        return (self._current_page or 1) + 1
+
+    @property
+    def last_page(self) -> int:
+        """
+        Returns the last page number
+
+        :type: int
+        """
+        if not self._total or not self._page_size:
+            return self._current_page or 1
+
+        return (self._total + self._page_size - 1) // self._page_size
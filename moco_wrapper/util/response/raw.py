@@ -0,0 +1,68 @@
+from .base import MWRAPResponse
+from .pagination import PaginationMixin
+
+
+class RawResponse(PaginationMixin, MWRAPResponse):
+    """
+    Class for successful http responses whose body is passed through as it is.
+
+    The body is neither decoded nor converted by the objector, which makes forwarding the data of the api to another
+    system cheap. Pagination metadata is read from the headers of the response, so the pages of a listing can be
+    iterated with :meth:`moco_wrapper.Moco.pages`.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+
+        m = Moco()
+
+        for page in m.pages("activity_getlist", params={"from": "2020-01-01", "to": "2020-12-31"}, raw=True):
+            sink.write(page.view)
+
+    .. note::
+
+        Raw responses are never cached. Error responses are still converted and raised like any other response.
+    """
+
+    def __init__(self, response):
+        """
+        Class constructor
+
+        :param response: http response object
+        """
+        super(RawResponse, self).__init__(response)
+
+        self._read_pagination(response.headers)
+
+    @property
+    def data(self) -> bytes:
+        """
+        Returns the undecoded body of the response
+
+        :type: bytes
+        """
+        return self.response.content
+
+    @property
+    def view(self) -> memoryview:
+        """
+        Returns a memoryview of the body (no copy)
+
+        :type: memoryview
+        """
+        return memoryview(self.response.content)
+
+    @property
+    def content_type(self) -> str:
+        """
+        Returns the content type of the body (e.g. ``application/json``)
+
+        :type: str
+        """
+        return self.response.headers.get("Content-Type", None)
+
+    def __str__(self):
+        return "<RawResponse, Status Code: {}, Data: {} bytes>".format(
+            self.response.status_code,
+            len(self.response.content)
+        )
@@ -0,0 +1,105 @@
+from .base import MWRAPResponse
+from .decoder import iter_json_array
+from .pagination import PaginationMixin
+
+
+class StreamedListResponse(PaginationMixin, MWRAPResponse):
+    """
+    Class for http responses whose body is a json list that is decoded while it is downloaded.
+
+    The items are decoded one by one when they are iterated over, only about one item is kept in memory at a time.
+    The objector converts every item when it is yielded. The items can be iterated over only once, the connection is
+    released after the last item.
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+
+        m = Moco()
+
+        timesheet = m.get("invoice_timesheet_activities", ep_params={"id": 1}, stream=True)
+        for activity in timesheet:
+            print(activity.hours)
+
+    .. note::
+
+        Streamed responses are never cached. Streaming needs a synchronous requestor (``requests``), the
+        :class:`moco_wrapper.util.requestor.AsyncRequestor` does not support it.
+    """
+
+    CHUNK_SIZE = 65536
+    """
+    Number of bytes that are read from the connection at once
+    """
+
+    def __init__(self, response, chunk_size: int = None, chunks=None):
+        """
+        Class constructor
+
+        :param response: http response object (requested with ``stream=True``)
+        :param chunk_size: Number of bytes that are read at once (default ``None``, see :attr:`CHUNK_SIZE`)
+        :param chunks: Iterator over the chunks of the body, if reading the body was already started (default
+            ``None``, the chunks are read from the response)
+
+        :type chunk_size: int
+        """
+        super(StreamedListResponse, self).__init__(response)
+
+        self.chunk_size = chunk_size if chunk_size is not None else self.CHUNK_SIZE
+
+        self._chunks = chunks
+
+        self._read_pagination(response.headers)
+        self._converters = []
+        self._consumed = False
+
+    def map(self, function):
+        """
+        Adds a function every item is passed through when it is yielded (used by the objectors)
+
+        :param function: Function taking an item and returning the converted item
+        """
+        self._converters.append(function)
+
+    @property
+    def items(self):
+        """
+        Returns a generator yielding the (converted) items of the response
+
+        :raises ValueError: if the items were already iterated over
+        """
+        if self._consumed:
+            raise ValueError("The items of a streamed response can be iterated over only once")
+
+        self._consumed = True
+
+        return self._iter_items()
+
+    @property
+    def data(self):
+        """
+        Returns a generator yielding the (converted) items of the response
+
+        .. seealso::
+
+            :attr:`items`
+        """
+        return self.items
+
+    def __iter__(self):
+        return self.items
+
+    def _iter_items(self):
+        converters = self._converters
+        chunks = self._chunks if self._chunks is not None else self.response.iter_content(self.chunk_size)
+        try:
+            for item in iter_json_array(chunks):
+                for converter in converters:
+                    item = converter(item)
+
+                yield item
+        finally:
+            self.response.close()
+
+    def __str__(self):
+        return "<StreamedListResponse, Status Code: {}, Data: streamed>".format(self.response.status_code)
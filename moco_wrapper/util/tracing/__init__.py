@@ -0,0 +1 @@
+from .tracer import NoopTracer, NOOP_TRACER, InMemoryTracer, Span, OpenTelemetryTracer
@@ -0,0 +1,315 @@
+import threading
+import time
+
+try:
+    import contextvars
+except ImportError:  # pragma: no cover, python < 3.7
+    contextvars = None
+
+
+class NoopSpan(object):
+    """
+    Span of the :class:`NoopTracer`, records nothing
+    """
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value):
+        pass
+
+    def record_exception(self, exception: Exception):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+class NoopTracer(object):
+    """
+    Tracer that records nothing, used by :class:`moco_wrapper.Moco` if no tracer is configured
+    """
+
+    enabled = False
+    """
+    If the tracer records spans (the requestors are only passed tracers that do)
+    """
+
+    _span = NoopSpan()
+
+    def span(self, name: str, attributes: dict = None):
+        """
+        Returns a span that records nothing
+
+        :param name: Name of the span
+        :param attributes: Attributes of the span (default ``None``)
+        """
+        return self._span
+
+
+NOOP_TRACER = NoopTracer()
+"""
+Shared :class:`NoopTracer` instance
+"""
+
+
+class _ThreadLocalVar(object):
+    """
+    Stand-in for :class:`contextvars.ContextVar` on python versions without it (before 3.7), the value is kept per
+    thread, so the spans of asyncio tasks running on the same thread are not told apart
+    """
+
+    def __init__(self, name: str, default=None):
+        self.name = name
+        self._default = default
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, "value", self._default)
+
+    def set(self, value):
+        token = self.get()
+        self._local.value = value
+
+        return token
+
+    def reset(self, token):
+        self._local.value = token
+
+
+if contextvars is not None:
+    _current_span = contextvars.ContextVar("moco_wrapper_current_span", default=None)
+else:  # pragma: no cover
+    _current_span = _ThreadLocalVar("moco_wrapper_current_span", default=None)
+
+
+class Span(object):
+    """
+    Span recorded by the :class:`InMemoryTracer`
+    """
+
+    def __init__(self, tracer, name: str, attributes: dict = None):
+        self.tracer = tracer
+
+        self.name = name
+        """
+        Name of the span
+        """
+
+        self.attributes = dict(attributes) if attributes is not None else {}
+        """
+        Attributes of the span
+        """
+
+        self.parent = None
+        """
+        Span that was active when this span was started (``None`` for a root span)
+        """
+
+        self.start_time = None
+        """
+        Time the span was started at (:func:`time.perf_counter`)
+        """
+
+        self.end_time = None
+        """
+        Time the span ended at (:func:`time.perf_counter`)
+        """
+
+        self.exceptions = []
+        """
+        Exceptions recorded in the span
+        """
+
+        self._token = None
+
+    @property
+    def duration(self) -> float:
+        """
+        Seconds the span took, ``None`` if it did not end yet
+
+        :type: float
+        """
+        if self.end_time is None:
+            return None
+
+        return self.end_time - self.start_time
+
+    @property
+    def ok(self) -> bool:
+        """
+        Returns whether no exception was recorded in the span
+
+        :type: bool
+        """
+        return len(self.exceptions) == 0
+
+    def set_attribute(self, key: str, value):
+        """
+        Sets an attribute of the span
+
+        :param key: Name of the attribute
+        :param value: Value of the attribute
+        """
+        self.attributes[key] = value
+
+    def record_exception(self, exception: Exception):
+        """
+        Records an exception in the span
+
+        :param exception: Exception
+        """
+        self.exceptions.append(exception)
+
+    def __enter__(self):
+        self.parent = _current_span.get()
+        self._token = _current_span.set(self)
+        self.start_time = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end_time = time.perf_counter()
+        _current_span.reset(self._token)
+
+        if exc_value is not None:
+            self.record_exception(exc_value)
+
+        self.tracer.export(self)
+
+        return False
+
+    def __repr__(self):
+        return "<Span, Name: {}, Duration: {}>".format(self.name, self.duration)
+
+
+class InMemoryTracer(object):
+    """
+    Tracer that keeps the finished spans in memory, e.g. for tests
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.tracing import InMemoryTracer
+
+        tracer = InMemoryTracer()
+        m = Moco(auth={..}, tracer=tracer)
+
+        m.Project.get(1)
+
+        for span in tracer.spans:
+            print(span.name, span.parent.name if span.parent else None, span.duration)
+
+    Spans are children of the span that is active in the current thread (or asyncio task) when they are started.
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+        self.spans = []
+        """
+        Finished spans in the order they ended
+        """
+
+    def span(self, name: str, attributes: dict = None) -> Span:
+        """
+        Creates a span, the span is started and ended by using it as context manager
+
+        :param name: Name of the span
+        :param attributes: Attributes of the span (default ``None``)
+
+        :type name: str
+        :type attributes: dict
+
+        :rtype: :class:`Span`
+        """
+        return Span(self, name, attributes)
+
+    def export(self, span: Span):
+        """
+        Stores a finished span
+
+        :param span: Finished span
+        """
+        with self._lock:
+            self.spans.append(span)
+
+    def find(self, name: str) -> list:
+        """
+        Returns the finished spans with the given name
+
+        :param name: Name of the spans
+
+        :type name: str
+
+        :rtype: list
+        """
+        with self._lock:
+            return [x for x in self.spans if x.name == name]
+
+    def clear(self):
+        """
+        Removes all finished spans
+        """
+        with self._lock:
+            self.spans = []
+
+
+class OpenTelemetryTracer(object):
+    """
+    Tracer that records the spans with OpenTelemetry
+
+    .. code-block:: python
+
+        from moco_wrapper import Moco
+        from moco_wrapper.util.tracing import OpenTelemetryTracer
+
+        m = Moco(auth={..}, tracer=OpenTelemetryTracer())
+
+    The spans are created with the tracer of the globally configured tracer provider (or the given one), so they
+    become children of the span that is active when a request is made and are exported by the configured exporters.
+
+    .. note::
+
+        This tracer needs the ``opentelemetry-api`` package (``pip install moco-wrapper[tracing]``)
+    """
+
+    enabled = True
+
+    def __init__(self, tracer=None, tracer_provider=None):
+        """
+        Class constructor
+
+        :param tracer: OpenTelemetry tracer the spans are created with (default ``None``, a tracer named
+            ``moco_wrapper`` is created)
+        :param tracer_provider: Tracer provider the tracer is taken from (default ``None``, the global tracer
+            provider)
+        """
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise ImportError(
+                    "The OpenTelemetryTracer needs the opentelemetry-api package, install it with: "
+                    "pip install opentelemetry-api"
+                )
+
+            tracer = trace.get_tracer("moco_wrapper", tracer_provider=tracer_provider)
+
+        self.tracer = tracer
+
+    def span(self, name: str, attributes: dict = None):
+        """
+        Creates an OpenTelemetry span that is made the current span while it is used as context manager
+
+        :param name: Name of the span
+        :param attributes: Attributes of the span (default ``None``)
+
+        :type name: str
+        :type attributes: dict
+        """
+        return self.tracer.start_as_current_span(name, attributes=attributes)
@@ -33,6 +33,11 @@ setup(
     ],
     description="Wrapper package for using the moco api interface",
     install_requires=requirements,
+    extras_require={
+        "async": ["httpx"],
+        "fast": ["orjson"],
+        "tracing": ["opentelemetry-api"],
+    },
     license="GNU General Public License v3",
     long_description=readme + '\n\n' + history,
     include_package_data=True,
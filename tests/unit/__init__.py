@@ -1 +1 @@
-from .unit_base import UnitTest
+from .unit_base import UnitTest, run_async
@@ -1,10 +1,13 @@
+from requests.structures import CaseInsensitiveDict
+
 from moco_wrapper.util.response import ErrorResponse
 
 
 class MockHttpResponse:
-    def __init__(self, json_data, status_code):
+    def __init__(self, json_data, status_code, headers=None):
         self.json_data = json_data
         self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers or {})
 
     def json(self):
         return self.json_data
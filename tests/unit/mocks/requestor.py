@@ -0,0 +1,39 @@
+import json
+
+from moco_wrapper.util.requestor.base import BaseRequestor
+from moco_wrapper.util.response import PagedListResponse
+
+from .http import MockHttpResponse
+
+
+class MockPagedRequestor(BaseRequestor):
+    """
+    Requestor that serves the given list of pages as paged list responses
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested_pages = []
+
+    def request(self, method, path, params=None, data=None, raw=False, **kwargs):
+        page = (params or {}).get("page", 1)
+        self.requested_pages.append(page)
+
+        per_page = len(self.pages[0])
+        total = sum(len(x) for x in self.pages)
+
+        headers = {
+            "X-Page": str(page),
+            "X-Per-Page": str(per_page),
+            "X-Total": str(total),
+        }
+        if page < len(self.pages):
+            headers["Link"] = '<{0}?page={1}>; rel="next", <{0}?page={2}>; rel="last"'.format(
+                path, page + 1, len(self.pages))
+
+        http_response = MockHttpResponse(self.pages[page - 1], 200, headers)
+        if raw:
+            http_response.content = json.dumps(self.pages[page - 1]).encode("utf-8")
+            return self._convert_response(http_response, raw=True)
+
+        return PagedListResponse(http_response)
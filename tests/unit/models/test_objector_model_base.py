@@ -0,0 +1,114 @@
+import pickle
+
+import pytest
+
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.models.objector_models.base import BaseObjectorModel, NestedField
+
+
+class TestObjectorModelBase(object):
+    def test_no_instance_dict(self):
+        for cls in om.Activity.__mro__[:-1]:
+            assert "__slots__" in cls.__dict__
+
+        assert "from_date" in om.UserEmployment.__slots__
+
+    def test_fields(self):
+        activity = om.Activity(id=1, hours=2.5, description="test")
+
+        assert activity.id == 1
+        assert activity.hours == 2.5
+        assert activity.description == "test"
+
+        with pytest.raises(AttributeError):
+            activity.date  # not in the response
+
+    def test_extra_fields(self):
+        activity = om.Activity(id=1, some_new_field="value")
+
+        assert activity.some_new_field == "value"
+        assert activity.to_dict() == {"id": 1, "some_new_field": "value"}
+
+    def test_set_attributes(self):
+        activity = om.Activity(id=1)
+        activity.hours = 3
+        activity.custom = "value"
+
+        assert activity.hours == 3
+        assert activity.custom == "value"
+
+        del activity.custom
+        with pytest.raises(AttributeError):
+            activity.custom
+
+    def test_nested(self):
+        project = om.Project(
+            id=1,
+            customer={"id": 2, "name": "Customer"},
+            tasks=[{"id": 3}, {"id": 4}],
+            deal=None
+        )
+
+        assert isinstance(project.customer, om.Company)
+        assert [x.id for x in project.tasks] == [3, 4]
+        assert all(isinstance(x, om.ProjectTask) for x in project.tasks)
+        assert project.deal is None
+
+    def test_nested_lazy(self):
+        activity = om.Activity(id=1, project={"id": 2, "tasks": [{"id": 3}]}, user=None)
+
+        assert not om.Activity.project.is_materialized(activity)
+
+        project = activity.project
+        assert isinstance(project, om.Project)
+        assert om.Activity.project.is_materialized(activity)
+        assert activity.project is project  # converted only once
+
+        assert not om.Project.tasks.is_materialized(project)
+        assert project.tasks[0].id == 3
+        assert activity.user is None
+
+    def test_nested_set(self):
+        activity = om.Activity(id=1)
+        activity.user = {"id": 5}
+
+        assert isinstance(om.Activity.user, NestedField)
+        assert activity.user.id == 5
+
+    def test_nested_not_declared(self):
+        with pytest.raises(TypeError):
+            class InvalidModel(BaseObjectorModel):
+                FIELDS = ("id", )
+                NESTED = {"user": "User"}
+
+    def test_renamed(self):
+        presence = om.UserPresence(**{"id": 1, "from": "08:00", "to": "12:00"})
+        user = om.User(id=1, bday="1990-01-01")
+
+        assert presence.from_time == "08:00"
+        assert presence.to_time == "12:00"
+        assert user.birthday == "1990-01-01"
+
+    def test_vars(self):
+        unit = om.Unit(id=1, name="Unit")
+
+        assert vars(unit) == {"id": 1, "name": "Unit"}
+
+    def test_pickle(self):
+        activity = om.Activity(id=1, user={"id": 2}, other="value")
+        restored = pickle.loads(pickle.dumps(activity))
+
+        assert restored.id == 1
+        assert restored.user.id == 2
+        assert restored.other == "value"
+
+    def test_subclass(self):
+        class CustomActivity(om.Activity):
+            FIELDS = ("custom_field", )
+
+        activity = CustomActivity(id=1, custom_field="value")
+
+        assert activity.id == 1
+        assert activity.custom_field == "value"
+        assert activity._extra is None
+        assert issubclass(CustomActivity, BaseObjectorModel)
@@ -0,0 +1,146 @@
+import asyncio
+import json
+
+import pytest
+
+from moco_wrapper import AsyncMoco
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.util.requestor import AsyncRequestor
+from moco_wrapper.util.response import ObjectResponse, PagedListResponse
+
+from . import run_async
+
+httpx = pytest.importorskip("httpx")
+
+
+class TestAsyncMoco(object):
+
+    def create_moco(self, handler, **kwargs):
+        requestor = AsyncRequestor(transport=httpx.MockTransport(handler), **kwargs)
+
+        return AsyncMoco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=requestor
+        )
+
+    def test_get(self):
+        def handler(request):
+            assert request.url.path == "/api/v1/units/25"
+            assert request.headers["Authorization"] == "Token token=<TOKEN>"
+            return httpx.Response(200, json={"id": 25, "name": "Development"})
+
+        async def run():
+            async with self.create_moco(handler) as m:
+                return await m.Unit.get(25)
+
+        response = run_async(run())
+
+        assert isinstance(response, ObjectResponse)
+        assert isinstance(response.data, om.Unit)
+        assert response.data.name == "Development"
+
+    def test_concurrent_requests(self):
+        def handler(request):
+            unit_id = int(request.url.path.split("/")[-1])
+            return httpx.Response(200, json={"id": unit_id})
+
+        async def run():
+            async with self.create_moco(handler) as m:
+                return await asyncio.gather(*[m.Unit.get(i) for i in range(20)])
+
+        responses = run_async(run())
+
+        assert [x.data.id for x in responses] == list(range(20))
+
+    def test_concurrent_first_requests_login_once(self):
+        logins = []
+
+        async def handler(request):
+            if request.url.path == "/api/v1/session":
+                logins.append(json.loads(request.content.decode("utf-8")))
+                await asyncio.sleep(0.01)  # the other request waits for the login meanwhile
+                return httpx.Response(200, json={"api_key": "<TOKEN>", "user_id": 1})
+
+            assert request.headers["Authorization"] == "Token token=<TOKEN>"
+            return httpx.Response(200, json={"id": int(request.url.path.split("/")[-1])})
+
+        async def run():
+            m = AsyncMoco(
+                auth={
+                    "domain": "<DOMAIN>",
+                    "email": "jane@example.com",
+                    "password": "secret"
+                },
+                requestor=AsyncRequestor(transport=httpx.MockTransport(handler))
+            )
+            async with m:
+                return await asyncio.gather(m.Unit.get(1), m.Unit.get(2))
+
+        responses = run_async(run())
+
+        assert [x.data.id for x in responses] == [1, 2]
+        assert len(logins) == 1
+
+    def test_retry_on_rate_limit(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, text="Too many requests")
+            return httpx.Response(200, json={"id": 1})
+
+        async def run():
+            async with self.create_moco(handler, delay_ms=0) as m:
+                return await m.Unit.get(1)
+
+        response = run_async(run())
+
+        assert len(calls) == 2
+        assert response.data.id == 1
+
+    def test_paginate(self):
+        pages = [[{"id": 1}, {"id": 2}], [{"id": 3}, {"id": 4}], [{"id": 5}]]
+
+        def handler(request):
+            page = int(request.url.params["page"])
+            headers = {
+                "Content-Type": "application/json",
+                "X-Page": str(page),
+                "X-Per-Page": "2",
+                "X-Total": "5"
+            }
+            if page < len(pages):
+                headers["Link"] = '<next>; rel="next", <last>; rel="last"'
+
+            return httpx.Response(200, content=json.dumps(pages[page - 1]), headers=headers)
+
+        async def run(max_workers):
+            async with self.create_moco(handler) as m:
+                return [x.id async for x in m.paginate("unit_getlist", max_workers=max_workers)]
+
+        assert run_async(run(None)) == [1, 2, 3, 4, 5]
+        assert run_async(run(2)) == [1, 2, 3, 4, 5]
+
+    def test_paged_list_response(self):
+        def handler(request):
+            headers = {
+                "Content-Type": "application/json",
+                "X-Page": "1",
+                "X-Per-Page": "100",
+                "X-Total": "1"
+            }
+            return httpx.Response(200, content=json.dumps([{"id": 1}]), headers=headers)
+
+        async def run():
+            async with self.create_moco(handler) as m:
+                return await m.Unit.getlist()
+
+        response = run_async(run())
+
+        assert isinstance(response, PagedListResponse)
+        assert response.is_last
+        assert response[0].id == 1
@@ -97,6 +97,43 @@ class TestMocoWrapper(UnitTest):
     def test_report_set(self):
         assert isinstance(self.moco.Report, models.Report)
 
+    def test_models_created_on_access(self):
+        new_moco = moco.Moco()
+
+        assert "Project" not in vars(new_moco)
+        assert new_moco.Project is new_moco.Project
+        assert new_moco.Project._moco is new_moco
+
+    def test_models_submodules(self):
+        assert models.activity.Activity is models.Activity
+
+        # submodules that were not imported yet are resolved on access
+        assert models.__getattr__("user_presence").UserPresence is models.UserPresence
+        assert models.__getattr__("base").MWRAPBase is not None
+
+        with pytest.raises(AttributeError):
+            models.__getattr__("no_such_module")
+
+    def test_endpoint_manager_models(self):
+        slugs = {x.slug for x in util.endpoint.default_manager().endpoints}
+
+        for name in models._MODELS:
+            for endpoint in getattr(models, name).endpoints():
+                assert endpoint.slug in slugs
+
+    def test_endpoint_manager_shared(self):
+        assert moco.Moco().endpoint_manager is util.endpoint.default_manager()
+        assert moco.Moco().endpoint_manager is util.endpoint.default_manager()
+
+    def test_endpoint_manager_overwrite(self):
+        manager = util.endpoint.EndpointManager()
+
+        new_moco = moco.Moco()
+        new_moco.endpoint_manager = manager
+
+        assert new_moco.endpoint_manager is manager
+        assert manager.endpoints == util.endpoint.default_manager().endpoints
+
     def test_wrapper_init(self):
         new_moco = moco.Moco(
             auth={
@@ -0,0 +1,106 @@
+import pytest
+
+from . import UnitTest
+from .mocks.requestor import MockPagedRequestor
+
+from moco_wrapper import moco
+from moco_wrapper.util.objector import RawObjector
+
+
+class TestPaginate(UnitTest):
+
+    def create_moco(self, pages):
+        self.requestor = MockPagedRequestor(pages)
+
+        return moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=self.requestor,
+            objector=RawObjector()
+        )
+
+    def test_yields_all_items_in_order(self):
+        pages = [[1, 2], [3, 4], [5]]
+        m = self.create_moco(pages)
+
+        items = list(m.paginate("unit_getlist"))
+
+        assert items == [1, 2, 3, 4, 5]
+        assert self.requestor.requested_pages == [1, 2, 3]
+
+    def test_pages_are_requested_lazily(self):
+        pages = [[1, 2], [3, 4], [5]]
+        m = self.create_moco(pages)
+
+        generator = m.paginate("unit_getlist")
+        assert self.requestor.requested_pages == []
+
+        assert next(generator) == 1
+        assert next(generator) == 2
+        assert self.requestor.requested_pages == [1]
+
+        assert next(generator) == 3
+        assert self.requestor.requested_pages == [1, 2]
+
+    def test_start_page(self):
+        pages = [[1, 2], [3, 4], [5]]
+        m = self.create_moco(pages)
+
+        items = list(m.paginate("unit_getlist", params={"page": 2}))
+
+        assert items == [3, 4, 5]
+
+    def test_params_are_not_modified(self):
+        pages = [[1], [2]]
+        m = self.create_moco(pages)
+        params = {"sort_by": "name asc"}
+
+        list(m.paginate("unit_getlist", params=params))
+
+        assert params == {"sort_by": "name asc"}
+
+    def test_non_list_response(self):
+        m = moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=self.moco.requestor,
+            objector=RawObjector()
+        )
+
+        with pytest.raises(ValueError):
+            list(m.paginate("unit_getlist"))
+
+    def test_prefetch_yields_all_items_in_order(self):
+        pages = [[1, 2], [3, 4], [5, 6], [7, 8], [9]]
+        m = self.create_moco(pages)
+
+        items = list(m.paginate("unit_getlist", max_workers=3))
+
+        assert items == [1, 2, 3, 4, 5, 6, 7, 8, 9]
+        assert sorted(self.requestor.requested_pages) == [1, 2, 3, 4, 5]
+
+    def test_prefetch_single_page(self):
+        pages = [[1, 2]]
+        m = self.create_moco(pages)
+
+        items = list(m.paginate("unit_getlist", max_workers=3))
+
+        assert items == [1, 2]
+        assert self.requestor.requested_pages == [1]
+
+    def test_prefetch_is_bounded(self):
+        pages = [[1], [2], [3], [4], [5], [6]]
+        m = self.create_moco(pages)
+
+        generator = m.paginate("unit_getlist", max_workers=2)
+        assert next(generator) == 1
+        assert next(generator) == 2
+
+        # at most the first page, the page being iterated and one prefetched page were requested
+        assert max(self.requestor.requested_pages) <= 3
+
+        generator.close()
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import string
 import random
@@ -7,6 +8,15 @@ from moco_wrapper.util.requestor import RawRequestor
 from moco_wrapper.util.objector import RawObjector
 
 
+def run_async(coroutine):
+    """runs a coroutine on a new event loop (asyncio.run is not available before python 3.7)"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
 class UnitTest(object):
     def setup(self):
         self.setup_moco()
@@ -0,0 +1,203 @@
+import asyncio
+import functools
+import threading
+
+import pytest
+
+from moco_wrapper import moco
+from moco_wrapper.exceptions import ServerErrorException, UnprocessableException
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.util.bulk import BulkOperation, BulkReport, BulkExecutor
+from moco_wrapper.util.objector import NoErrorObjector
+from moco_wrapper.util.requestor.base import BaseRequestor
+from moco_wrapper.util.response import ObjectResponse, ListResponse, ErrorResponse
+
+from .. import run_async
+from ..mocks.http import MockHttpResponse
+
+
+class MockWriteRequestor(BaseRequestor):
+    """
+    Requestor that echoes the data of write requests, data with ``"fail": True`` is rejected (with ``status_code``)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.paths = []
+        self.next_id = 1
+        self.status_code = 422
+
+    def request(self, method, path, params=None, data=None, **kwargs):
+        with self.lock:
+            self.paths.append(path.split("/api/v1")[-1])
+
+        if data.get("fail", False) or any(x.get("fail", False) for x in data.get("bulk_data", [])):
+            response = MockHttpResponse({"message": "invalid"}, self.status_code)
+            response.text = "invalid"
+            return ErrorResponse(response)
+
+        if "bulk_data" in data:
+            return ListResponse(MockHttpResponse([self.created(x) for x in data["bulk_data"]], 200))
+
+        if "commentable_ids" in data:
+            items = [dict(data, commentable_id=x) for x in data["commentable_ids"]]
+            return ListResponse(MockHttpResponse([self.created(x) for x in items], 200))
+
+        return ObjectResponse(MockHttpResponse(self.created(data), 200))
+
+    def created(self, data):
+        with self.lock:
+            item = dict(data, id=self.next_id)
+            self.next_id += 1
+
+        return item
+
+
+class TestBulk(object):
+    def setup(self):
+        self.requestor = MockWriteRequestor()
+        self.moco = moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=self.requestor
+        )
+
+    def test_operations(self):
+        operations = (
+            BulkOperation("activity_create", data={"hours": x, "fail": x == 3}) for x in range(6)
+        )
+
+        report = self.moco.bulk(operations, max_workers=3)
+
+        assert isinstance(report, BulkReport)
+        assert len(report) == 6
+        assert [x.index for x in report] == list(range(6))
+        assert [x.index for x in report.failed] == [3]
+        assert isinstance(report.failed[0].exception, UnprocessableException)
+        assert isinstance(report[0].data, om.Activity)
+        assert report[5].data.hours == 5
+        assert not report.ok
+
+        with pytest.raises(UnprocessableException):
+            report.raise_for_errors()
+
+    def test_callables(self):
+        operations = [functools.partial(self.moco.Unit.get, x) for x in range(2)]
+        operations.append(lambda: 1 / 0)
+
+        report = self.moco.bulk([functools.partial(self.moco.post, "activity_create", data={"hours": 1})] + operations)
+
+        assert report[0].ok
+        assert isinstance(report[3].exception, ZeroDivisionError)
+
+    def test_bulk_endpoint(self):
+        operations = [
+            BulkOperation("project_expense_create", ep_params={"project_id": x % 2}, data={"title": str(x)})
+            for x in range(5)
+        ]
+
+        report = self.moco.bulk(operations, batch_size=2)
+
+        assert report.ok
+        assert sorted(self.requestor.paths) == [
+            "/projects/0/expenses", "/projects/0/expenses/bulk", "/projects/1/expenses/bulk"
+        ]
+        assert [x.data.title for x in report] == ["0", "1", "2", "3", "4"]
+
+    def test_bulk_endpoint_single(self):
+        report = self.moco.bulk([BulkOperation("invoice_payment_create", data={"paid_total": 10})])
+
+        assert report.ok
+        assert self.requestor.paths == ["/invoices/payments"]
+
+    def test_bulk_endpoint_disabled(self):
+        operations = [BulkOperation("invoice_payment_create", data={"paid_total": x}) for x in range(3)]
+
+        self.moco.bulk(operations, use_bulk_endpoints=False)
+
+        assert self.requestor.paths == ["/invoices/payments"] * 3
+
+    def test_bulk_endpoint_comments(self):
+        operations = [
+            BulkOperation("comment_create", data={"commentable_id": x, "commentable_type": "Project", "text": "A"})
+            for x in range(3)
+        ]
+        operations.append(
+            BulkOperation("comment_create", data={"commentable_id": 5, "commentable_type": "Project", "text": "B"})
+        )
+
+        report = self.moco.bulk(operations, max_workers=1)
+
+        assert sorted(self.requestor.paths) == ["/comments", "/comments/bulk"]
+        assert [x.data.commentable_id for x in report] == [0, 1, 2, 5]
+
+    def test_bulk_endpoint_error(self):
+        operations = [BulkOperation("invoice_payment_create", data={"paid_total": 1, "fail": True})] * 2
+
+        report = self.moco.bulk(operations)
+
+        assert len(report.failed) == 2
+        assert self.requestor.paths == ["/invoices/payments/bulk", "/invoices/payments", "/invoices/payments"]
+
+    def test_bulk_endpoint_error_single_results(self):
+        operations = [BulkOperation("invoice_payment_create", data={"paid_total": x, "fail": x == 1}) for x in range(3)]
+
+        report = self.moco.bulk(operations)
+
+        assert [x.index for x in report.failed] == [1]
+        assert isinstance(report[1].exception, UnprocessableException)
+        assert [x.data.paid_total for x in report.succeeded] == [0, 2]
+        assert self.requestor.paths == ["/invoices/payments/bulk"] + ["/invoices/payments"] * 3
+
+    def test_bulk_endpoint_server_error(self):
+        self.requestor.status_code = 500
+        operations = [BulkOperation("invoice_payment_create", data={"paid_total": x, "fail": True}) for x in range(3)]
+
+        report = self.moco.bulk(operations)
+
+        # the bulk request might have been applied, its operations are not sent again
+        assert len(report.failed) == 3
+        assert all(isinstance(x.exception, ServerErrorException) for x in report.failed)
+        assert self.requestor.paths == ["/invoices/payments/bulk"]
+
+    def test_bulk_endpoint_error_no_error_objector(self):
+        self.moco._objector = NoErrorObjector()
+        operations = [BulkOperation("invoice_payment_create", data={"paid_total": x, "fail": x == 1}) for x in range(3)]
+
+        report = self.moco.bulk(operations)
+
+        assert [x.index for x in report.failed] == [1]
+        assert self.requestor.paths == ["/invoices/payments/bulk"] + ["/invoices/payments"] * 3
+
+    def test_no_error_objector(self):
+        self.moco._objector = NoErrorObjector()
+
+        report = self.moco.bulk([BulkOperation("activity_create", data={"fail": True})])
+
+        assert report.failed[0].exception.data == "invalid"
+
+    def test_unknown_endpoint(self):
+        report = self.moco.bulk([BulkOperation("unknown_create", data={})])
+
+        assert isinstance(report[0].exception, ValueError)
+
+
+class TestBulkAsync(object):
+    def test_run_async(self):
+        async def create(value):
+            await asyncio.sleep(0)
+            if value == 2:
+                raise ValueError(value)
+            return value
+
+        async def run():
+            m = moco.Moco(auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"})
+            executor = BulkExecutor(m, max_workers=2)
+            return await executor.run_async(functools.partial(create, x) for x in range(5))
+
+        report = run_async(run())
+
+        assert [x.data for x in report.succeeded] == [0, 1, 3, 4]
+        assert isinstance(report[2].exception, ValueError)
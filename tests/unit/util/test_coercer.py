@@ -0,0 +1,113 @@
+import datetime
+
+from decimal import Decimal
+
+from moco_wrapper import moco
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.models.invoice import InvoiceStatus
+from moco_wrapper.util.coercion import Coercer, parse_date, parse_datetime, to_decimal
+from moco_wrapper.util.objector import DefaultObjector
+
+from ..mocks.requestor import MockPagedRequestor
+
+
+def activity(activity_id, date, hours):
+    return {
+        "id": activity_id,
+        "date": date,
+        "hours": hours,
+        "hourly_rate": 0.1,
+        "created_at": "2020-01-31T09:33:46Z",
+        "project": {"id": 1, "name": "Project", "hourly_rate": 95.5, "finish_date": "2020-12-31"}
+    }
+
+
+class TestParsers(object):
+    def test_parse_date(self):
+        assert parse_date("2020-01-31") == datetime.date(2020, 1, 31)
+
+    def test_parse_datetime(self):
+        utc = parse_datetime("2020-01-31T09:33:46Z")
+        offset = parse_datetime("2020-01-31T10:33:46.500+01:00")
+
+        assert utc == datetime.datetime(2020, 1, 31, 9, 33, 46, tzinfo=datetime.timezone.utc)
+        assert offset == datetime.datetime(2020, 1, 31, 9, 33, 46, 500000, tzinfo=datetime.timezone.utc)
+
+    def test_to_decimal(self):
+        assert to_decimal(0.1) == Decimal("0.1")
+        assert to_decimal(12) == Decimal(12)
+        assert to_decimal("12.50") == Decimal("12.50")
+
+
+class TestCoercer(object):
+    def setup(self):
+        self.coercer = Coercer()
+
+    def test_coerce(self):
+        records = self.coercer.coerce(om.Activity, [activity(1, "2020-01-01", 2), activity(2, "2020-01-01", None)])
+
+        assert records[0]["date"] == datetime.date(2020, 1, 1)
+        assert records[0]["date"] is records[1]["date"]  # parsed once
+        assert records[0]["hours"] == 2.0 and isinstance(records[0]["hours"], float)
+        assert records[1]["hours"] is None
+        assert records[0]["hourly_rate"] == Decimal("0.1")
+        assert records[0]["created_at"].tzinfo is not None
+
+    def test_coerce_nested(self):
+        records = self.coercer.coerce(om.Activity, [activity(1, "2020-01-01", 2)])
+
+        assert records[0]["project"]["hourly_rate"] == Decimal("95.5")
+        assert records[0]["project"]["finish_date"] == datetime.date(2020, 12, 31)
+
+    def test_coerce_enum(self):
+        records = self.coercer.coerce(om.Invoice, [{"id": 1, "status": "paid"}, {"id": 2, "status": "unknown"}])
+
+        assert records[0]["status"] is InvoiceStatus.PAID
+        assert records[1]["status"] == "unknown"  # kept as is
+
+    def test_coerce_renamed(self):
+        records = self.coercer.coerce(om.UserEmployment, [{"id": 1, "from": "2020-01-01", "to": None}])
+
+        assert records[0]["from"] == datetime.date(2020, 1, 1)
+        assert records[0]["to"] is None
+
+    def test_coerce_dtypes(self):
+        coercer = Coercer(dtypes={"Activity": {"hours": "decimal"}})
+        records = coercer.coerce(om.Activity, [activity(1, "2020-01-01", 2.5)])
+
+        assert records[0]["hours"] == Decimal("2.5")
+
+    def test_coerce_twice(self):
+        records = self.coercer.coerce(om.Activity, [activity(1, "2020-01-01", 2)])
+        records = self.coercer.coerce(om.Activity, records)
+
+        assert records[0]["date"] == datetime.date(2020, 1, 1)
+        assert records[0]["hourly_rate"] == Decimal("0.1")
+
+
+class TestTypedObjector(object):
+    def test_objector(self):
+        m = moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=MockPagedRequestor([[activity(1, "2020-01-01", 2), activity(2, "2020-01-02", 3)]]),
+            objector=DefaultObjector(coercer=Coercer())
+        )
+
+        activities = m.get("activity_getlist").data
+
+        assert activities[1].date == datetime.date(2020, 1, 2)
+        assert activities[1].project.hourly_rate == Decimal("95.5")
+
+    def test_objector_untyped(self):
+        m = moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=MockPagedRequestor([[activity(1, "2020-01-01", 2)]]),
+        )
+
+        assert m.get("activity_getlist").data[0].date == "2020-01-01"
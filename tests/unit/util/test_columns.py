@@ -0,0 +1,163 @@
+import datetime
+import math
+
+from array import array
+
+import pytest
+
+from moco_wrapper import moco
+from moco_wrapper.util.columnar import Columns
+from moco_wrapper.util.objector import ColumnarObjector
+
+from ..mocks.requestor import MockPagedRequestor
+
+
+def activity(activity_id, hours, user_id):
+    return {
+        "id": activity_id,
+        "date": "2020-01-0{}".format(activity_id),
+        "hours": hours,
+        "description": "activity {}".format(activity_id),
+        "user": {"id": user_id, "firstname": "Jane"}
+    }
+
+
+class TestColumns(object):
+    def test_from_records(self):
+        columns = Columns.from_records(
+            [activity(1, 1.5, 5), activity(2, None, 6)],
+            dtypes={"id": "int", "date": "date", "hours": "float"}
+        )
+
+        assert len(columns) == 2
+        assert columns.keys() == ["id", "date", "hours", "description", "user"]
+        assert isinstance(columns["id"], array)
+        assert list(columns["id"]) == [1, 2]
+        assert columns["date"] == [datetime.date(2020, 1, 1), datetime.date(2020, 1, 2)]
+        assert columns["hours"][0] == 1.5
+        assert math.isnan(columns["hours"][1])
+        assert columns["description"] == ["activity 1", "activity 2"]
+
+    def test_nested_fields(self):
+        columns = Columns.from_records(
+            [activity(1, 1, 5), {"id": 2, "user": None}],
+            fields=["id", "user.id", "hours"]
+        )
+
+        assert columns.to_dict() == {"id": [1, 2], "user.id": [5, None], "hours": [1, None]}
+
+    def test_int_column_with_none(self):
+        columns = Columns.from_records([{"id": 1}, {"id": None}], dtypes={"id": "int"})
+
+        assert list(columns["id"]) == [1, None]
+
+    def test_invalid_date(self):
+        columns = Columns.from_records([{"date": "2020-01-01"}, {"date": ""}], dtypes={"date": "date"})
+
+        assert columns["date"] == [datetime.date(2020, 1, 1), ""]
+
+    def test_concat(self):
+        first = Columns.from_records([activity(1, 1, 5), activity(2, 2, 5)], dtypes={"hours": "float"})
+        second = Columns.from_records([activity(3, 3, 6)], dtypes={"hours": "float"})
+
+        columns = Columns.concat([first, second])
+
+        assert len(columns) == 3
+        assert list(columns["hours"]) == [1.0, 2.0, 3.0]
+        assert len(Columns.concat([])) == 0
+
+    def test_concat_different_fields(self):
+        first = Columns.from_records([{"id": 1, "hours": 1.5}], dtypes={"id": "int", "hours": "float"})
+        second = Columns.from_records([{"id": 2, "tags": ["a"]}], dtypes={"id": "int"})
+
+        columns = Columns.concat(iter([first, Columns(), second]))
+
+        assert columns.keys() == ["id", "hours", "tags"]
+        assert list(columns["id"]) == [1, 2]
+        assert columns["hours"][0] == 1.5
+        assert math.isnan(columns["hours"][1])
+        assert columns["tags"] == [None, ["a"]]
+
+    def test_to_numpy(self):
+        numpy = pytest.importorskip("numpy")
+
+        columns = Columns.from_records([activity(1, 1.5, 5)], dtypes={"hours": "float", "date": "date"})
+        result = columns.to_numpy()
+
+        assert result["hours"].dtype == numpy.float64
+        assert result["date"].dtype == numpy.dtype("datetime64[D]")
+
+    def test_to_numpy_copy(self):
+        pytest.importorskip("numpy")
+
+        columns = Columns.from_records([{"id": 1}], dtypes={"id": "int"})
+        result = columns.to_numpy()
+
+        # the array does not hold a view on the column, it can still be extended
+        columns.append_records([{"id": 2}])
+
+        assert list(result["id"]) == [1]
+        assert list(columns["id"]) == [1, 2]
+
+
+class TestColumnarObjector(object):
+    def create_moco(self, pages, **kwargs):
+        self.requestor = MockPagedRequestor(pages)
+
+        return moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=self.requestor,
+            objector=ColumnarObjector(**kwargs)
+        )
+
+    def test_list_response(self):
+        m = self.create_moco([[activity(1, 1.5, 5), activity(2, 2, 6)]])
+
+        columns = m.get("activity_getlist").data
+
+        assert isinstance(columns, Columns)
+        assert isinstance(columns["hours"], array)  # from the DTYPES of the activity model
+        assert columns["date"][0] == datetime.date(2020, 1, 1)
+
+    def test_pages(self):
+        m = self.create_moco(
+            [[activity(1, 1, 5), activity(2, 2, 6)], [activity(3, 3, 5)]],
+            fields=["id", "hours", "user.id"]
+        )
+
+        for max_workers in (None, 2):
+            columns = Columns.concat(page.data for page in m.pages("activity_getlist", max_workers=max_workers))
+
+            assert len(columns) == 3
+            assert sum(columns["hours"]) == 6
+            assert columns["user.id"] == [5, 6, 5]
+
+    def test_paginate(self):
+        m = self.create_moco(
+            [[activity(1, 1, 5), activity(2, 2, 6)], [activity(3, 3, 5)]],
+            fields=["id", "hours", "user.id"]
+        )
+
+        for max_workers in (None, 2):
+            rows = list(m.paginate("activity_getlist", max_workers=max_workers))
+
+            assert rows == [
+                {"id": 1, "hours": 1.0, "user.id": 5},
+                {"id": 2, "hours": 2.0, "user.id": 6},
+                {"id": 3, "hours": 3.0, "user.id": 5},
+            ]
+
+    def test_list_response_rows(self):
+        m = self.create_moco([[activity(1, 1.5, 5), activity(2, 2, 6)]], fields=["id", "user.id"])
+
+        response = m.get("activity_getlist")
+
+        assert len(response) == 2
+        assert response[1] == {"id": 2, "user.id": 6}
+        assert list(response) == [{"id": 1, "user.id": 5}, {"id": 2, "user.id": 6}]
+
+        with pytest.raises(IndexError):
+            response.data.row(2)
@@ -0,0 +1,102 @@
+import pytest
+
+from moco_wrapper import moco, exceptions
+from moco_wrapper.util.limiter import RateLimiter
+from moco_wrapper.util.objector import RawObjector
+from moco_wrapper.util.requestor import DefaultRequestor, NoRetryRequestor, RawRequestor, RetryPolicy
+from moco_wrapper.util.response import ErrorResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class MockSession(object):
+    def __init__(self, response):
+        self.response = response
+        self.calls = []
+
+    def get(self, path, **kwargs):
+        self.calls.append(kwargs)
+        return self.response
+
+
+def rate_limited(retry_after):
+    response = MockHttpResponse(None, 429, headers={"Retry-After": str(retry_after)})
+    response.text = "Too many requests"
+    response.content = response.text.encode("utf-8")
+
+    return response
+
+
+def success():
+    response = MockHttpResponse({"id": 1}, 200, headers={"Content-Type": "application/json"})
+    response.text = '{"id": 1}'
+    response.content = response.text.encode("utf-8")
+
+    return response
+
+
+class TestDeadline(object):
+    path = "https://test.mocoapp.com/api/v1/units/1"
+
+    def test_default_timeout(self):
+        session = MockSession(success())
+        requestor = DefaultRequestor(session=session)
+
+        requestor.get(self.path)
+
+        assert session.calls[0]["timeout"] == DefaultRequestor.DEFAULT_TIMEOUT
+
+    def test_timeout_is_capped_by_deadline(self):
+        session = MockSession(success())
+        requestor = DefaultRequestor(session=session, timeout=(10, 60))
+
+        requestor.get(self.path, deadline=2)
+
+        connect_timeout, read_timeout = session.calls[0]["timeout"]
+        assert connect_timeout <= 2
+        assert read_timeout <= 2
+
+    def test_no_retry_after_deadline(self):
+        session = MockSession(rate_limited(10))
+        requestor = DefaultRequestor(session=session, retry_policy=RetryPolicy(jitter=0))
+
+        response = requestor.get(self.path, deadline=1)
+
+        assert isinstance(response, ErrorResponse)
+        assert len(session.calls) == 1
+
+    def test_retry_within_deadline(self):
+        session = MockSession(rate_limited(0))
+        requestor = DefaultRequestor(session=session, retry_policy=RetryPolicy(max_attempts=3, jitter=0))
+
+        requestor.get(self.path, deadline=5)
+
+        assert len(session.calls) == 3
+
+    def test_rate_limiter_wait_exceeds_deadline(self):
+        limiter = RateLimiter(requests=1, per=60)
+        session = MockSession(success())
+        requestor = NoRetryRequestor(session=session, rate_limiter=limiter)
+
+        requestor.get(self.path, deadline=1)
+
+        with pytest.raises(exceptions.DeadlineExceededException):
+            requestor.get(self.path, deadline=1)
+
+        assert len(session.calls) == 1
+
+    def test_moco_passes_defaults(self):
+        m = moco.Moco(
+            auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"},
+            requestor=RawRequestor(),
+            objector=RawObjector(),
+            timeout=5,
+            deadline=30
+        )
+
+        args = dict(m.Unit.get(1)["args"])
+        assert args["timeout"] == 5
+        assert args["deadline"] == 30
+
+        args = dict(m.get("unit_get", ep_params={"id": 1}, deadline=3)["args"])
+        assert args["deadline"] == 3
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from moco_wrapper.util.requestor.base import BaseRequestor
+from moco_wrapper.util.response import decoder, ListResponse, PagedListResponse, ObjectResponse, ErrorResponse, \
+    EmptyResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class CountingDecoder(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, content):
+        self.calls += 1
+        return json.loads(content)
+
+
+def json_response(json_data, headers=None):
+    response = MockHttpResponse(None, 200, headers=dict({"Content-Type": "application/json"}, **(headers or {})))
+    response.content = json.dumps(json_data).encode("utf-8")
+    response.text = response.content.decode("utf-8")
+
+    return response
+
+
+class TestDecoder(object):
+    def setup(self):
+        self.decoder = CountingDecoder()
+        decoder.set_decoder(self.decoder)
+
+    def teardown(self):
+        decoder.set_decoder(None)
+
+    def test_default_decoder(self):
+        decoder.set_decoder(None)
+
+        assert decoder.get_decoder()(b'{"id": 1}') == {"id": 1}
+
+    def test_decoded_once(self):
+        response = json_response([{"id": 1}, {"id": 2}], headers={"X-Page": "1", "X-Total": "2", "X-Per-Page": "100"})
+
+        result = BaseRequestor()._convert_response(response)
+        assert isinstance(result, PagedListResponse)
+
+        # the response objects reuse the decoded body
+        ListResponse(response)
+        PagedListResponse(response)
+
+        assert self.decoder.calls == 1
+        assert [x["id"] for x in result.items] == [1, 2]
+
+    def test_object_response(self):
+        result = BaseRequestor()._convert_response(json_response({"id": 1}))
+
+        assert isinstance(result, ObjectResponse)
+        assert result.data == {"id": 1}
+        assert self.decoder.calls == 1
+
+    def test_requestor_decoder(self):
+        requestor = BaseRequestor()
+        requestor.json_decoder = CountingDecoder()
+
+        requestor._convert_response(json_response({"id": 1}))
+
+        assert requestor.json_decoder.calls == 1
+        assert self.decoder.calls == 0
+
+    def test_invalid_json(self):
+        response = json_response(None)
+        response.content = b"<html></html>"
+        response.text = "<html></html>"
+
+        assert isinstance(BaseRequestor()._convert_response(response), ErrorResponse)
+
+    def test_empty_body(self):
+        response = MockHttpResponse(None, 200, headers={"Content-Type": "application/json"})
+        response.content = b" \n"
+
+        # the empty check works on the raw bytes, the body is never decoded into text
+        assert isinstance(BaseRequestor()._convert_response(response), EmptyResponse)
+        assert self.decoder.calls == 0
+
+    def test_orjson(self):
+        orjson = pytest.importorskip("orjson")
+        decoder.set_decoder(None)
+
+        assert decoder.default_decoder() is orjson.loads
+        assert isinstance(BaseRequestor()._convert_response(json_response([{"id": 1}])), ListResponse)
@@ -1,4 +1,7 @@
+import pytest
+
 from moco_wrapper.util.objector import DefaultObjector
+from moco_wrapper.models import objector_models as om
 
 
 class TestDefaultObjectorUrlMappings(object):
@@ -37,3 +40,58 @@ class TestDefaultObjectorUrlMappings(object):
         class_name = objector.get_class_name_from_request_url(url)
 
         assert class_name == expected_class
+
+    def test_ids_and_query_string(self):
+        objector = DefaultObjector()
+
+        assert objector.get_class_name_from_request_url(
+            self._build_request_url("projects/1234/tasks?page=1")) == "ProjectTask"
+        assert objector.get_class_name_from_request_url(
+            self._build_request_url("invoices/12/payments/bulk")) == "InvoicePayment"
+        assert objector.get_class_name_from_request_url(self._build_request_url("activities/5/disregard")) is None
+
+    def test_unknown_path(self):
+        objector = DefaultObjector()
+
+        with pytest.raises(ValueError):
+            objector.get_class_name_from_request_url(self._build_request_url("unknown/12"))
+
+    def test_unknown_path_not_stored(self):
+        objector = DefaultObjector()
+        objector.compile_routes()
+        routes = dict(objector._routes)
+
+        for path in ("unknown", "projects/abc", "projects/1/tasks/x"):
+            with pytest.raises(ValueError):
+                objector.get_class_name_from_request_url(self._build_request_url(path))
+
+        assert objector._routes == routes
+
+    def test_class_map_modified_in_place(self):
+        objector = DefaultObjector()
+        objector.compile_routes()
+        objector.class_map["projects"]["new"] = "NewClassName"
+
+        assert objector.get_class_name_from_request_url(self._build_request_url("projects/1/new")) == "NewClassName"
+        assert ("projects", "new") not in objector._routes
+
+    def test_routes_reset_on_new_class_map(self):
+        url = self._build_request_url("projects")
+
+        objector = DefaultObjector()
+        assert objector.get_class_name_from_request_url(url) == "Project"
+
+        objector.class_map = {
+            "projects": {
+                "base": "OtherClassName"
+            }
+        }
+        assert objector.get_class_name_from_request_url(url) == "OtherClassName"
+
+    def test_get_class(self):
+        objector = DefaultObjector()
+
+        assert objector.get_class("ProjectTask") is om.ProjectTask
+
+        with pytest.raises(AttributeError):
+            objector.get_class("NoSuchClass")
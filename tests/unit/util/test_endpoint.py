@@ -1,4 +1,4 @@
-from moco_wrapper.util.endpoint import Endpoint
+from moco_wrapper.util.endpoint import Endpoint, EndpointManager
 
 class MockObjectorModel(object):
     def __init__(self):
@@ -30,3 +30,32 @@ class TestEndpoint(object):
         e = Endpoint("test-slug", "test/template", "GET")
 
         assert e.type is None
+
+
+class TestEndpointManager(object):
+    def setup(self):
+        self.manager = EndpointManager()
+
+    def test_resolve(self):
+        endpoint, params = self.manager.resolve("GET", "/projects/1/tasks")
+
+        assert endpoint.slug == "project_task_getlist"
+        assert params == {"project_id": 1}
+
+    def test_resolve_static_path_first(self):
+        assert self.manager.resolve("GET", "/projects/assigned")[0].slug == "project_assigned"
+        assert self.manager.resolve("GET", "/purchases/drafts/4")[0].slug == "purchase_draft_get"
+
+    def test_resolve_longest_template_first(self):
+        assert self.manager.resolve("GET", "/invoices/5.pdf") == (self.manager.get("invoice_pdf"), {"id": 5})
+        assert self.manager.resolve("GET", "/invoices/5")[0].slug == "invoice_get"
+
+    def test_resolve_method(self):
+        assert self.manager.resolve("PUT", "/projects/1")[0].slug == "project_update"
+        assert self.manager.resolve("PATCH", "/taggings/Project/3") == (
+            self.manager.get("tagging_add"), {"entity": "Project", "entity_id": 3}
+        )
+
+    def test_resolve_unknown(self):
+        assert self.manager.resolve("GET", "/unknown") == (None, None)
+        assert self.manager.resolve("POST", "/projects/1") == (None, None)
@@ -0,0 +1,178 @@
+import time
+
+import pytest
+
+from moco_wrapper import moco
+from moco_wrapper.exceptions import NotFoundException, RateLimitException, UnauthorizedException
+from moco_wrapper.util.fake_server import FakeMocoServer, generate_items
+from moco_wrapper.util.requestor import DefaultRequestor, NoRetryRequestor, RetryPolicy
+from moco_wrapper.util.response import EmptyResponse, FileResponse, PagedListResponse
+
+
+class TestGenerateItems(object):
+    def test_deterministic(self):
+        assert generate_items("Project", 3, "seed") == generate_items("Project", 3, "seed")
+        assert generate_items("Project", 3, "seed") != generate_items("Project", 3, "other")
+
+    def test_field_types(self):
+        item = generate_items("Project", 1, "seed")[0]
+
+        assert item["id"] == 1
+        assert isinstance(item["active"], bool)
+        assert isinstance(item["budget"], float)
+        assert item["billing_variant"] in ("project", "task", "user")
+        assert isinstance(item["leader"], dict)
+        assert isinstance(item["tasks"], list)
+
+    def test_renamed_fields(self):
+        item = generate_items("UserEmployment", 1, "seed")[0]
+
+        assert "from" in item
+        assert "from_date" not in item
+
+
+class TestFakeMocoServer(object):
+    def setup(self):
+        self.server = FakeMocoServer(per_page=20, seed=1).start()
+        self.moco = moco.Moco(
+            auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"},
+            requestor=NoRetryRequestor(),
+            base_url=self.server.url
+        )
+
+    def teardown(self):
+        self.server.stop()
+
+    def test_pagination(self):
+        page = self.moco.Project.getlist()
+
+        assert isinstance(page, PagedListResponse)
+        assert len(page.items) == 20
+        assert page.total == 50
+        assert page.last_page == 3
+        assert not page.is_last
+
+        projects = list(self.moco.paginate("project_getlist"))
+
+        assert [x.id for x in projects] == list(range(1, 51))
+
+    def test_concurrent_pagination(self):
+        projects = list(self.moco.paginate("project_getlist", max_workers=3))
+
+        assert len(projects) == 50
+        assert self.server.stats.endpoints["project_getlist"] == 3
+
+    def test_get(self):
+        project = self.moco.Project.get(5).data
+
+        assert project.id == 5
+        assert project.name == self.server.collection("/projects")[4]["name"]
+
+    def test_get_not_found(self):
+        with pytest.raises(NotFoundException):
+            self.moco.Project.get(100)
+
+    def test_create_update_delete(self):
+        response = self.moco.post("/companies", data={"name": "New company"})
+        assert response.data.id == 51
+        assert response.data.name == "New company"
+
+        assert self.moco.put("/companies/51", data={"name": "Renamed"}).data.name == "Renamed"
+        assert self.moco.Company.get(51).data.name == "Renamed"
+
+        assert isinstance(self.moco.delete("/companies/51"), EmptyResponse)
+        assert len(self.server.collection("/companies")) == 50
+
+    def test_updated_after(self):
+        self.moco.put("/users/7", data={"firstname": "Changed"})
+
+        users = self.moco.get("user_getlist", params={"updated_after": "2021-01-01T00:00:00Z"}).items
+
+        assert [x.id for x in users] == [7]
+
+    def test_bulk(self):
+        response = self.moco.post("/projects/1/expenses/bulk", data={"bulk_data": [{"title": "a"}, {"title": "b"}]})
+
+        assert [x.title for x in response.items] == ["a", "b"]
+        assert len(self.server.collection("/projects/1/expenses")) == 52
+
+    def test_pdf(self):
+        response = self.moco.Invoice.pdf(1)
+
+        assert isinstance(response, FileResponse)
+        assert response.data.startswith(b"%PDF")
+
+    def test_taggings(self):
+        self.moco.Tagging.add("Project", 1, ["a", "b"])
+        self.moco.Tagging.delete("Project", 1, ["a"])
+
+        assert self.moco.Tagging.get("Project", 1).items == ["b"]
+
+    def test_reset(self):
+        self.moco.delete("/companies/1")
+        self.server.reset()
+
+        assert len(self.server.collection("/companies")) == 50
+        assert self.server.stats.requests == 0
+
+
+class TestFakeMocoServerFailures(object):
+    def test_throttling_with_retries(self):
+        with FakeMocoServer(throttle_rate=0.5, retry_after=0, seed=3) as server:
+            m = moco.Moco(
+                auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"},
+                requestor=DefaultRequestor(retry_policy=RetryPolicy(max_attempts=20, backoff_ms=0, jitter=0)),
+                base_url=server.url
+            )
+
+            for project_id in range(1, 11):
+                assert m.Project.get(project_id).data.id == project_id
+
+            stats = server.stats.to_dict()
+
+        assert stats["throttled"] > 0
+        assert stats["requests"] == 10 + stats["throttled"]
+
+    def test_rate_limit(self):
+        with FakeMocoServer(rate_limit=2) as server:
+            m = moco.Moco(
+                auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"},
+                requestor=NoRetryRequestor(),
+                base_url=server.url
+            )
+
+            m.Unit.get(1)
+            m.Unit.get(1)
+
+            with pytest.raises(RateLimitException):
+                m.Unit.get(1)
+
+            assert server.stats.throttled == 1
+
+    def test_api_key(self):
+        with FakeMocoServer(api_key="secret") as server:
+            m = moco.Moco(
+                auth={"api_key": "wrong", "domain": "<DOMAIN>"},
+                requestor=NoRetryRequestor(),
+                base_url=server.url
+            )
+
+            with pytest.raises(UnauthorizedException):
+                m.Unit.get(1)
+
+    def test_latency(self):
+        with FakeMocoServer(latency=0.05) as server:
+            m = moco.Moco(
+                auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"},
+                requestor=NoRetryRequestor(),
+                base_url=server.url
+            )
+
+            started = time.perf_counter()
+            m.Unit.get(1)
+
+            assert time.perf_counter() - started >= 0.05
+
+    def test_not_running(self):
+        with pytest.raises(RuntimeError):
+            FakeMocoServer().url
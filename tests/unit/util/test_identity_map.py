@@ -0,0 +1,157 @@
+from moco_wrapper import moco
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.util.objector import IdentityMap, DefaultObjector
+
+from ..mocks.requestor import MockPagedRequestor
+
+
+def activity(activity_id, user_id, **user):
+    return {
+        "id": activity_id,
+        "hours": 1,
+        "user": dict({"id": user_id}, **user),
+        "project": {"id": 10, "customer": {"id": 20}}
+    }
+
+
+class TestIdentityMap(object):
+    def create_moco(self, pages, **kwargs):
+        self.requestor = MockPagedRequestor(pages)
+
+        return moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=self.requestor,
+            objector=DefaultObjector(),
+            **kwargs
+        )
+
+    def test_get_or_create(self):
+        identity_map = IdentityMap()
+
+        first = identity_map.get_or_create(om.User, {"id": 1, "firstname": "Jane"})
+        second = identity_map.get_or_create(om.User, {"id": 1, "lastname": "Doe"})
+        company = identity_map.get_or_create(om.Company, {"id": 1})
+
+        assert first is second
+        assert first.firstname == "Jane"
+        assert first.lastname == "Doe"  # merged from the second occurrence
+        assert company is not first
+        assert len(identity_map) == 2
+
+    def test_newer_data_overwrites(self):
+        identity_map = IdentityMap()
+
+        user = identity_map.get_or_create(om.User, {"id": 1, "firstname": "Jane", "updated_at": "2020-01-01T10:00:00Z"})
+
+        identity_map.get_or_create(om.User, {"id": 1, "firstname": "Old", "updated_at": "2019-12-31T10:00:00Z"})
+        assert user.firstname == "Jane"
+
+        identity_map.get_or_create(om.User, {"id": 1, "firstname": "Janet", "updated_at": "2020-01-02T10:00:00Z"})
+        assert user.firstname == "Janet"
+        assert user.updated_at == "2020-01-02T10:00:00Z"
+
+    def test_without_updated_at_not_overwritten(self):
+        identity_map = IdentityMap()
+
+        user = identity_map.get_or_create(om.User, {"id": 1, "firstname": "Jane", "updated_at": "2020-01-01T10:00:00Z"})
+        identity_map.get_or_create(om.User, {"id": 1, "firstname": "Other"})
+
+        assert user.firstname == "Jane"
+
+    def test_without_id(self):
+        identity_map = IdentityMap()
+
+        assert identity_map.get_or_create(om.User, {"firstname": "Jane"}) is not \
+            identity_map.get_or_create(om.User, {"firstname": "Jane"})
+
+    def test_maxsize(self):
+        identity_map = IdentityMap(maxsize=2)
+
+        first = identity_map.get_or_create(om.User, {"id": 1})
+        identity_map.get_or_create(om.User, {"id": 2})
+        identity_map.get_or_create(om.User, {"id": 3})
+
+        assert len(identity_map) == 2
+        assert identity_map.get_or_create(om.User, {"id": 1}) is not first
+
+    def test_call_scope(self):
+        m = self.create_moco([[activity(1, 5), activity(2, 5), activity(3, 6)]])
+
+        items = m.get("activity_getlist", identity_map=True).items
+
+        assert items[0].user is items[1].user
+        assert items[0].user is not items[2].user
+        assert items[0].project.customer is items[2].project.customer
+
+        other = m.get("activity_getlist", identity_map=True).items
+        assert other[0].user is not items[0].user
+
+    def test_without_identity_map(self):
+        m = self.create_moco([[activity(1, 5), activity(2, 5)]])
+
+        items = m.get("activity_getlist").items
+
+        assert items[0].user is not items[1].user
+        assert items[0].user.id == items[1].user.id
+
+    def test_paginate_scope(self):
+        m = self.create_moco([[activity(1, 5), activity(2, 6)], [activity(3, 5), activity(4, 6)]])
+
+        for max_workers in (None, 2):
+            items = list(m.paginate("activity_getlist", identity_map=True, max_workers=max_workers))
+
+            assert items[0].user is items[2].user
+            assert items[1].user is items[3].user
+
+    def test_client_scope(self):
+        identity_map = IdentityMap()
+        m = self.create_moco([[activity(1, 5)]], identity_map=identity_map)
+
+        first = m.get("activity_getlist")[0]
+        second = m.get("activity_getlist")[0]
+
+        assert first is not second
+        assert first.user is second.user
+        assert first.project is second.project
+        assert len(identity_map) == 2  # the customer of the project was not accessed yet
+
+        # disabled for a single call
+        third = m.get("activity_getlist", identity_map=False)[0]
+        assert third.user is not first.user
+
+    def test_client_scope_later_response_overwrites(self):
+        old = dict(activity(1, 5), project={"id": 10, "name": "Old"})
+        renamed = dict(activity(2, 5), project={"id": 10, "name": "Renamed"})
+        m = self.create_moco([[old], [renamed]], identity_map=IdentityMap())
+
+        a = m.get("activity_getlist", params={"page": 1})[0]
+        assert a.project.name == "Old"
+
+        b = m.get("activity_getlist", params={"page": 2})[0]
+        assert b.project.name == "Renamed"
+        assert a.project is b.project
+
+    def test_client_scope_older_response_not_overwrites(self):
+        old = dict(activity(1, 5), project={"id": 10, "name": "Old"})
+        renamed = dict(activity(2, 5), project={"id": 10, "name": "Renamed"})
+        m = self.create_moco([[old], [renamed]], identity_map=IdentityMap())
+
+        a = m.get("activity_getlist", params={"page": 1})[0]
+        b = m.get("activity_getlist", params={"page": 2})[0]
+
+        # the project of the older response is converted last, it does not overwrite the newer data
+        assert b.project.name == "Renamed"
+        assert a.project.name == "Renamed"
+
+    def test_scope(self):
+        identity_map = IdentityMap()
+
+        user = identity_map.get_or_create(om.User, {"id": 1, "firstname": "Jane"})
+        identity_map.get_or_create(om.User, {"id": 1, "firstname": "Other"})
+        assert user.firstname == "Jane"  # same response, only missing fields are added
+
+        assert identity_map.scope().get_or_create(om.User, {"id": 1, "firstname": "Janet"}) is user
+        assert user.firstname == "Janet"
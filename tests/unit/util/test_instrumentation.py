@@ -0,0 +1,169 @@
+import pytest
+import requests
+
+from moco_wrapper import moco
+from moco_wrapper.util.instrumentation import Hooks, Histogram, MetricsCollector
+from moco_wrapper.util.requestor import DefaultRequestor, RetryPolicy
+
+from ..mocks.http import MockHttpResponse
+
+
+class MockSession(object):
+    """
+    Session returning the given responses one after another (exceptions are raised)
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def get(self, path, **kwargs):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+    post = get
+
+
+def rate_limited():
+    response = MockHttpResponse(None, 429, headers={"Retry-After": "0"})
+    response.text = "Too many requests"
+
+    return response
+
+
+def success(body='{"id": 1, "name": "Unit"}'):
+    response = MockHttpResponse(None, 200, headers={"Content-Type": "application/json"})
+    response.content = body.encode("utf-8")
+    response.text = body
+
+    return response
+
+
+class TestHooks(object):
+    def setup(self):
+        self.session = MockSession([])
+        self.moco = moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=DefaultRequestor(session=self.session, retry_policy=RetryPolicy(backoff_ms=0, jitter=0))
+        )
+
+    def test_events(self):
+        calls = []
+        for event in Hooks.EVENTS:
+            self.moco.hooks.register(event, lambda *args, name=event: calls.append((name, args)))
+
+        self.session.responses = [rate_limited(), success()]
+        self.moco.Unit.get(1)
+
+        assert [x[0] for x in calls] == ["before_request", "on_retry", "after_response", "on_objectify"]
+
+        event = calls[0][1][0]
+        assert all(x[1][0] is event for x in calls)
+        assert event.slug == "unit_get"
+        assert event.method == "GET"
+        assert event.retries == 1
+        assert event.status_codes == [429]
+        assert event.status_code == 200
+        assert event.response_bytes == len(success().content)
+        assert event.elapsed >= 0
+        assert event.objectify_time >= 0
+
+    def test_exception(self):
+        events = []
+        self.moco.hooks.register("after_response", events.append)
+
+        self.session.responses = [requests.exceptions.ConnectionError()]
+        with pytest.raises(requests.exceptions.ConnectionError):
+            self.moco.Unit.get(1)
+
+        assert isinstance(events[0].exception, requests.exceptions.ConnectionError)
+        assert events[0].status_code is None
+
+    def test_decorator_and_unregister(self):
+        events = []
+
+        @self.moco.hooks.on("after_response")
+        def after_response(event):
+            events.append(event)
+
+        self.session.responses = [success()]
+        self.moco.Unit.get(1)
+        self.moco.hooks.unregister("after_response", after_response)
+        assert not self.moco.hooks.has_listeners()
+
+        self.session.responses = [success()]
+        self.moco.Unit.get(1)
+
+        assert len(events) == 1
+
+    def test_unknown_event(self):
+        with pytest.raises(ValueError):
+            self.moco.hooks.register("before_everything", print)
+
+
+class TestMetricsCollector(object):
+    def setup(self):
+        self.session = MockSession([])
+        self.moco = moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=DefaultRequestor(session=self.session, retry_policy=RetryPolicy(backoff_ms=0, jitter=0))
+        )
+        self.metrics = MetricsCollector().install(self.moco.hooks)
+
+    def test_to_dict(self):
+        self.session.responses = [rate_limited(), rate_limited(), success(), success()]
+        self.moco.Unit.get(1)
+        self.moco.Unit.get(2)
+
+        metrics = self.metrics.to_dict()["unit_get"]
+
+        assert metrics["requests"] == 2
+        assert metrics["errors"] == 0
+        assert metrics["retries"] == 2
+        assert metrics["throttled"] == 2
+        assert metrics["status_codes"] == {200: 2}
+        assert metrics["latency"]["count"] == 2
+        assert metrics["objectify"]["count"] == 2
+        assert metrics["response_bytes"]["buckets"][256] == 2
+
+    def test_other(self):
+        self.session.responses = [success()]
+        self.moco.get("/units/1", raw=True)
+
+        assert self.metrics.to_dict()[MetricsCollector.OTHER]["requests"] == 1
+
+    def test_to_prometheus(self):
+        self.session.responses = [success()]
+        self.moco.Unit.get(1)
+
+        text = self.metrics.to_prometheus()
+
+        assert '# TYPE moco_wrapper_requests_total counter' in text
+        assert 'moco_wrapper_requests_total{slug="unit_get"} 1' in text
+        assert 'moco_wrapper_responses_total{slug="unit_get",status="200"} 1' in text
+        assert 'moco_wrapper_request_duration_seconds_bucket{slug="unit_get",le="+Inf"} 1' in text
+        assert 'moco_wrapper_response_size_bytes_count{slug="unit_get"} 1' in text
+
+    def test_uninstall(self):
+        self.metrics.uninstall(self.moco.hooks)
+
+        self.session.responses = [success()]
+        self.moco.Unit.get(1)
+
+        assert self.metrics.to_dict() == {}
+
+    def test_histogram(self):
+        histogram = Histogram((1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == [(1, 2), (10, 3), (float("inf"), 4)]
+        assert histogram.sum == 56.5
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from moco_wrapper.util.limiter import TokenBucket, RateLimiter
+
+
+class FakeClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket(object):
+    def setup(self):
+        self.clock = FakeClock()
+        self.bucket = TokenBucket(10, per=1.0, clock=self.clock)
+
+    def test_burst_up_to_capacity(self):
+        for _ in range(10):
+            assert self.bucket.reserve() == 0
+
+    def test_wait_when_empty(self):
+        for _ in range(10):
+            self.bucket.reserve()
+
+        assert self.bucket.reserve() == pytest.approx(0.1)
+        assert self.bucket.reserve() == pytest.approx(0.2)
+
+    def test_refill(self):
+        for _ in range(10):
+            self.bucket.reserve()
+
+        self.clock.now = 0.5
+        assert self.bucket.tokens == pytest.approx(5)
+
+        self.clock.now = 10
+        assert self.bucket.tokens == pytest.approx(10)
+
+    def test_try_acquire(self):
+        for _ in range(10):
+            assert self.bucket.try_acquire() == 0
+
+        assert self.bucket.try_acquire() == pytest.approx(0.1)
+        # nothing was taken, the wait does not grow
+        assert self.bucket.try_acquire() == pytest.approx(0.1)
+
+        self.clock.now = 0.1
+        assert self.bucket.try_acquire() == 0
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+    def test_thread_safety(self):
+        bucket = TokenBucket(1000, per=1.0, clock=self.clock)
+
+        def reserve():
+            for _ in range(100):
+                bucket.reserve()
+
+        threads = [threading.Thread(target=reserve) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert bucket.tokens == pytest.approx(0)
+
+
+class TestRateLimiter(object):
+    def setup(self):
+        self.clock = FakeClock()
+        self.limiter = RateLimiter(
+            requests=2,
+            per=1.0,
+            limits={
+                "slow.mocoapp.com": (1, 10.0),
+                "special-key": (5, 1.0)
+            },
+            clock=self.clock
+        )
+
+    def headers(self, api_key):
+        return {"Authorization": "Token token={}".format(api_key)}
+
+    def test_same_key_shares_bucket(self):
+        path = "https://test.mocoapp.com/api/v1/projects"
+
+        assert self.limiter.reserve(path, self.headers("a")) == 0
+        assert self.limiter.reserve(path + "/1", self.headers("a")) == 0
+        assert self.limiter.reserve(path, self.headers("a")) > 0
+
+    def test_api_keys_have_own_buckets(self):
+        path = "https://test.mocoapp.com/api/v1/projects"
+
+        self.limiter.reserve(path, self.headers("a"))
+        self.limiter.reserve(path, self.headers("a"))
+
+        assert self.limiter.reserve(path, self.headers("b")) == 0
+
+    def test_limit_by_host(self):
+        bucket = self.limiter.bucket("https://slow.mocoapp.com/api/v1/units", self.headers("a"))
+
+        assert bucket.rate == 1
+        assert bucket.per == 10.0
+
+    def test_limit_by_api_key(self):
+        bucket = self.limiter.bucket("https://test.mocoapp.com/api/v1/units", self.headers("special-key"))
+
+        assert bucket.rate == 5
@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from moco_wrapper import moco
+from moco_wrapper.util.cache import ResponseCache
+from moco_wrapper.util.requestor.base import BaseRequestor
+from moco_wrapper.util.response import RawResponse, ErrorResponse
+
+from ..mocks.http import MockHttpResponse
+from ..mocks.requestor import MockPagedRequestor
+
+
+def json_response(json_data, status_code=200, headers=None):
+    response = MockHttpResponse(None, status_code, headers=dict({"Content-Type": "application/json"}, **(headers or {})))
+    response.content = json.dumps(json_data).encode("utf-8")
+    response.text = response.content.decode("utf-8")
+
+    return response
+
+
+class TestRawResponse(object):
+    def test_convert_response(self):
+        response = json_response([{"id": 1}], headers={"X-Page": "2", "X-Per-Page": "1", "X-Total": "3"})
+
+        result = BaseRequestor()._convert_response(response, raw=True)
+
+        assert isinstance(result, RawResponse)
+        assert result.data == b'[{"id": 1}]'
+        assert bytes(result.view) == result.data
+        assert result.content_type == "application/json"
+        assert result.is_paged
+        assert result.current_page == 2
+        assert result.next_page == 3
+        assert result.last_page == 3
+        assert result.is_last
+
+    def test_not_paged(self):
+        result = BaseRequestor()._convert_response(json_response({"id": 1}), raw=True)
+
+        assert not result.is_paged
+        assert result.is_last
+        assert result.total is None
+
+    def test_error(self):
+        result = BaseRequestor()._convert_response(json_response({"message": "Not found"}, 404), raw=True)
+
+        assert isinstance(result, ErrorResponse)
+
+
+class TestRawMoco(object):
+    def setup(self):
+        self.requestor = MockPagedRequestor([[{"id": 1}, {"id": 2}], [{"id": 3}]])
+        self.moco = moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=self.requestor,
+            cache=ResponseCache(ttl={"unit_getlist": 60})
+        )
+
+    def test_get(self):
+        result = self.moco.get("unit_getlist", raw=True)
+
+        assert isinstance(result, RawResponse)
+        assert json.loads(result.data) == [{"id": 1}, {"id": 2}]
+        assert len(self.moco.cache) == 0  # raw responses are not cached
+
+    def test_pages(self):
+        pages = list(self.moco.pages("unit_getlist", raw=True))
+
+        assert all(isinstance(x, RawResponse) for x in pages)
+        assert [json.loads(x.data) for x in pages] == [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+        assert self.requestor.requested_pages == [1, 2]
+
+    def test_paginate(self):
+        with pytest.raises(ValueError):
+            list(self.moco.paginate("unit_getlist", raw=True))
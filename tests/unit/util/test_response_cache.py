@@ -0,0 +1,206 @@
+from moco_wrapper import moco
+from moco_wrapper.util.cache import ResponseCache
+from moco_wrapper.util.requestor.base import BaseRequestor
+from moco_wrapper.util.response import ObjectResponse, ListResponse, NotModifiedResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class MockClock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingRequestor(BaseRequestor):
+    """
+    Requestor that answers every request with an empty json response and records the requests
+    """
+
+    def __init__(self):
+        self.requests = []
+
+    def request(self, method, path, params=None, data=None, **kwargs):
+        self.requests.append((method, path))
+
+        if path.endswith("/units"):
+            return ListResponse(MockHttpResponse([{"id": 1}], 200))
+
+        return ObjectResponse(MockHttpResponse({"id": 1}, 200))
+
+
+class ConditionalRequestor(BaseRequestor):
+    """
+    Requestor that answers conditional requests with 304 as long as the etag did not change
+    """
+
+    def __init__(self):
+        self.etag = '"v1"'
+        self.requests = []
+
+    def request(self, method, path, params=None, data=None, headers=None, **kwargs):
+        self.requests.append(headers)
+
+        if headers.get("If-None-Match") == self.etag:
+            response = MockHttpResponse(None, 304)
+        else:
+            response = MockHttpResponse({"id": 1}, 200, headers={"Content-Type": "application/json", "ETag": self.etag})
+            response.text = '{"id": 1}'
+            response.content = response.text.encode("utf-8")
+
+        return self._convert_response(response)
+
+
+class TestResponseCache(object):
+    def setup(self):
+        self.clock = MockClock()
+        self.requestor = CountingRequestor()
+        self.cache = ResponseCache(ttl={"unit_getlist": 60, "unit_get": 60}, clock=self.clock)
+
+        self.moco = moco.Moco(
+            auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"},
+            requestor=self.requestor,
+            cache=self.cache
+        )
+
+    def test_cached(self):
+        first = self.moco.Unit.getlist()
+        second = self.moco.Unit.getlist()
+
+        assert first is second
+        assert len(self.requestor.requests) == 1
+
+    def test_expired(self):
+        self.moco.Unit.getlist()
+        self.clock.now = 61
+        self.moco.Unit.getlist()
+
+        assert len(self.requestor.requests) == 2
+
+    def test_key_contains_params(self):
+        self.moco.Unit.get(1)
+        self.moco.Unit.get(2)
+        self.moco.Unit.get(1)
+
+        assert len(self.requestor.requests) == 2
+
+    def test_key_contains_impersonation(self):
+        self.moco.Unit.getlist()
+        self.moco.impersonate(5)
+        self.moco.Unit.getlist()
+
+        assert len(self.requestor.requests) == 2
+
+    def test_endpoint_without_ttl_not_cached(self):
+        self.moco.User.getlist()
+        self.moco.User.getlist()
+
+        assert len(self.requestor.requests) == 2
+
+    def test_default_ttl(self):
+        self.cache.default_ttl = 60
+
+        self.moco.User.getlist()
+        self.moco.User.getlist()
+
+        assert len(self.requestor.requests) == 1
+
+    def test_mutation_invalidates_related(self):
+        self.moco.Unit.getlist()
+        self.moco.Unit.get(1)
+
+        # users are not related to units
+        self.moco.User.delete(1)
+        assert len(self.cache) == 2
+
+        self.cache.ttl["user_getlist"] = 60
+        self.moco.User.getlist()
+        assert len(self.cache) == 3
+
+        self.moco.User.update(1, firstname="Jane")
+        assert len(self.cache) == 2
+
+        self.moco.Unit.getlist()
+        assert len(self.requestor.requests) == 5
+
+    def test_lru_eviction(self):
+        self.cache.maxsize = 2
+
+        self.moco.Unit.get(1)
+        self.moco.Unit.get(2)
+        self.moco.Unit.get(1)
+        self.moco.Unit.get(3)  # evicts unit 2
+
+        assert len(self.cache) == 2
+
+        self.moco.Unit.get(1)
+        assert len(self.requestor.requests) == 3
+
+        self.moco.Unit.get(2)
+        assert len(self.requestor.requests) == 4
+
+    def test_related(self):
+        assert ResponseCache._related(("users", ), ("users", "presences"))
+        assert ResponseCache._related(("projects", "tasks"), ("projects", ))
+        assert not ResponseCache._related(("account", "hourly_rates"), ("account", "internal_hourly_rates"))
+        assert not ResponseCache._related(("units", ), ("users", ))
+
+
+class TestConditionalRequests(object):
+    def setup(self):
+        self.clock = MockClock()
+        self.requestor = ConditionalRequestor()
+        self.cache = ResponseCache(ttl={"unit_get": 0}, revalidate=True, clock=self.clock)
+
+        self.moco = moco.Moco(
+            auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"},
+            requestor=self.requestor,
+            cache=self.cache
+        )
+
+    def test_not_modified_response(self):
+        assert isinstance(self.requestor._convert_response(MockHttpResponse(None, 304)), NotModifiedResponse)
+
+    def test_not_modified(self):
+        first = self.moco.Unit.get(1)
+        second = self.moco.Unit.get(1)
+
+        assert "If-None-Match" not in self.requestor.requests[0]
+        assert self.requestor.requests[1]["If-None-Match"] == '"v1"'
+        assert second is first
+
+    def test_modified(self):
+        first = self.moco.Unit.get(1)
+        self.requestor.etag = '"v2"'
+        second = self.moco.Unit.get(1)
+
+        assert second is not first
+        assert isinstance(second, ObjectResponse)
+
+        third = self.moco.Unit.get(1)
+        assert third is second
+        assert self.requestor.requests[2]["If-None-Match"] == '"v2"'
+
+    def test_fresh_response_not_revalidated(self):
+        self.cache.ttl["unit_get"] = 60
+
+        self.moco.Unit.get(1)
+        self.moco.Unit.get(1)
+        assert len(self.requestor.requests) == 1
+
+        self.clock.now = 61
+        self.moco.Unit.get(1)
+        assert len(self.requestor.requests) == 2
+        assert self.requestor.requests[1]["If-None-Match"] == '"v1"'
+
+    def test_without_revalidate(self):
+        self.cache.revalidate = False
+
+        self.moco.Unit.get(1)
+        self.moco.Unit.get(1)
+
+        assert len(self.requestor.requests) == 2
+        assert "If-None-Match" not in self.requestor.requests[1]
+        assert len(self.cache) == 0
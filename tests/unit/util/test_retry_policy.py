@@ -0,0 +1,161 @@
+import email.utils
+import time
+
+import pytest
+import requests
+
+from moco_wrapper.util.requestor import DefaultRequestor, RetryPolicy
+from moco_wrapper.util.response import ErrorResponse, ObjectResponse
+
+from ..mocks.http import MockHttpResponse
+
+
+class MockSession(object):
+    """
+    Session returning the given responses (or raising the given exceptions) one after another
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, path, **kwargs):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+    post = put = delete = patch = get
+
+
+class TestRetryPolicy(object):
+    def setup(self):
+        self.policy = RetryPolicy(max_attempts=3, backoff_ms=100, backoff_factor=2, jitter=0)
+
+    def test_rate_limit_is_retried(self):
+        response = MockHttpResponse(None, 429)
+
+        assert self.policy.retry_delay("POST", 1, response=response) == pytest.approx(0.1)
+        assert self.policy.retry_delay("POST", 2, response=response) == pytest.approx(0.2)
+
+    def test_max_attempts(self):
+        response = MockHttpResponse(None, 429)
+
+        assert self.policy.retry_delay("GET", 3, response=response) is None
+
+    def test_max_backoff(self):
+        policy = RetryPolicy(max_attempts=20, backoff_ms=100, max_backoff_ms=500, jitter=0)
+        response = MockHttpResponse(None, 429)
+
+        assert policy.retry_delay("GET", 10, response=response) == pytest.approx(0.5)
+
+    def test_jitter(self):
+        policy = RetryPolicy(backoff_ms=1000, jitter=0.5)
+
+        for _ in range(20):
+            assert 0.5 <= policy.backoff(1) <= 1.0
+
+    def test_client_errors_are_not_retried(self):
+        for status_code in [400, 401, 403, 404, 422]:
+            assert self.policy.retry_delay("GET", 1, response=MockHttpResponse(None, status_code)) is None
+
+    def test_server_errors_only_if_enabled(self):
+        response = MockHttpResponse(None, 503)
+        policy = RetryPolicy(retry_server_errors=True, jitter=0)
+
+        assert self.policy.retry_delay("GET", 1, response=response) is None
+        assert policy.retry_delay("GET", 1, response=response) is not None
+
+    def test_server_errors_only_for_idempotent_methods(self):
+        response = MockHttpResponse(None, 500)
+        policy = RetryPolicy(retry_server_errors=True)
+
+        assert policy.retry_delay("POST", 1, response=response) is None
+        assert policy.retry_delay("PATCH", 1, response=response) is None
+
+    def test_connection_errors(self):
+        error = requests.exceptions.ConnectionError()
+        policy = RetryPolicy(retry_connection_errors=True)
+
+        assert self.policy.retry_delay("GET", 1, connection_error=error) is None
+        assert policy.retry_delay("GET", 1, connection_error=error) is not None
+        assert policy.retry_delay("POST", 1, connection_error=error) is None
+
+    def test_retry_after_seconds(self):
+        response = MockHttpResponse(None, 429, headers={"Retry-After": "7"})
+
+        assert self.policy.retry_delay("GET", 1, response=response) == 7
+
+    def test_retry_after_date(self):
+        retry_at = email.utils.formatdate(time.time() + 30, usegmt=True)
+        response = MockHttpResponse(None, 429, headers={"Retry-After": retry_at})
+
+        assert 25 < self.policy.retry_delay("GET", 1, response=response) <= 30
+
+    def test_rate_limit_reset(self):
+        response = MockHttpResponse(None, 429, headers={"RateLimit-Reset": "3"})
+
+        assert self.policy.retry_delay("GET", 1, response=response) == 3
+
+    def test_invalid_max_attempts(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+
+class TestDefaultRequestorRetry(object):
+
+    def create_requestor(self, responses, **policy_kwargs):
+        policy = RetryPolicy(backoff_ms=0, jitter=0, **policy_kwargs)
+        requestor = DefaultRequestor(retry_policy=policy)
+        requestor._session = MockSession(responses)
+
+        return requestor
+
+    def rate_limited(self):
+        response = MockHttpResponse(None, 429)
+        response.text = "Too many requests"
+        response.content = response.text.encode("utf-8")
+
+        return response
+
+    def success(self):
+        response = MockHttpResponse({"id": 1}, 200, headers={"Content-Type": "application/json"})
+        response.text = '{"id": 1}'
+        response.content = response.text.encode("utf-8")
+
+        return response
+
+    def test_retries_until_success(self):
+        requestor = self.create_requestor([self.rate_limited(), self.rate_limited(), self.success()])
+
+        response = requestor.get("https://test.mocoapp.com/api/v1/units/1")
+
+        assert isinstance(response, ObjectResponse)
+        assert requestor.session.calls == 3
+
+    def test_gives_up_after_max_attempts(self):
+        requestor = self.create_requestor([self.rate_limited() for _ in range(5)], max_attempts=3)
+
+        response = requestor.get("https://test.mocoapp.com/api/v1/units/1")
+
+        assert isinstance(response, ErrorResponse)
+        assert requestor.session.calls == 3
+
+    def test_connection_error_is_raised_without_retry(self):
+        requestor = self.create_requestor([requests.exceptions.ConnectionError(), self.success()])
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            requestor.get("https://test.mocoapp.com/api/v1/units/1")
+
+    def test_connection_error_retry(self):
+        requestor = self.create_requestor(
+            [requests.exceptions.ConnectionError(), self.success()],
+            retry_connection_errors=True
+        )
+
+        response = requestor.get("https://test.mocoapp.com/api/v1/units/1")
+
+        assert isinstance(response, ObjectResponse)
+        assert requestor.session.calls == 2
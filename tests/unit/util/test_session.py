@@ -0,0 +1,69 @@
+import socket
+
+from moco_wrapper.util.requestor import DefaultRequestor, NoRetryRequestor, create_session
+from moco_wrapper.util.requestor.session import PoolAdapter
+
+from ..mocks.http import MockHttpResponse
+
+
+class CapturingSession(object):
+    def __init__(self):
+        self.kwargs = None
+
+    def get(self, path, **kwargs):
+        self.kwargs = kwargs
+
+        response = MockHttpResponse({"id": 1}, 200, headers={"Content-Type": "application/json"})
+        response.text = '{"id": 1}'
+        response.content = response.text.encode("utf-8")
+        return response
+
+
+class TestSession(object):
+
+    def test_pool_settings(self):
+        session = create_session(pool_connections=2, pool_maxsize=25, pool_block=True)
+        adapter = session.get_adapter("https://test.mocoapp.com/api/v1")
+
+        assert isinstance(adapter, PoolAdapter)
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 25
+        assert adapter._pool_block is True
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 25
+
+    def test_keep_alive(self):
+        session = create_session()
+        adapter = session.get_adapter("https://test.mocoapp.com/api/v1")
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    def test_keep_alive_disabled(self):
+        session = create_session(keep_alive=False)
+        adapter = session.get_adapter("https://test.mocoapp.com/api/v1")
+
+        assert "socket_options" not in adapter.poolmanager.connection_pool_kw
+
+    def test_requestors_share_session(self):
+        session = create_session()
+
+        first = DefaultRequestor(session=session)
+        second = NoRetryRequestor(session=session)
+
+        assert first.session is session
+        assert second.session is session
+
+    def test_requestor_pool_settings(self):
+        requestor = DefaultRequestor(pool_maxsize=40)
+        adapter = requestor.session.get_adapter("https://test.mocoapp.com/api/v1")
+
+        assert adapter._pool_maxsize == 40
+
+    def test_timeout(self):
+        session = CapturingSession()
+        requestor = NoRetryRequestor(session=session, timeout=(3.05, 27))
+
+        requestor.get("https://test.mocoapp.com/api/v1/units/1")
+        assert session.kwargs["timeout"] == (3.05, 27)
+
+        requestor.get("https://test.mocoapp.com/api/v1/units/1", timeout=5)
+        assert session.kwargs["timeout"] == 5
@@ -0,0 +1,172 @@
+import json
+import threading
+
+import pytest
+
+from moco_wrapper import moco
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.util.mirror import SqliteMirror
+from moco_wrapper.util.requestor.base import BaseRequestor
+
+from ..mocks.http import MockHttpResponse
+
+
+def project(project_id, updated_at, active=True, leader_id=1):
+    return {
+        "id": project_id,
+        "name": "Project {}".format(project_id),
+        "active": active,
+        "leader": {"id": leader_id, "firstname": "Jane"},
+        "updated_at": updated_at
+    }
+
+
+class MockChangesRequestor(BaseRequestor):
+    """
+    Requestor serving the items of a listing as raw pages of two items, filtered by the updated_from and leader_id
+    parameters
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.requested_params = []
+
+    def request(self, method, path, params=None, data=None, raw=False, **kwargs):
+        params = params or {}
+        self.requested_params.append(dict(params))
+
+        items = [x for x in self.items if x["updated_at"][:10] >= params.get("updated_from", "")]
+        if "leader_id" in params:
+            items = [x for x in items if x["leader"]["id"] == params["leader_id"]]
+        page = params.get("page", 1)
+        last_page = max(1, (len(items) + 1) // 2)
+
+        headers = {"X-Page": str(page), "X-Per-Page": "2", "X-Total": str(len(items))}
+        if page < last_page:
+            headers["Link"] = '<{0}?page={1}>; rel="next", <{0}?page={2}>; rel="last"'.format(path, page + 1, last_page)
+
+        response = MockHttpResponse(None, 200, headers)
+        response.content = json.dumps(items[(page - 1) * 2:page * 2]).encode("utf-8")
+
+        return self._convert_response(response, raw=raw)
+
+
+class TestSqliteMirror(object):
+    def setup(self):
+        self.requestor = MockChangesRequestor([
+            project(1, "2020-01-01T10:00:00Z", leader_id=1),
+            project(2, "2020-01-02T10:00:00Z", leader_id=2),
+            project(3, "2020-01-03T10:00:00Z", active=False, leader_id=1),
+        ])
+        self.moco = moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=self.requestor
+        )
+        self.mirror = SqliteMirror(self.moco, entities=["projects"])
+
+    def teardown(self):
+        self.mirror.close()
+
+    def test_full_sync(self):
+        assert self.mirror.sync() == {"projects": 3}
+        assert self.mirror.count("projects") == 3
+        assert self.mirror.watermark("projects") == "2020-01-03T10:00:00Z"
+        assert self.mirror.synced_at("projects") is not None
+        assert "updated_from" not in self.requestor.requested_params[0]
+
+    def test_delta_sync(self):
+        self.mirror.sync()
+        self.requestor.requested_params = []
+
+        self.requestor.items[0] = project(1, "2020-01-04T08:00:00Z", active=False)
+        self.requestor.items.append(project(4, "2020-01-04T09:00:00Z"))
+
+        assert self.mirror.sync() == {"projects": 3}  # changed since the watermark day
+        assert self.requestor.requested_params[0]["updated_from"] == "2020-01-03"
+        assert self.mirror.count("projects") == 4
+        assert self.mirror.get("projects", 1).active is False
+        assert self.mirror.watermark("projects") == "2020-01-04T09:00:00Z"
+
+    def test_full_sync_removes_deleted(self):
+        self.mirror.sync()
+        del self.requestor.items[1]
+
+        self.mirror.sync()
+        assert self.mirror.count("projects") == 3
+
+        self.mirror.sync(full=True)
+        assert self.mirror.count("projects") == 2
+        assert self.mirror.get("projects", 2) is None
+
+    def test_full_sync_with_params_keeps_items(self):
+        self.mirror.sync()
+
+        self.mirror.params = {"projects": {"leader_id": 1}}
+        self.mirror.sync(full=True)
+
+        # items that do not match the parameters might still exist
+        assert self.mirror.count("projects") == 3
+
+    def test_changed_params_reload(self):
+        self.mirror.params = {"projects": {"leader_id": 2}}
+        self.mirror.sync()
+        assert self.mirror.count("projects") == 1
+
+        self.requestor.requested_params = []
+        self.mirror.params = {"projects": {"leader_id": 1}}
+
+        # the items of leader 1 are older than the watermark, they are loaded nevertheless
+        assert self.mirror.sync() == {"projects": 2}
+        assert "updated_from" not in self.requestor.requested_params[0]
+        assert self.mirror.count("projects") == 3
+
+        self.requestor.requested_params = []
+        self.mirror.sync()
+        assert self.requestor.requested_params[0]["updated_from"] == "2020-01-03"
+
+    def test_readable_while_fetching(self):
+        self.mirror.sync()
+        counts = []
+
+        def read_from_other_thread():
+            reader = threading.Thread(target=lambda: counts.append(self.mirror.count("projects")))
+            reader.start()
+            reader.join(timeout=5)
+
+        request = self.requestor.request
+
+        def request_and_read(*args, **kwargs):
+            read_from_other_thread()
+            return request(*args, **kwargs)
+
+        self.requestor.request = request_and_read
+        self.mirror.sync(full=True)
+
+        assert counts == [3, 3]
+
+    def test_query(self):
+        self.mirror.sync()
+
+        projects = self.mirror.query("projects", where={"leader.id": 1}, order_by="-updated_at")
+
+        assert all(isinstance(x, om.Project) for x in projects)
+        assert [x.id for x in projects] == [3, 1]
+        assert [x["id"] for x in self.mirror.query("projects", where={"active": True}, raw=True)] == [1, 2]
+        assert [x["id"] for x in self.mirror.query("projects", where={"id": [2, 3]}, limit=1, raw=True)] == [2]
+
+    def test_unknown_entity(self):
+        with pytest.raises(ValueError):
+            self.mirror.query("projects; DROP TABLE projects")
+
+    def test_persistent(self, tmpdir):
+        path = str(tmpdir.join("mirror.sqlite"))
+
+        with SqliteMirror(self.moco, path, entities=["projects"]) as mirror:
+            mirror.sync()
+
+        with SqliteMirror(self.moco, path, entities=["projects"]) as mirror:
+            assert mirror.count("projects") == 3
+            assert mirror.watermark("projects") == "2020-01-03T10:00:00Z"
@@ -0,0 +1,170 @@
+import json
+
+import pytest
+
+from moco_wrapper import moco
+from moco_wrapper.models import objector_models as om
+from moco_wrapper.util.requestor.base import BaseRequestor
+from moco_wrapper.util.response import StreamedListResponse, ErrorResponse, ObjectResponse, EmptyResponse
+from moco_wrapper.util.response.decoder import iter_json_array, starts_json_array
+
+from ..mocks.http import MockHttpResponse
+
+
+def chunked(body, size):
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+class StreamingHttpResponse(MockHttpResponse):
+    def __init__(self, json_data, status_code=200, headers=None):
+        super(StreamingHttpResponse, self).__init__(json_data, status_code, headers=headers)
+
+        self.body = json.dumps(json_data, ensure_ascii=False).encode("utf-8")
+        self.text = self.body.decode("utf-8")
+        self.closed = False
+        self.chunk_sizes = []
+
+    def iter_content(self, chunk_size):
+        self.chunk_sizes.append(chunk_size)
+        return iter(chunked(self.body, 3))
+
+    def close(self):
+        self.closed = True
+
+
+class StreamingRequestor(BaseRequestor):
+    def __init__(self, json_data, status_code=200):
+        self.json_data = json_data
+        self.status_code = status_code
+        self.requests = []
+
+    def request(self, method, path, params=None, data=None, stream=False, **kwargs):
+        self.requests.append(stream)
+        return self._convert_response(StreamingHttpResponse(self.json_data, self.status_code), stream=stream)
+
+
+class TestIterJsonArray(object):
+    def test_chunks(self):
+        items = [{"id": x, "name": "Überstunden €", "hours": x * 1.5, "tags": [], "user": None} for x in range(50)]
+        body = json.dumps(items, ensure_ascii=False).encode("utf-8")
+
+        for size in (1, 2, 5, 64, len(body)):
+            assert list(iter_json_array(chunked(body, size))) == items
+
+    def test_scalars(self):
+        assert list(iter_json_array([b" [ 12", b"34 , \"a\" ,", b"null,[1, 2]] "])) == [1234, "a", None, [1, 2]]
+
+    def test_empty(self):
+        assert list(iter_json_array([b"[", b"  ]"])) == []
+
+    def test_lazy(self):
+        read = []
+
+        def chunks():
+            yield b'[{"id": 1}, '
+            read.append(2)
+            yield b'{"id": 2}]'
+
+        items = iter_json_array(chunks())
+
+        assert next(items) == {"id": 1}
+        assert read == []  # yielded before the rest of the body was read
+        assert list(items) == [{"id": 2}]
+
+    def test_incomplete(self):
+        items = iter_json_array([b'[{"id": 1}, {"id": 2}'])
+
+        assert next(items) == {"id": 1}
+        assert next(items) == {"id": 2}
+        with pytest.raises(ValueError):
+            next(items)  # closing bracket is missing
+
+    @pytest.mark.parametrize("body", [b'{"id": 1}', b"[1,]", b"[1 2]", b"[,1]", b"[1", b""])
+    def test_invalid(self, body):
+        with pytest.raises(ValueError):
+            list(iter_json_array([body]))
+
+
+class TestStreamedListResponse(object):
+    def test_convert_response(self):
+        response = StreamingHttpResponse([{"id": 1}, {"id": 2}], headers={"X-Page": "1", "X-Total": "2"})
+
+        result = BaseRequestor()._convert_response(response, stream=True)
+
+        assert isinstance(result, StreamedListResponse)
+        assert result.is_last
+        assert list(result.items) == [{"id": 1}, {"id": 2}]
+        assert response.chunk_sizes == [StreamedListResponse.CHUNK_SIZE]
+        assert response.closed
+
+    def test_iterate_once(self):
+        result = StreamedListResponse(StreamingHttpResponse([1]))
+
+        assert list(result) == [1]
+        with pytest.raises(ValueError):
+            list(result)
+
+    def test_map(self):
+        result = StreamedListResponse(StreamingHttpResponse([1, 2]))
+        result.map(lambda x: x * 10)
+
+        assert list(result) == [10, 20]
+
+    def test_error(self):
+        response = StreamingHttpResponse({"message": "Not found"}, 404)
+
+        assert isinstance(BaseRequestor()._convert_response(response, stream=True), ErrorResponse)
+
+    def test_object_body(self):
+        response = StreamingHttpResponse({"id": 1, "tags": [1, 2]})
+
+        result = BaseRequestor()._convert_response(response, stream=True)
+
+        assert isinstance(result, ObjectResponse)
+        assert result.data == {"id": 1, "tags": [1, 2]}
+
+    def test_empty_body(self):
+        response = StreamingHttpResponse(None)
+        response.body = b"  "
+
+        assert isinstance(BaseRequestor()._convert_response(response, stream=True), EmptyResponse)
+
+    def test_starts_json_array(self):
+        is_list, chunks = starts_json_array(iter([b"  ", b"\n [1", b", 2]"]))
+
+        assert is_list
+        assert list(chunks) == [b"  ", b"\n [1", b", 2]"]
+
+        is_list, chunks = starts_json_array(iter([b" ", b"{}"]))
+
+        assert not is_list
+        assert b"".join(chunks) == b" {}"
+
+
+class TestStreamedMoco(object):
+    def create_moco(self, json_data):
+        self.requestor = StreamingRequestor(json_data)
+
+        return moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=self.requestor
+        )
+
+    def test_get(self):
+        m = self.create_moco([{"id": 1, "hours": 2, "user": {"id": 5}}, {"id": 2, "hours": 3, "user": {"id": 5}}])
+
+        result = m.get("invoice_timesheet_activities", ep_params={"id": 1}, stream=True, identity_map=True)
+        activities = list(result)
+
+        assert self.requestor.requests == [True]
+        assert all(isinstance(x, om.Activity) for x in activities)
+        assert [x.hours for x in activities] == [2, 3]
+        assert activities[0].user is activities[1].user
+
+    def test_paginate(self):
+        m = self.create_moco([{"id": 1}, {"id": 2}])
+
+        assert [x.id for x in m.paginate("activity_getlist", stream=True)] == [1, 2]
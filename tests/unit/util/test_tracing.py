@@ -0,0 +1,146 @@
+import contextlib
+
+import pytest
+import requests
+
+from moco_wrapper import moco
+from moco_wrapper.util.objector import RawObjector
+from moco_wrapper.util.requestor import DefaultRequestor, NoRetryRequestor, RawRequestor, RetryPolicy
+from moco_wrapper.util.tracing import InMemoryTracer, NoopTracer, OpenTelemetryTracer
+from moco_wrapper.util.tracing import tracer as tracer_module
+
+from ..mocks.http import MockHttpResponse
+
+
+class MockSession(object):
+    """
+    Session returning the given responses one after another (exceptions are raised)
+    """
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def get(self, path, **kwargs):
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+
+def rate_limited():
+    response = MockHttpResponse(None, 429, headers={"Retry-After": "0"})
+    response.text = "Too many requests"
+
+    return response
+
+
+def success():
+    body = '{"id": 1, "name": "Unit"}'
+
+    response = MockHttpResponse(None, 200, headers={"Content-Type": "application/json"})
+    response.content = body.encode("utf-8")
+    response.text = body
+
+    return response
+
+
+class TestTracing(object):
+    def setup(self):
+        self.session = MockSession([])
+        self.tracer = InMemoryTracer()
+        self.moco = moco.Moco(
+            auth={
+                "api_key": "<TOKEN>",
+                "domain": "<DOMAIN>"
+            },
+            requestor=DefaultRequestor(session=self.session, retry_policy=RetryPolicy(backoff_ms=0, jitter=0)),
+            tracer=self.tracer
+        )
+
+    def test_spans(self):
+        self.session.responses = [rate_limited(), success()]
+        self.moco.Unit.get(1)
+
+        assert [x.name for x in self.tracer.spans] == [
+            "moco.send", "moco.decode", "moco.retry_wait", "moco.send", "moco.decode", "moco.objectify", "unit_get"
+        ]
+
+        root = self.tracer.find("unit_get")[0]
+        assert root.parent is None
+        assert root.attributes == {"http.method": "GET", "moco.endpoint": "unit_get"}
+        assert all(x.parent is root for x in self.tracer.spans if x is not root)
+
+        first, second = self.tracer.find("moco.send")
+        assert first.attributes["moco.attempt"] == 1
+        assert first.attributes["http.status_code"] == 429
+        assert second.attributes["http.status_code"] == 200
+        assert all(x.duration >= 0 for x in self.tracer.spans)
+
+    def test_exception(self):
+        self.session.responses = [requests.exceptions.ConnectionError()]
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            self.moco.Unit.get(1)
+
+        send, root = self.tracer.spans
+        assert not send.ok
+        assert not root.ok
+        assert root.name == "unit_get"
+
+    def test_no_retry_requestor(self):
+        self.moco._requestor = NoRetryRequestor(session=self.session)
+        self.session.responses = [success()]
+
+        self.moco.Unit.get(1)
+
+        assert [x.name for x in self.tracer.spans] == ["moco.send", "moco.decode", "moco.objectify", "unit_get"]
+
+    def test_clear(self):
+        self.session.responses = [success()]
+        self.moco.Unit.get(1)
+
+        self.tracer.clear()
+        assert self.tracer.spans == []
+
+    def test_noop_tracer(self):
+        m = moco.Moco(
+            auth={"api_key": "<TOKEN>", "domain": "<DOMAIN>"},
+            objector=RawObjector(),
+            requestor=RawRequestor()
+        )
+
+        result = m.get("/units/1")
+
+        assert isinstance(m.tracer, NoopTracer)
+        assert "tracer" not in dict(result["args"])
+
+    def test_thread_local_var(self):
+        # used instead of contextvars before python 3.7
+        var = tracer_module._ThreadLocalVar("span", default=None)
+
+        token = var.set("outer")
+        inner_token = var.set("inner")
+        assert var.get() == "inner"
+
+        var.reset(inner_token)
+        assert var.get() == "outer"
+
+        var.reset(token)
+        assert var.get() is None
+
+    def test_opentelemetry_tracer(self):
+        started = []
+
+        class MockOpenTelemetryTracer(object):
+            @contextlib.contextmanager
+            def start_as_current_span(self, name, attributes=None):
+                started.append(name)
+                yield InMemoryTracer().span(name, attributes)
+
+        self.moco.tracer = OpenTelemetryTracer(tracer=MockOpenTelemetryTracer())
+        self.session.responses = [success()]
+
+        self.moco.Unit.get(1)
+
+        assert started == ["unit_get", "moco.send", "moco.decode", "moco.objectify"]